@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .endpoints import voice, auth, health, metrics, websocket
+from .endpoints import voice, auth, health, metrics, tts, voices, websocket
 from fastapi.openapi.utils import get_openapi
 from ...config import settings
 
@@ -8,6 +8,8 @@ api_router = APIRouter()
 # Include routers
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(voice.router, prefix="/voice", tags=["voice"])
+api_router.include_router(tts.router, prefix="/tts", tags=["tts"])
+api_router.include_router(voices.router, prefix="/voices", tags=["tts"])
 api_router.include_router(health.router, prefix="/health", tags=["health"])
 api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 # WebSocket routes are included directly in main.py
@@ -1,17 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Query
 from ....services.azure_ai import AzureAIService, ModelType
 from ....core.security import verify_api_key
+from ....dependencies import get_azure_ai_service
 from typing import Dict, Any, List
 from fastapi.responses import StreamingResponse
 import json
 
 router = APIRouter()
-azure_service = AzureAIService()
 
 @router.post("/analyze")
 async def analyze_text(
     text: str,
-    api_key: bool = Depends(verify_api_key)
+    api_key: bool = Depends(verify_api_key),
+    azure_service: AzureAIService = Depends(get_azure_ai_service)
 ) -> Dict[str, Any]:
     try:
         result = await azure_service.analyze_text(text)
@@ -22,7 +23,8 @@ async def analyze_text(
 @router.post("/speech-to-text")
 async def speech_to_text(
     audio: UploadFile = File(...),
-    api_key: bool = Depends(verify_api_key)
+    api_key: bool = Depends(verify_api_key),
+    azure_service: AzureAIService = Depends(get_azure_ai_service)
 ) -> Dict[str, Any]:
     try:
         audio_data = await audio.read()
@@ -37,7 +39,8 @@ async def complete_request(
     model: ModelType,
     tools: List[str] = Query(None),
     stream: bool = False,
-    api_key: bool = Depends(verify_api_key)
+    api_key: bool = Depends(verify_api_key),
+    azure_service: AzureAIService = Depends(get_azure_ai_service)
 ) -> Dict[str, Any]:
     try:
         result = await azure_service.process_request(
@@ -60,7 +63,8 @@ async def complete_request(
 async def analyze_image(
     prompt: str,
     image: UploadFile = File(...),
-    api_key: bool = Depends(verify_api_key)
+    api_key: bool = Depends(verify_api_key),
+    azure_service: AzureAIService = Depends(get_azure_ai_service)
 ) -> Dict[str, Any]:
     try:
         image_data = await image.read()
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, HTTPException, Query, Response
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from ....core.stats import get_stats_store, stats_summary
 
 router = APIRouter()
 
@@ -9,3 +10,19 @@ async def metrics():
         generate_latest(),
         media_type=CONTENT_TYPE_LATEST
     )
+
+@router.get("/stats")
+async def processing_stats():
+    """Per-stage latency aggregates for every processing component"""
+    return stats_summary()
+
+@router.get("/stats/{component}")
+async def component_stats(component: str, limit: int = Query(100, ge=1, le=1000)):
+    """Aggregates plus the most recent records for one component"""
+    if component not in stats_summary():
+        raise HTTPException(status_code=404, detail=f"No stats recorded for {component}")
+    store = get_stats_store(component)
+    return {
+        **store.summary(),
+        "records": store.recent(limit)
+    }
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+from ....core.auth import get_current_user
+from ....core.deadline import DeadlineExceeded, require_budget
+from ....config import settings
+from ....dependencies import get_tts_service
+from ....models.user import User
+from ....schemas.tts import SpeechRequest
+from ....services.tts_output import UnsupportedOutputFormat, negotiate_output
+from ....services.tts_service import TTSService
+from typing import BinaryIO, Mapping, Optional
+import anyio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+class OpenFileResponse(Response):
+    """Send a file that is already open, and close it afterwards.
+
+    Holding the descriptor keeps the audio readable even if the cache
+    evicts the file mid-response. Servers offering the ASGI
+    ``http.response.zerocopysend`` extension ``sendfile`` it straight from
+    the page cache; elsewhere it is read in chunks off the event loop, as
+    ``FileResponse`` does.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, file: BinaryIO, media_type: str, headers: Optional[Mapping[str, str]] = None):
+        self.file = file
+        self.status_code = 200
+        self.media_type = media_type
+        self.background = None
+        self.size = os.fstat(file.fileno()).st_size
+        self.init_headers(headers)
+        self.headers.setdefault("content-length", str(self.size))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({"type": "http.response.zerocopysend", "file": self.file, "count": self.size, "more_body": False})
+                return
+            while chunk := await anyio.to_thread.run_sync(self.file.read, self.chunk_size):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            self.file.close()
+
+@router.post("/speak")
+async def speak(
+    request: SpeechRequest,
+    accept: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    """Synthesize speech in the requested (or Accept-negotiated) format.
+    Cached audio is sent from disk as stored, zero-copy where the server
+    supports it."""
+    try:
+        output = negotiate_output(request.format, request.sample_rate, accept)
+    except UnsupportedOutputFormat as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    try:
+        require_budget("tts", settings.DEADLINE_TTS_MIN_MS / 1000)
+        audio = await tts_service.speak(request.text, request.voice_id, request.speed, output)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Speech synthesis failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    headers = {"Vary": "Accept"}
+    if audio.file is not None:
+        return OpenFileResponse(audio.file, audio.media_type, headers)
+    return StreamingResponse(audio.chunks, media_type=audio.media_type, headers=headers)
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, UploadFile, File, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, BackgroundTasks, HTTPException, Query
 from ....core.auth import get_current_user
+from ....dependencies import get_voice_service
 from ....models.user import User
 from ....services.voice import VoiceService
-from ....core.voice import VoiceProcessor
+from ....core.voice.processor import VoiceProcessor
 from ....core.cache import redis_client
+from ....core.deadline import DeadlineExceeded
 from ....core.metrics import track_time, voice_processing_duration_seconds
+from ....core.voice.profiles import PROFILES
+from ....schemas.voice import VoiceCommandResponse
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -16,18 +20,24 @@ router = APIRouter()
 async def process_voice_command(
     audio: UploadFile = File(...),
     background_tasks: BackgroundTasks = None,
-    current_user: User = Depends(get_current_user)
+    profile: Optional[str] = Query(None, description="Decode profile: default, command or dictation"),
+    current_user: User = Depends(get_current_user),
+    voice_service: VoiceService = Depends(get_voice_service)
 ) -> Dict[str, Any]:
     """Process voice command and return response"""
-    voice_service = VoiceService()
-    
+    if profile is not None and profile not in PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown decode profile: {profile}")
+
     try:
         result = await voice_service.process_voice_command(
             audio,
             current_user.id,
-            background_tasks
+            background_tasks,
+            profile=profile
         )
         return result
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Voice processing failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -35,11 +45,10 @@ async def process_voice_command(
 @router.post("/train")
 async def train_voice_profile(
     audio_samples: list[UploadFile] = File(...),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    voice_service: VoiceService = Depends(get_voice_service)
 ) -> Dict[str, Any]:
     """Train voice profile for user"""
-    voice_service = VoiceService()
-    
     try:
         result = await voice_service.train_voice_profile(
             audio_samples,
@@ -52,11 +61,10 @@ async def train_voice_profile(
 
 @router.get("/profile")
 async def get_voice_profile(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    voice_service: VoiceService = Depends(get_voice_service)
 ) -> Dict[str, Any]:
     """Get user's voice profile"""
-    voice_service = VoiceService()
-    
     try:
         profile = await voice_service.get_voice_profile(current_user.id)
         if not profile:
@@ -71,7 +79,8 @@ async def get_voice_profile(
 @router.get("/{command_id}", response_model=VoiceCommandResponse)
 async def get_command_status(
     command_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    voice_service: VoiceService = Depends(get_voice_service)
 ):
     """Get status of a voice command"""
     try:
@@ -81,7 +90,6 @@ async def get_command_status(
             return cached_result
 
         # Get from database if not in cache
-        voice_service = VoiceService()
         result = await voice_service.get_command_status(command_id, current_user.id)
         
         # Cache result if completed
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, Header, Query, Response
+from typing import Optional
+from ....core.auth import get_current_user
+from ....core.voice_registry import VoiceRegistry
+from ....dependencies import get_voice_registry
+from ....models.user import User
+from ....schemas.tts import VoicePage
+import hashlib
+import json
+
+router = APIRouter()
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison, so W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+@router.get("", response_model=VoicePage)
+async def list_voices(
+    response: Response,
+    language: Optional[str] = Query(None, description="Language code, e.g. en-US"),
+    gender: Optional[str] = None,
+    style: Optional[str] = None,
+    engine: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    voice_registry: VoiceRegistry = Depends(get_voice_registry)
+):
+    """List voices matching the filters, a page at a time.
+
+    The ETag changes only with the catalogue or the query, so clients can
+    revalidate their copy with If-None-Match and get a bodiless 304.
+    """
+    voices = voice_registry.list_voices(language, gender, style, engine)
+    query = [voice_registry.etag, language, gender, style, engine, offset, limit]
+    etag = '"' + hashlib.sha256(json.dumps(query).encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    next_offset = offset + limit if offset + limit < len(voices) else None
+    return VoicePage(
+        total=len(voices),
+        offset=offset,
+        limit=limit,
+        next_offset=next_offset,
+        voices=voices[offset:offset + limit]
+    )
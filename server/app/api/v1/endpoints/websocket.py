@@ -1,36 +1,94 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
-from ....core.auth import get_current_user_ws
+from ....core.security import get_current_user_ws
 from ....core.websocket import ConnectionManager
-from ....core.command import CommandProcessor
-from ....schemas.command import CommandResponse
+from ....core.command.processor import CommandProcessor
+from ....core.deadline import DeadlineExceeded, deadline_scope, parse_budget
+from ....dependencies import get_command_processor
+from ....core.voice.streaming import StreamingTranscriber, parse_sample_rate
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 manager = ConnectionManager()
-command_processor = CommandProcessor()
 
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
-    token: str = Depends(get_current_user_ws)
+    user: Optional[Dict[str, Any]] = Depends(get_current_user_ws),
+    command_processor: CommandProcessor = Depends(get_command_processor)
 ):
-    await manager.connect(websocket, token)
+    """Bidirectional command channel.
+
+    Text frames carry JSON commands, ``{"text": ..., "context": {...}}``,
+    optionally with a ``budget_ms`` latency budget. Binary frames carry
+    16-bit mono PCM for streaming speech-to-text;
+    ``{"type": "stream_start", "sample_rate": ...}`` configures the stream
+    (optionally with ``language`` and decode ``profile``) and
+    ``{"type": "stream_end"}`` forces a final transcript.
+    Transcripts are sent back as ``partial``/``final`` events.
+    """
+    if user is None:
+        return  # Authentication already closed the socket
+    user_id = user["sub"]
+    await manager.connect(websocket, user_id)
+
+    async def send_event(event: Dict[str, Any]):
+        await manager.send_personal_message(json.dumps(event), websocket)
+
+    stream: Optional[StreamingTranscriber] = None
     try:
         while True:
-            data = await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
             try:
-                command_data = json.loads(data)
-                response = await command_processor.process(
-                    command_data,
-                    token
-                )
+                if message.get("bytes") is not None:
+                    if stream is None:
+                        stream = StreamingTranscriber(on_event=send_event)
+                    await stream.push(message["bytes"])
+                    continue
+
+                command_data = json.loads(message["text"])
+                message_type = command_data.get("type")
+
+                if message_type == "stream_start":
+                    sample_rate = parse_sample_rate(command_data.get("sample_rate"))
+                    if stream is not None:
+                        await stream.close()
+                    stream = StreamingTranscriber(
+                        on_event=send_event,
+                        sample_rate=sample_rate,
+                        language=command_data.get("language"),
+                        profile=command_data.get("profile")
+                    )
+                    continue
+
+                if message_type == "stream_end":
+                    if stream is not None:
+                        await stream.end()
+                    continue
+
+                with deadline_scope(parse_budget(command_data.get("budget_ms"))):
+                    response = await command_processor.process_command(
+                        command_data["text"],
+                        user_id,
+                        command_data.get("context")
+                    )
                 await manager.send_personal_message(
                     json.dumps(response),
                     websocket
                 )
+            except DeadlineExceeded as e:
+                await manager.send_personal_message(
+                    json.dumps({
+                        "error": str(e),
+                        "status": "deadline_exceeded"
+                    }),
+                    websocket
+                )
             except Exception as e:
                 logger.error(f"Error processing command: {str(e)}")
                 await manager.send_personal_message(
@@ -42,3 +100,6 @@ async def websocket_endpoint(
                 )
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
+    finally:
+        if stream is not None:
+            await stream.close()
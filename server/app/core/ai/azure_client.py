@@ -3,6 +3,9 @@ import aiohttp
 import logging
 from ...config import settings
 from ..cache import redis_client
+from ..cancellation import check_cancelled
+from ..deadline import DeadlineExceeded, fits_budget, remaining_budget, require_budget
+import asyncio
 import json
 import time
 
@@ -31,7 +34,11 @@ class AzureAIClient:
         request_type: str,
         model: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Process request through Azure AI"""
+        """Process request through Azure AI.
+
+        Under a latency budget the HTTP call times out with the deadline,
+        and a budget below ``DEADLINE_AI_ESTIMATE_MS`` asks for a shorter answer.
+        """
         start_time = time.time()
         cache_key = f"ai_request:{hash(json.dumps(request_data))}"
 
@@ -41,6 +48,12 @@ class AzureAIClient:
             if cached:
                 return cached
 
+            check_cancelled()
+            require_budget("azure request")
+            remaining = remaining_budget()
+            timeout = aiohttp.ClientTimeout(total=remaining) if remaining is not None else None
+            max_tokens = 800 if fits_budget(settings.DEADLINE_AI_ESTIMATE_MS / 1000) else 200
+
             session = await self._get_session()
             async with session.post(
                 f"{self.endpoint}/completions",
@@ -57,8 +70,9 @@ class AzureAIClient:
                         }
                     ],
                     "temperature": 0.7,
-                    "max_tokens": 800
-                }
+                    "max_tokens": max_tokens
+                },
+                timeout=timeout
             ) as response:
                 response.raise_for_status()
                 result = await response.json()
@@ -76,6 +90,10 @@ class AzureAIClient:
 
                 return processed_result
 
+        except asyncio.TimeoutError:
+            if remaining_budget() is None:
+                raise
+            raise DeadlineExceeded("azure request did not finish within the latency budget")
         except Exception as e:
             logger.error(f"Azure AI request failed: {str(e)}")
             raise
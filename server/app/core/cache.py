@@ -7,6 +7,12 @@ import json
 
 logger = setup_logging()
 
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars and arrays that end up in results"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
 class RedisClient:
     def __init__(self):
         self._redis: Optional[Redis] = None
@@ -19,6 +25,11 @@ class RedisClient:
                 decode_responses=True
             )
 
+    @property
+    def client(self) -> Optional[Redis]:
+        """Underlying connection, for commands this wrapper does not cover"""
+        return self._redis
+
     async def close(self):
         if self._redis:
             await self._redis.close()
@@ -45,6 +56,32 @@ class RedisClient:
             logger.error(f"Redis set operation failed: {str(e)}")
             return False
 
+    async def get_json(self, key: str) -> Optional[Any]:
+        """Get a value stored with ``set_json``.
+
+        The connection decodes responses as UTF-8, which pickled values
+        from ``set`` do not survive; JSON does.
+        """
+        try:
+            data = await self._redis.get(key)
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.error(f"Redis get operation failed: {str(e)}")
+            return None
+
+    async def set_json(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[int] = None
+    ) -> bool:
+        try:
+            serialized = json.dumps(value, default=_json_default)
+            return await self._redis.set(key, serialized, ex=expire)
+        except Exception as e:
+            logger.error(f"Redis set operation failed: {str(e)}")
+            return False
+
     async def delete(self, key: str) -> bool:
         try:
             return bool(await self._redis.delete(key))
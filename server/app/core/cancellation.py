@@ -0,0 +1,166 @@
+import asyncio
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Type
+
+class OperationCancelled(Exception):
+    """Raised inside cancellable work once its token has been cancelled"""
+
+class CancellationToken:
+    """Thread-safe flag that long-running work checks cooperatively.
+
+    Cancelling a token also cancels every child created from it, so one
+    token per request can fan out to the executor jobs the request starts.
+    """
+
+    def __init__(self, parent: Optional["CancellationToken"] = None):
+        self.parent = parent
+        self._reason: Optional[str] = None
+        self._error: Type[OperationCancelled] = OperationCancelled
+        self._event = threading.Event()
+
+    def cancel(self, reason: str = "cancelled", error: Type[OperationCancelled] = OperationCancelled):
+        """Cancel; checks then raise ``error`` (a subclass tells callers why)"""
+        if not self._event.is_set():
+            self._reason = reason
+            self._error = error
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    @property
+    def reason(self) -> Optional[str]:
+        if self._event.is_set():
+            return self._reason
+        return self.parent.reason if self.parent is not None else None
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise self._error(self._reason)
+        if self.parent is not None:
+            self.parent.raise_if_cancelled()
+
+    def child(self) -> "CancellationToken":
+        return CancellationToken(self)
+
+_current: contextvars.ContextVar = contextvars.ContextVar("cancellation_token", default=None)
+_thread = threading.local()  # run_in_executor does not carry context variables over
+
+def current_token() -> Optional[CancellationToken]:
+    """Token of the running task, or of the executor job on this thread"""
+    return _current.get() or getattr(_thread, "token", None)
+
+def check_cancelled():
+    """Raise ``OperationCancelled`` if the current work has been cancelled"""
+    token = current_token()
+    if token is not None:
+        token.raise_if_cancelled()
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make ``token`` current for the enclosed code and the tasks it creates"""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+def _bound(job_token: CancellationToken, fn: Callable[..., Any], *args: Any) -> Any:
+    """Run ``fn`` with ``job_token`` as this thread's current token"""
+    previous = getattr(_thread, "token", None)
+    _thread.token = job_token
+    try:
+        job_token.raise_if_cancelled()
+        return fn(*args)
+    finally:
+        _thread.token = previous
+
+async def run_cancellable(
+    executor: Any,
+    fn: Callable[..., Any],
+    *args: Any,
+    token: Optional[CancellationToken] = None
+) -> Any:
+    """``run_in_executor`` whose job stops when the caller gives up.
+
+    The job runs with a child of ``token`` (default: the current token)
+    bound to its thread, where ``check_cancelled`` sees it. If the awaiting
+    task is cancelled, the child is cancelled too and this coroutine waits
+    for the job to reach its next check before re-raising, so resources
+    held around the call (a pooled model, say) are not handed out while
+    the thread still uses them.
+    """
+    job_token = CancellationToken(token or current_token())
+    future = asyncio.get_running_loop().run_in_executor(executor, _bound, job_token, fn, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        job_token.cancel("abandoned")
+        try:
+            await future
+        except Exception:
+            pass
+        raise
+
+_END = object()
+
+async def stream_cancellable(
+    executor: Any,
+    fn: Callable[..., Iterator[Any]],
+    *args: Any,
+    maxsize: int = 8,
+    token: Optional[CancellationToken] = None
+) -> AsyncIterator[Any]:
+    """Iterate the blocking iterator ``fn(*args)`` on ``executor``, yielding
+    each item as soon as the thread produces it.
+
+    At most ``maxsize`` items wait between the thread and the consumer; a
+    slow consumer pauses the thread instead of letting it buffer the whole
+    stream. The thread runs with a child of ``token`` like
+    ``run_cancellable``: when the consumer stops early (closes the
+    generator or is cancelled) the child is cancelled, the thread stops at
+    its next check or hand-off, and the generator waits for it to exit.
+    """
+    loop = asyncio.get_running_loop()
+    job_token = CancellationToken(token or current_token())
+    items: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(maxsize)
+
+    def produce():
+        iterator = fn(*args)
+        try:
+            for item in iterator:
+                slots.acquire()
+                job_token.raise_if_cancelled()
+                loop.call_soon_threadsafe(items.put_nowait, (item, None))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def run():
+        error = None
+        try:
+            _bound(job_token, produce)
+        except BaseException as e:
+            error = e
+        loop.call_soon_threadsafe(items.put_nowait, (_END, error))
+
+    future = loop.run_in_executor(executor, run)
+    try:
+        while True:
+            item, error = await items.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield item
+    finally:
+        if not future.done():
+            job_token.cancel("abandoned")
+            slots.release()  # Wake a thread waiting for room
+            await asyncio.shield(future)
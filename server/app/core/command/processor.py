@@ -1,19 +1,23 @@
 from typing import Dict, Any, Optional
 import logging
-from ...models import User, Template
+from ...models.user import User
+from ...models.models import Template
 from ..ai.azure_client import AzureAIClient
 from ..cache import redis_client
-from sqlalchemy.orm import Session
-from ...database import get_db
+from ..deadline import require_budget
+from ..stats import get_stats_store
+from ...config import settings
+from ...database import session_scope
 import json
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class CommandProcessor:
-    def __init__(self):
-        self.ai_client = AzureAIClient()
-        self.db = next(get_db())
+    def __init__(self, ai_client: Optional[AzureAIClient] = None):
+        self.ai_client = ai_client or AzureAIClient()
+        self.stats = get_stats_store("command")
 
     async def process_command(
         self,
@@ -21,7 +25,11 @@ class CommandProcessor:
         user_id: int,
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Process a command through the AI pipeline"""
+        """Process a command through the AI pipeline.
+
+        A cached answer is returned whatever the latency budget; otherwise
+        the request is dropped when the budget cannot cover the AI round trip.
+        """
         try:
             # Check command cache
             cache_key = f"command:{user_id}:{hash(text)}"
@@ -29,6 +37,9 @@ class CommandProcessor:
             if cached_result:
                 return cached_result
 
+            expected = self.stats.estimate("ai", settings.DEADLINE_QUANTILE)
+            require_budget("command processing", expected or settings.DEADLINE_AI_ESTIMATE_MS / 1000)
+
             # Get user context
             user_context = await self._get_user_context(user_id)
             
@@ -42,10 +53,12 @@ class CommandProcessor:
             }
 
             # Get AI response
+            stage_start = time.perf_counter()
             response = await self.ai_client.process_request(
                 request_data,
                 "command_processing"
             )
+            self.stats.observe("ai", time.perf_counter() - stage_start)
 
             # Extract actions and parameters
             actions = self._extract_actions(response)
@@ -76,15 +89,16 @@ class CommandProcessor:
         """Get user-specific context for command processing"""
         try:
             # Get user preferences and settings
-            user = self.db.query(User).filter(User.id == user_id).first()
-            if not user:
-                return {}
-
-            return {
-                "voice_preference": user.voice_preference.id if user.voice_preference else None,
-                "language": user.language if hasattr(user, 'language') else "en-US",
-                "timezone": user.timezone if hasattr(user, 'timezone') else "UTC",
-            }
+            with session_scope() as db:
+                user = db.query(User).filter(User.id == user_id).first()
+                if not user:
+                    return {}
+
+                return {
+                    "voice_preference": user.voice_preference.id if user.voice_preference else None,
+                    "language": user.language if hasattr(user, 'language') else "en-US",
+                    "timezone": user.timezone if hasattr(user, 'timezone') else "UTC",
+                }
 
         except Exception as e:
             logger.error(f"Failed to get user context: {str(e)}")
@@ -111,3 +125,11 @@ class CommandProcessor:
             all(field in action for field in required_fields) and
             action.get("type") in allowed_types
         )
+
+    async def warm_up(self):
+        """Open the AI client's HTTP session ahead of the first command"""
+        await self.ai_client._get_session()
+
+    async def close(self):
+        """Release the AI client's HTTP session"""
+        await self.ai_client.close()
@@ -0,0 +1,43 @@
+from ..config import settings
+from ..services.azure_ai import AzureAIService
+from ..services.tts_service import TTSService
+from ..services.voice import VoiceService
+from .command.processor import CommandProcessor
+from .logging import setup_logging
+from .voice.backends import get_transcriber
+from .voice.processor import VoiceProcessor
+from .voice_registry import load_voice_registry
+
+logger = setup_logging()
+
+class ServiceContainer:
+    """Application-wide services, built once per process in the lifespan.
+
+    Endpoints reach them through the ``get_*`` dependencies in
+    ``app.dependencies`` instead of constructing them per request, so the
+    voice catalogue is parsed once, HTTP sessions and inference clients
+    are reused, and the models are loaded before the first request.
+    """
+
+    def __init__(self):
+        self.voice_registry = load_voice_registry(settings.VOICE_CONFIG_PATH, settings.VOICE_SNAPSHOT_PATH)
+        self.tts_service = TTSService(voice_registry=self.voice_registry)
+        self.azure_ai_service = AzureAIService()
+        self.command_processor = CommandProcessor()
+        self.voice_service = VoiceService(
+            voice_processor=VoiceProcessor(),
+            command_processor=self.command_processor
+        )
+
+    async def warm_up(self):
+        """Load the speech models and open connections ahead of the first request"""
+        await get_transcriber().init()
+        await self.command_processor.warm_up()
+        logger.info("Service container warmed up")
+
+    async def shutdown(self):
+        """Release what ``warm_up`` and the constructors acquired, in reverse order"""
+        await self.command_processor.close()
+        self.azure_ai_service.close()
+        await get_transcriber().close()
+        logger.info("Service container shut down")
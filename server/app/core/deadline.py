@@ -0,0 +1,112 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Iterator, Optional, TypeVar
+
+from ..config import settings
+from .cancellation import CancellationToken, OperationCancelled, cancellation_scope, current_token
+
+BUDGET_HEADER = "X-Request-Budget-Ms"
+
+T = TypeVar("T")
+
+class DeadlineExceeded(OperationCancelled):
+    """Raised when the remaining latency budget cannot cover a stage"""
+
+class Deadline:
+    """Absolute (monotonic) deadline for one voice request"""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_budget(cls, budget_ms: float) -> "Deadline":
+        return cls(time.monotonic() + budget_ms / 1000)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, seconds: float) -> bool:
+        """Whether a stage expected to take ``seconds`` still fits"""
+        return self.remaining() >= seconds
+
+    def require(self, stage: str, seconds: Optional[float] = None):
+        """Abort ``stage`` unless at least ``seconds`` (default ``DEADLINE_MIN_STAGE_MS``) remain"""
+        needed = settings.DEADLINE_MIN_STAGE_MS / 1000 if seconds is None else seconds
+        if not self.allows(needed):
+            raise DeadlineExceeded(
+                f"{stage} needs {needed * 1000:.0f} ms but {self.remaining() * 1000:.0f} ms remain"
+            )
+
+_current: contextvars.ContextVar = contextvars.ContextVar("deadline", default=None)
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+def require_budget(stage: str, seconds: Optional[float] = None):
+    """``Deadline.require`` on the current deadline; a no-op without one"""
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.require(stage, seconds)
+
+def fits_budget(seconds: float) -> bool:
+    """Whether a stage expected to take ``seconds`` fits; True without a deadline"""
+    deadline = current_deadline()
+    return deadline is None or deadline.allows(seconds)
+
+def remaining_budget() -> Optional[float]:
+    deadline = current_deadline()
+    return deadline.remaining() if deadline is not None else None
+
+async def within_budget(awaitable: Awaitable[T], stage: str) -> T:
+    """Await ``awaitable``, giving up when the current deadline passes"""
+    remaining = remaining_budget()
+    if remaining is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(f"{stage} did not finish within the latency budget")
+
+def parse_budget(value: Any) -> Optional[Deadline]:
+    """Deadline for a budget in milliseconds, falling back to ``REQUEST_BUDGET_MS``"""
+    try:
+        budget_ms = float(value) if value not in (None, "") else float(settings.REQUEST_BUDGET_MS)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid latency budget: {value!r}")
+    return Deadline.from_budget(budget_ms) if budget_ms > 0 else None
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` current for the enclosed code and the tasks it creates.
+
+    The scope also installs a cancellation token that fires when the
+    deadline passes, so decodes and AI calls already running on executor
+    threads stop at their next check instead of finishing late.
+    """
+    if deadline is None:
+        yield None
+        return
+
+    token = CancellationToken(current_token())
+    timer = None
+    try:
+        loop = asyncio.get_running_loop()
+        timer = loop.call_later(deadline.remaining(), token.cancel, "deadline exceeded", DeadlineExceeded)
+    except RuntimeError:
+        pass  # No loop: checks still see the deadline, nothing fires early
+
+    reset = _current.set(deadline)
+    try:
+        with cancellation_scope(token):
+            yield deadline
+    finally:
+        _current.reset(reset)
+        if timer is not None:
+            timer.cancel()
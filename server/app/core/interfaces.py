@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, Any, Optional
+from typing import AsyncGenerator, Dict, Any, List, Optional
+import numpy as np
 
 class VoiceProcessorInterface(ABC):
     @abstractmethod
-    async def process_audio(self, audio_data: bytes) -> Dict[str, Any]:
+    async def process_audio(self, audio_data: bytes, user_id: Optional[Any] = None) -> Dict[str, Any]:
         pass
 
     @abstractmethod
@@ -22,7 +23,40 @@ class TTSInterface(ABC):
 
 class STTInterface(ABC):
     @abstractmethod
-    async def speech_to_text(self, audio_data: bytes) -> Dict[str, Any]:
+    async def speech_to_text(
+        self,
+        audio_data: bytes,
+        language: Optional[str] = None,
+        user_id: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        pass
+
+class STTBackend(ABC):
+    """Inference runtime behind the speech-to-text services.
+
+    ``transcribe`` takes 16 kHz mono float32 audio and returns a dict shaped
+    like Whisper's ``transcribe`` output (``text``, ``language`` and
+    ``segments`` carrying ``confidence`` and ``no_speech_prob``), decoded
+    with the named decode ``profile``.
+    """
+    name: str
+
+    @abstractmethod
+    async def init(self, model_names: Optional[List[str]] = None):
+        pass
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
         pass
 
 class AIProcessorInterface(ABC):
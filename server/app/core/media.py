@@ -0,0 +1,188 @@
+import asyncio
+import base64
+import logging
+import struct
+import subprocess
+from typing import AsyncIterator, List, Tuple, Union
+
+import numpy as np
+
+from .resampler import resample
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000  # Whisper expects 16kHz mono
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+PIPE_READ_CHUNK = 16 * 1024
+
+class AudioDecodeError(ValueError):
+    """Raised when audio bytes cannot be decoded"""
+
+class TranscodeError(RuntimeError):
+    """Raised when a streaming transcode fails"""
+
+def decode_audio(data: BytesLike, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode an in-memory audio clip to mono float32 samples in [-1, 1].
+
+    RIFF/WAV input is parsed straight out of the caller's buffer; anything
+    else is piped through ffmpeg over stdin/stdout. Nothing touches disk.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) == 0:
+        raise AudioDecodeError("Empty audio payload")
+
+    if bytes(view[:4]) != b"RIFF":
+        return _decode_ffmpeg(view, sample_rate)
+
+    audio, rate = _decode_wav(view)
+    if rate != sample_rate:
+        audio = resample(audio, rate, sample_rate)
+    return audio
+
+def transcode_stream(chunks: AsyncIterator[bytes], output_args: List[str]) -> AsyncIterator[bytes]:
+    """Re-encode an audio stream with ffmpeg as it arrives.
+
+    ``output_args`` select the codec and container; the input format is
+    probed from the stream itself.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0", *output_args, "pipe:1"]
+    return pipe_stream(cmd, chunks)
+
+async def pipe_stream(cmd: List[str], chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Stream ``chunks`` through ``cmd``'s stdin and yield its stdout.
+
+    Input is written as it arrives and output passed on as soon as the
+    process flushes it, so neither side is buffered whole; a slow reader
+    backs up into the pipe and pauses the input. Closing the stream kills
+    the process.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError:
+        raise TranscodeError(f"{cmd[0]} is required to transcode audio")
+
+    async def feed():
+        try:
+            async for chunk in chunks:
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        finally:
+            process.stdin.close()
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            chunk = await process.stdout.read(PIPE_READ_CHUNK)
+            if not chunk:
+                break
+            yield chunk
+
+        if await process.wait() != 0:
+            stderr = await process.stderr.read()
+            logger.error(f"{cmd[0]} transcode failed: {stderr.decode(errors='ignore')[-500:]}")
+            raise TranscodeError("Failed to transcode audio")
+        await feeder  # The input's own failure, if it ended early
+    finally:
+        feeder.cancel()
+        await asyncio.gather(feeder, return_exceptions=True)
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+def image_data_url(data: BytesLike, image_format: str = "jpeg") -> str:
+    """Encode image bytes as a data URL so they can be sent inline"""
+    encoded = base64.b64encode(memoryview(data)).decode("ascii")
+    return f"data:image/{image_format};base64,{encoded}"
+
+def _decode_wav(view: memoryview) -> Tuple[np.ndarray, int]:
+    if len(view) < 12 or bytes(view[8:12]) != b"WAVE":
+        raise AudioDecodeError("Not a RIFF/WAVE file")
+
+    fmt = None
+    payload = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        size = struct.unpack_from("<I", view, offset + 4)[0]
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if size < 16 or body + 16 > len(view):
+                raise AudioDecodeError("Truncated WAV fmt chunk")
+            tag, channels, rate, _, block_align, bits = struct.unpack_from("<HHIIHH", view, body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and size >= 26 and body + 26 <= len(view):
+                tag = struct.unpack_from("<H", view, body + 24)[0]
+            fmt = (tag, channels, rate, block_align, bits)
+        elif chunk_id == b"data":
+            # Streamed WAVs may carry a placeholder size; clamp to the buffer
+            payload = view[body:min(body + size, len(view))]
+            break
+
+        offset = body + size + (size & 1)
+
+    if fmt is None or payload is None:
+        raise AudioDecodeError("WAV file is missing fmt or data chunk")
+
+    tag, channels, rate, block_align, bits = fmt
+    if channels < 1 or block_align < 1 or rate < 1:
+        raise AudioDecodeError("Invalid WAV format header")
+    payload = payload[:len(payload) - len(payload) % block_align]
+
+    audio = _pcm_to_float32(payload, tag, bits)
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    return audio, rate
+
+def _pcm_to_float32(payload: memoryview, tag: int, bits: int) -> np.ndarray:
+    if tag == WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        return np.frombuffer(payload, dtype="<f4").astype(np.float32)
+    if tag == WAVE_FORMAT_IEEE_FLOAT and bits == 64:
+        return np.frombuffer(payload, dtype="<f8").astype(np.float32)
+    if tag != WAVE_FORMAT_PCM:
+        raise AudioDecodeError(f"Unsupported WAV encoding: {tag:#06x}")
+
+    if bits == 8:
+        samples = np.frombuffer(payload, dtype=np.uint8).astype(np.float32)
+        return (samples - 128.0) / 128.0
+    if bits == 16:
+        return np.frombuffer(payload, dtype="<i2").astype(np.float32) / 32768.0
+    if bits == 24:
+        raw = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        samples = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = np.where(samples & 0x800000, samples - 0x1000000, samples)
+        return samples.astype(np.float32) / 8388608.0
+    if bits == 32:
+        return np.frombuffer(payload, dtype="<i4").astype(np.float32) / 2147483648.0
+    raise AudioDecodeError(f"Unsupported PCM bit depth: {bits}")
+
+def _decode_ffmpeg(view: memoryview, sample_rate: int) -> np.ndarray:
+    cmd = [
+        "ffmpeg",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "pipe:1"
+    ]
+    try:
+        out = subprocess.run(cmd, input=view, capture_output=True, check=True).stdout
+    except FileNotFoundError:
+        raise AudioDecodeError("ffmpeg is required to decode non-WAV audio")
+    except subprocess.CalledProcessError as e:
+        logger.error(f"ffmpeg decode failed: {e.stderr.decode(errors='ignore')[-500:]}")
+        raise AudioDecodeError("Failed to decode audio")
+
+    return np.frombuffer(out, dtype=np.int16).astype(np.float32) / 32768.0
@@ -25,11 +25,43 @@ voice_processing_duration_seconds = Histogram(
     ['status']
 )
 
+stt_decode_duration_seconds = Histogram(
+    'stt_decode_duration_seconds',
+    'Speech-to-text decode duration in seconds',
+    ['profile', 'tier']
+)
+
+tts_cache_requests_total = Counter(
+    'tts_cache_requests_total',
+    'TTS audio cache lookups',
+    ['result']
+)
+
+tts_cache_bytes_saved_total = Counter(
+    'tts_cache_bytes_saved_total',
+    'Audio bytes served from the TTS cache instead of being synthesized'
+)
+
+tts_cache_evictions_total = Counter(
+    'tts_cache_evictions_total',
+    'TTS cache entries evicted to stay within the size limit'
+)
+
+tts_cache_size_bytes = Gauge(
+    'tts_cache_size_bytes',
+    'Audio bytes held in the TTS cache'
+)
+
 active_websocket_connections = Gauge(
     'active_websocket_connections',
     'Number of active WebSocket connections'
 )
 
+websocket_messages_total = Counter(
+    'websocket_messages_total',
+    'Messages sent to WebSocket clients'
+)
+
 def track_time(metric: Histogram) -> Callable:
     """Decorator to track execution time of a function"""
     def decorator(func: Callable) -> Callable:
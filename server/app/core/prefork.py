@@ -0,0 +1,52 @@
+import gc
+import os
+from typing import List, Optional
+
+import torch
+
+from ..config import settings
+from .logging import setup_logging
+from .voice.model_pool import model_pool
+from .voice_registry import load_voice_registry
+
+logger = setup_logging()
+
+def worker_threads(workers: int) -> int:
+    """Intra-op threads per worker so that all workers together use each core once"""
+    if settings.TORCH_NUM_THREADS > 0:
+        return settings.TORCH_NUM_THREADS
+    return max((os.cpu_count() or 1) // max(workers, 1), 1)
+
+def preload(model_names: Optional[List[str]] = None):
+    """Load shared state in the gunicorn master, before workers fork.
+
+    Whisper weights and the voice catalogue are loaded once and inherited
+    by every worker; the weights are only ever read, so their pages stay
+    shared copy-on-write. The master keeps torch single-threaded: forking
+    after OpenMP has started its thread pool deadlocks the children on
+    their first parallel op.
+    """
+    torch.set_num_threads(1)
+
+    if settings.STT_BACKEND != "whisper":
+        # CTranslate2 starts native threads at load time, which do not survive fork
+        logger.warning(f"STT backend {settings.STT_BACKEND} loads per worker, not before fork")
+    elif model_pool.device == "cuda":
+        logger.warning("CUDA cannot be initialized before fork, each worker loads its own Whisper models")
+    else:
+        model_pool.preload(model_names)
+    load_voice_registry(settings.VOICE_CONFIG_PATH, settings.VOICE_SNAPSHOT_PATH).ensure_loaded()
+
+    # Move everything loaded so far out of the collector's reach, so gc
+    # passes in the workers do not write to (and un-share) those pages
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Preloaded shared state: {model_pool.stats() or 'no Whisper models'}")
+
+def configure_worker(workers: int):
+    """Split the cores between ``workers`` forked workers"""
+    threads = worker_threads(workers)
+    torch.set_num_threads(threads)
+    if settings.CT2_CPU_THREADS == 0:
+        settings.CT2_CPU_THREADS = threads
+    logger.info(f"Worker {os.getpid()} using {threads} intra-op threads")
@@ -0,0 +1,132 @@
+import logging
+from functools import lru_cache
+from math import gcd
+from typing import NamedTuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin, upfirdn
+
+logger = logging.getLogger(__name__)
+
+KAISER_BETA = 5.0
+ZERO_CROSSINGS = 10  # Filter half-length in units of the larger rate factor
+
+class FilterBank(NamedTuple):
+    up: int
+    down: int
+    taps: np.ndarray  # Anti-aliasing FIR, front-padded so output lines up with input
+    phases: np.ndarray  # (up, taps_per_phase) polyphase decomposition, reversed per phase
+    delay: int  # Leading output samples to discard
+
+@lru_cache(maxsize=32)
+def get_filter_bank(src_rate: int, dst_rate: int) -> FilterBank:
+    """Design (once per rate pair) the polyphase filter bank for a conversion"""
+    factor = gcd(src_rate, dst_rate)
+    up, down = dst_rate // factor, src_rate // factor
+    max_rate = max(up, down)
+
+    half_len = ZERO_CROSSINGS * max_rate
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", KAISER_BETA)) * up
+
+    # Same alignment as scipy.signal.resample_poly
+    pre_pad = down - half_len % down
+    delay = (half_len + pre_pad) // down
+    taps = np.concatenate([np.zeros(pre_pad), taps]).astype(np.float32)
+
+    per_phase = -(-len(taps) // up)
+    padded = np.zeros(per_phase * up, dtype=np.float32)
+    padded[:len(taps)] = taps
+    phases = np.ascontiguousarray(padded.reshape(per_phase, up).T[:, ::-1])
+
+    logger.debug(f"Designed {src_rate}->{dst_rate} Hz filter bank ({up}x{per_phase} taps)")
+    return FilterBank(up, down, taps, phases, delay)
+
+def output_length(n_samples: int, src_rate: int, dst_rate: int) -> int:
+    bank = get_filter_bank(src_rate, dst_rate)
+    return -(-n_samples * bank.up // bank.down)
+
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """One-shot polyphase resampling of a mono signal"""
+    audio = np.asarray(audio, dtype=np.float32)
+    if src_rate == dst_rate or not len(audio):
+        return audio
+
+    bank = get_filter_bank(src_rate, dst_rate)
+    n_out = output_length(len(audio), src_rate, dst_rate)
+    taps = bank.taps
+
+    # Extend the filter tail so upfirdn yields enough samples for short inputs
+    needed = (bank.delay + n_out) * bank.down
+    produced = (len(audio) - 1) * bank.up + len(taps)
+    if produced < needed:
+        taps = np.concatenate([taps, np.zeros(needed - produced, dtype=np.float32)])
+
+    return upfirdn(taps, audio, bank.up, bank.down)[bank.delay:bank.delay + n_out]
+
+class StreamingResampler:
+    """Chunked resampler that carries filter state between calls.
+
+    Concatenating the output of every :meth:`process` call and the final
+    :meth:`flush` gives the same signal as :func:`resample` on the whole input.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.bank = get_filter_bank(src_rate, dst_rate)
+        taps_per_phase = self.bank.phases.shape[1]
+        self._history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self._received = 0
+        self._next_out = 0  # Next raw (undelayed) output index
+        self._emitted = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        chunk = np.asarray(chunk, dtype=np.float32)
+        if self.src_rate == self.dst_rate:
+            self._emitted += len(chunk)
+            return chunk
+        if not len(chunk):
+            return chunk
+        return self._run(chunk)
+
+    def flush(self) -> np.ndarray:
+        """Drain the filter tail once the input has ended"""
+        if self.src_rate == self.dst_rate:
+            return np.zeros(0, dtype=np.float32)
+
+        up, down = self.bank.up, self.bank.down
+        target = output_length(self._received, self.src_rate, self.dst_rate)
+        last_raw = self.bank.delay + target - 1
+        needed_input = (last_raw * down) // up + 1
+        zeros = np.zeros(max(needed_input - self._received, 0), dtype=np.float32)
+
+        tail = self._run(zeros) if len(zeros) else np.zeros(0, dtype=np.float32)
+        keep = max(target - (self._emitted - len(tail)), 0)
+        self._emitted = target
+        return tail[:keep]
+
+    def _run(self, chunk: np.ndarray) -> np.ndarray:
+        up, down = self.bank.up, self.bank.down
+        taps_per_phase = self.bank.phases.shape[1]
+        base = self._received
+
+        buffer = np.concatenate([self._history, chunk])
+        self._received += len(chunk)
+        self._history = buffer[len(buffer) - (taps_per_phase - 1):]
+
+        end = (self._received * up - 1) // down + 1
+        raw = np.arange(self._next_out, end)
+        self._next_out = end
+        if not len(raw):
+            return np.zeros(0, dtype=np.float32)
+
+        positions = raw * down
+        windows = sliding_window_view(buffer, taps_per_phase)[positions // up - base]
+        out = np.einsum("ij,ij->i", windows, self.bank.phases[positions % up])
+
+        # Discard the filter's leading delay
+        skip = max(self.bank.delay - int(raw[0]), 0)
+        out = out[skip:]
+        self._emitted += len(out)
+        return out.astype(np.float32, copy=False)
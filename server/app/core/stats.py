@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram with bounded memory.
+
+    Values are recorded in microseconds. Each power-of-two range is split
+    into ``2 ** (SUB_BUCKET_BITS - 1)`` linear sub-buckets, so quantiles are
+    accurate to about 1% whatever the magnitude, and the number of buckets
+    grows with the log of the largest value rather than with sample count.
+    """
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, seconds: float):
+        micros = max(int(seconds * 1_000_000), 0)
+        index = self._index(micros)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound (in seconds) of the bucket holding quantile ``q``"""
+        if not self.count:
+            return 0.0
+        rank = max(int(q * self.count + 0.5), 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    def _index(self, micros: int) -> int:
+        shift = max(micros.bit_length() - self.SUB_BUCKET_BITS, 0)
+        return (shift << self.SUB_BUCKET_BITS) | (micros >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        shift = index >> self.SUB_BUCKET_BITS
+        sub_bucket = index & ((1 << self.SUB_BUCKET_BITS) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+class StatsStore:
+    """Bounded store of recent records plus streaming per-stage aggregates.
+
+    Recent records live in an insertion-ordered ring of at most ``capacity``
+    entries and expire after ``ttl_seconds``. Stage aggregates (count, errors,
+    mean and a latency histogram) are updated in O(1) and never hold
+    individual samples, so memory stays flat however long the process runs.
+    """
+
+    def __init__(self, name: str, capacity: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.name = name
+        self.capacity = max(capacity or settings.STATS_HISTORY_SIZE, 1)
+        self.ttl = settings.STATS_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._expires: Dict[str, float] = {}
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store (or replace) a recent record and return it for in-place updates"""
+        with self._lock:
+            self._records.pop(key, None)
+            self._records[key] = data
+            self._expires[key] = time.monotonic() + self.ttl
+            while len(self._records) > self.capacity:
+                evicted, _ = self._records.popitem(last=False)
+                self._expires.pop(evicted, None)
+            return data
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._evict_expired()
+            return self._records.get(key)
+
+    def recent(self, limit: int = 100) -> Dict[str, Dict[str, Any]]:
+        """Most recent records first, without sorting the whole store"""
+        with self._lock:
+            self._evict_expired()
+            items: List = []
+            for key in reversed(self._records):
+                if len(items) >= limit:
+                    break
+                items.append((key, self._records[key]))
+            return dict(items)
+
+    def observe(self, stage: str, seconds: float, error: bool = False):
+        """Fold one stage timing into the streaming aggregates"""
+        with self._lock:
+            self._stages.setdefault(stage, LatencyHistogram()).record(seconds)
+            if error:
+                self._errors[stage] = self._errors.get(stage, 0) + 1
+
+    def estimate(self, stage: str, q: float = 0.9, min_samples: int = 20) -> Optional[float]:
+        """Observed ``q`` quantile of a stage in seconds, once enough samples exist"""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None or histogram.count < min_samples:
+                return None
+            return histogram.quantile(q)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            self._evict_expired()
+            return {
+                "recent": len(self._records),
+                "capacity": self.capacity,
+                "ttl_seconds": self.ttl,
+                "stages": {
+                    stage: {
+                        "count": histogram.count,
+                        "errors": self._errors.get(stage, 0),
+                        "mean_ms": round(histogram.mean * 1000, 3),
+                        "min_ms": round((histogram.min or 0.0) * 1000, 3),
+                        "p50_ms": round(histogram.quantile(0.5) * 1000, 3),
+                        "p90_ms": round(histogram.quantile(0.9) * 1000, 3),
+                        "p99_ms": round(histogram.quantile(0.99) * 1000, 3),
+                        "max_ms": round((histogram.max or 0.0) * 1000, 3)
+                    }
+                    for stage, histogram in self._stages.items()
+                }
+            }
+
+    def _evict_expired(self):
+        # Records are kept in insertion order, so expired ones sit at the front
+        now = time.monotonic()
+        while self._records:
+            key = next(iter(self._records))
+            if self._expires[key] > now:
+                break
+            self._records.popitem(last=False)
+            del self._expires[key]
+
+_stores: Dict[str, StatsStore] = {}
+_stores_lock = threading.Lock()
+
+def get_stats_store(name: str) -> StatsStore:
+    """Process-wide store for ``name``, shared by every instance of a service"""
+    with _stores_lock:
+        if name not in _stores:
+            _stores[name] = StatsStore(name)
+        return _stores[name]
+
+def stats_summary() -> Dict[str, Dict[str, Any]]:
+    with _stores_lock:
+        stores = list(_stores.values())
+    return {store.name: store.summary() for store in stores}
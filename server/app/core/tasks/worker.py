@@ -1,8 +1,9 @@
 from celery import Task
 from ...core.command import CommandProcessor
-from ...core.voice import VoiceProcessor
+from ...core.voice.processor import VoiceProcessor
 from ...database import SessionLocal
 from ...models import VoiceCommand
+import asyncio
 import logging
 from typing import Dict, Any
 from .celery_app import celery_app
@@ -28,7 +29,7 @@ def process_voice_command(self, audio_data: bytes, user_id: int) -> Dict[str, An
     """Process voice command in background"""
     try:
         processor = VoiceProcessor()
-        result = await processor.process_audio(audio_data, user_id)
+        result = asyncio.run(processor.process_audio(audio_data, user_id))
         
         # Store result in database
         command = VoiceCommand(
@@ -58,7 +59,7 @@ def execute_command_action(self, action: Dict[str, Any], user_id: int) -> Dict[s
     """Execute command action in background"""
     try:
         processor = CommandProcessor()
-        result = await processor.execute_action(action, user_id)
+        result = asyncio.run(processor.execute_action(action, user_id))
         
         return {
             "status": "success",
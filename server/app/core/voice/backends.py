@@ -0,0 +1,66 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+from ...config import settings
+from ..interfaces import STTBackend
+from .language import default_language, route_model
+
+def configured_model_names() -> List[str]:
+    """Every model size the configuration asks to keep loaded.
+
+    Sizes are routed for the default language (``base`` becomes ``base.en``
+    for English); other languages' pools load on first use.
+    """
+    names = [settings.WHISPER_MODEL, *settings.WHISPER_POOL_MODELS]
+    if settings.WHISPER_CASCADE_ENABLED:
+        names.append(settings.WHISPER_CASCADE_MODEL)
+    names = [route_model(name, default_language()) for name in names]
+    return list(dict.fromkeys(names))
+
+def _whisper_backend() -> STTBackend:
+    from .batcher import transcription_batcher
+    return transcription_batcher
+
+def _ctranslate2_backend() -> STTBackend:
+    from .ctranslate2_backend import CTranslate2Backend
+    return CTranslate2Backend()
+
+# Factories import lazily so a deployment only loads the runtime it uses
+BACKENDS: Dict[str, Callable[[], STTBackend]] = {
+    "whisper": _whisper_backend,
+    "ctranslate2": _ctranslate2_backend
+}
+
+_instances: Dict[str, STTBackend] = {}
+_transcriber: Optional[STTBackend] = None
+_lock = threading.RLock()
+
+def get_stt_backend(name: Optional[str] = None) -> STTBackend:
+    """Process-wide instance of the configured (or named) STT backend"""
+    name = name or settings.STT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown STT backend: {name} (expected one of {', '.join(BACKENDS)})")
+
+    with _lock:
+        if name not in _instances:
+            _instances[name] = BACKENDS[name]()
+        return _instances[name]
+
+def get_transcriber() -> STTBackend:
+    """The configured backend wrapped in whichever fast paths are enabled.
+
+    Requests flow grammar recognizer -> model cascade -> backend, each stage
+    handing on only what it cannot answer confidently.
+    """
+    global _transcriber
+    with _lock:
+        if _transcriber is None:
+            transcriber = get_stt_backend()
+            if settings.WHISPER_CASCADE_ENABLED:
+                from .cascade import ModelCascade
+                transcriber = ModelCascade(transcriber)
+            if settings.GRAMMAR_ENABLED:
+                from .grammar import GrammarRecognizer
+                transcriber = GrammarRecognizer(transcriber)
+            _transcriber = transcriber
+        return _transcriber
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import torch
+import whisper
+
+from ...config import settings
+from ..cancellation import CancellationToken, OperationCancelled, run_cancellable
+from ..interfaces import STTBackend
+from .model_pool import WhisperModelPool, model_pool
+from .profiles import DecodeProfile, get_profile
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[str, Optional[str], str]
+
+class TranscriptionBatcher(STTBackend):
+    """Dynamic micro-batching front end for pooled Whisper models.
+
+    Concurrent utterances that fit in Whisper's 30 s window are gathered for
+    up to ``window_ms`` (or until ``max_batch_size`` is reached), padded to a
+    single mel batch and decoded with one ``whisper.decode`` call per
+    temperature of the decode profile. Longer audio falls back to
+    ``model.transcribe`` on its own replica.
+    """
+
+    name = "whisper"
+
+    def __init__(
+        self,
+        pool: WhisperModelPool,
+        window_ms: Optional[int] = None,
+        max_batch_size: Optional[int] = None
+    ):
+        self.pool = pool
+        self.window = (window_ms if window_ms is not None else settings.WHISPER_BATCH_WINDOW_MS) / 1000
+        self.max_batch_size = max(max_batch_size or settings.WHISPER_BATCH_MAX_SIZE, 1)
+        self._pending: Dict[BatchKey, List[Tuple[np.ndarray, asyncio.Future]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self._running: Set[asyncio.Task] = set()
+
+    async def init(self, model_names: Optional[List[str]] = None):
+        await self.pool.init(model_names)
+
+    async def close(self):
+        await self.pool.close()
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Transcribe a 16 kHz float32 waveform, batching with concurrent callers"""
+        model_name = model_name or settings.WHISPER_MODEL
+        decode_profile = get_profile(profile)
+        audio = np.asarray(audio, dtype=np.float32)
+
+        if len(audio) > whisper.audio.N_SAMPLES:
+            return await self._transcribe_single(audio, model_name, language, decode_profile)
+
+        loop = asyncio.get_running_loop()
+        key = (model_name, language, decode_profile.name)
+        future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((audio, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: BatchKey):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(key, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, key: BatchKey, batch: List[Tuple[np.ndarray, asyncio.Future]]):
+        model_name, language, profile = key
+        live = [(audio, future) for audio, future in batch if not future.done()]
+        if not live:
+            return
+
+        # Stop decoding once every caller in the batch has gone away
+        token = CancellationToken()
+
+        def abandon(_):
+            if all(future.cancelled() for _, future in live):
+                token.cancel("abandoned")
+
+        for _, future in live:
+            future.add_done_callback(abandon)
+
+        try:
+            async with self.pool.acquire(model_name) as model:
+                results = await run_cancellable(
+                    None,
+                    self._decode_batch,
+                    model,
+                    [audio for audio, _ in live],
+                    language,
+                    get_profile(profile),
+                    token=token
+                )
+        except OperationCancelled:
+            logger.debug(f"Abandoned batch of {len(live)} for {model_name}")
+            return
+        except Exception as e:
+            logger.error(f"Batched transcription failed: {str(e)}")
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(live, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _transcribe_single(
+        self,
+        audio: np.ndarray,
+        model_name: str,
+        language: Optional[str],
+        profile: DecodeProfile
+    ) -> Dict[str, Any]:
+        async with self.pool.acquire(model_name) as model:
+            result = await run_cancellable(
+                None,
+                lambda: model.transcribe(audio, language=language, fp16=False, **profile.transcribe_options())
+            )
+        for segment in result["segments"]:
+            segment.setdefault("confidence", float(np.exp(segment["avg_logprob"])))
+        return result
+
+    def _decode_batch(
+        self,
+        model: Any,
+        audios: List[np.ndarray],
+        language: Optional[str],
+        profile: DecodeProfile
+    ) -> List[Dict[str, Any]]:
+        """Pad every utterance to 30 s and decode them as one mel batch.
+
+        Utterances the profile rejects at one temperature are re-decoded
+        together at the next, mirroring ``model.transcribe``'s fallback.
+        """
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), model.dims.n_mels)
+            for audio in audios
+        ]).to(model.device)
+
+        results: List[Any] = [None] * len(audios)
+        pending = list(range(len(audios)))
+        for temperature in profile.temperatures:
+            options = whisper.DecodingOptions(
+                language=language,
+                fp16=False,
+                without_timestamps=True,
+                temperature=temperature,
+                sample_len=profile.sample_len,
+                beam_size=profile.beam_size if temperature == 0 else None,
+                best_of=profile.best_of if temperature > 0 else None
+            )
+            with torch.no_grad():
+                decoded = whisper.decode(model, mel[pending], options)
+
+            retry = []
+            for index, result in zip(pending, decoded):
+                results[index] = result
+                if profile.needs_fallback(result):
+                    retry.append(index)
+            if not retry:
+                break
+            pending = retry
+
+        return [
+            self._to_transcript(result, len(audio) / whisper.audio.SAMPLE_RATE)
+            for result, audio in zip(results, audios)
+        ]
+
+    @staticmethod
+    def _to_transcript(result: Any, duration: float) -> Dict[str, Any]:
+        """Shape a DecodingResult like the output of ``model.transcribe``"""
+        text = result.text.strip()
+        return {
+            "text": text,
+            "language": result.language,
+            "segments": [{
+                "id": 0,
+                "start": 0.0,
+                "end": duration,
+                "text": text,
+                "tokens": result.tokens,
+                "temperature": result.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob,
+                "confidence": float(np.exp(result.avg_logprob))
+            }]
+        }
+
+transcription_batcher = TranscriptionBatcher(model_pool)
@@ -0,0 +1,81 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..interfaces import STTBackend
+from .backends import get_stt_backend
+from .language import route_model
+
+logger = logging.getLogger(__name__)
+
+class ModelCascade(STTBackend):
+    """Try a small Whisper model first and escalate only uncertain utterances.
+
+    The first tier (``WHISPER_CASCADE_MODEL``) answers when its average
+    segment confidence is at least ``min_confidence`` and no segment has a
+    ``no_speech_prob`` above ``max_no_speech_prob``. Otherwise the utterance
+    is re-run on the final tier. Results carry the answering model in
+    ``tier`` and whether escalation happened in ``escalated``.
+    """
+
+    name = "cascade"
+
+    def __init__(
+        self,
+        batcher: Optional[STTBackend] = None,
+        first_tier: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        max_no_speech_prob: Optional[float] = None
+    ):
+        self.batcher = batcher or get_stt_backend()
+        self.first_tier = first_tier or settings.WHISPER_CASCADE_MODEL
+        self.min_confidence = settings.WHISPER_CASCADE_MIN_CONFIDENCE if min_confidence is None else min_confidence
+        self.max_no_speech_prob = (
+            settings.WHISPER_CASCADE_MAX_NO_SPEECH_PROB if max_no_speech_prob is None else max_no_speech_prob
+        )
+
+    async def init(self, model_names: Optional[List[str]] = None):
+        await self.batcher.init(model_names)
+
+    async def close(self):
+        await self.batcher.close()
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Transcribe with the cascade, ``model_name`` being the final tier"""
+        final_tier = model_name or settings.WHISPER_MODEL
+        first_tier = route_model(self.first_tier, language)
+        if final_tier == first_tier:
+            result = await self.batcher.transcribe(audio, model_name=final_tier, language=language, profile=profile)
+            return self._tag(result, final_tier, escalated=False)
+
+        result = await self.batcher.transcribe(audio, model_name=first_tier, language=language, profile=profile)
+        if self.accepts(result):
+            return self._tag(result, first_tier, escalated=False)
+
+        logger.debug(f"Escalating utterance from {first_tier} to {final_tier}")
+        result = await self.batcher.transcribe(audio, model_name=final_tier, language=language, profile=profile)
+        return self._tag(result, final_tier, escalated=True)
+
+    def accepts(self, result: Dict[str, Any]) -> bool:
+        segments: List[Dict[str, Any]] = result.get("segments") or []
+        if not segments or not result.get("text", "").strip():
+            return False
+
+        confidence = np.mean([s["confidence"] for s in segments])
+        no_speech_prob = max(s.get("no_speech_prob", 0.0) for s in segments)
+        return confidence >= self.min_confidence and no_speech_prob <= self.max_no_speech_prob
+
+    @staticmethod
+    def _tag(result: Dict[str, Any], tier: str, escalated: bool) -> Dict[str, Any]:
+        # Batched results are fresh dicts per caller, so tagging in place is safe
+        result["tier"] = tier
+        result["escalated"] = escalated
+        return result
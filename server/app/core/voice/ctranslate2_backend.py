@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..cancellation import check_cancelled, run_cancellable
+from ..interfaces import STTBackend
+from .backends import configured_model_names
+from .profiles import DecodeProfile, get_profile
+
+logger = logging.getLogger(__name__)
+
+class CTranslate2Backend(STTBackend):
+    """Whisper on CTranslate2 through ``faster-whisper``.
+
+    Converted checkpoints are fetched into ``WHISPER_MODEL_DIR`` on first
+    use and run with ``CT2_COMPUTE_TYPE`` weights (int8 by default). One
+    model object per size serves ``CT2_NUM_WORKERS`` concurrent requests;
+    a dedicated thread pool of the same size keeps further callers queued
+    instead of oversubscribing the CPU.
+    """
+
+    name = "ctranslate2"
+
+    def __init__(self):
+        self.device = "cuda" if settings.WHISPER_DEVICE == "cuda" else "cpu"
+        self.num_workers = max(settings.CT2_NUM_WORKERS, 1)
+        self._models: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="ct2")
+
+    async def init(self, model_names: Optional[List[str]] = None):
+        loop = asyncio.get_running_loop()
+        for name in model_names or configured_model_names():
+            await loop.run_in_executor(None, self._get_model, name)
+        logger.info(f"CTranslate2 backend ready: {sorted(self._models)}")
+
+    async def close(self):
+        self._models.clear()
+        logger.info("CTranslate2 backend closed")
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        model_name = model_name or settings.WHISPER_MODEL
+        audio = np.asarray(audio, dtype=np.float32)
+        return await run_cancellable(
+            self._executor,
+            self._transcribe_sync,
+            audio,
+            model_name,
+            language,
+            get_profile(profile)
+        )
+
+    def _transcribe_sync(
+        self,
+        audio: np.ndarray,
+        model_name: str,
+        language: Optional[str],
+        profile: DecodeProfile
+    ) -> Dict[str, Any]:
+        model = self._get_model(model_name)
+        segments, info = model.transcribe(
+            audio,
+            language=language,
+            beam_size=profile.beam_size or 1,
+            best_of=profile.best_of or 1,
+            temperature=list(profile.temperatures),
+            condition_on_previous_text=profile.condition_on_previous_text,
+            compression_ratio_threshold=profile.compression_ratio_threshold,
+            log_prob_threshold=profile.logprob_threshold,
+            no_speech_threshold=profile.no_speech_threshold,
+            max_new_tokens=profile.sample_len
+        )
+        # The segment generator does the decoding; drain it on this thread,
+        # stopping between segments once the caller has gone away
+        decoded = []
+        for segment in segments:
+            check_cancelled()
+            decoded.append(self._to_segment(segment))
+        segments = decoded
+        return {
+            "text": "".join(s["text"] for s in segments).strip(),
+            "language": info.language,
+            "segments": segments
+        }
+
+    def _get_model(self, name: str) -> Any:
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._load_lock:
+            if name not in self._models:
+                self._models[name] = self._load_model(name)
+            return self._models[name]
+
+    def _load_model(self, name: str) -> Any:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("STT_BACKEND=ctranslate2 requires the faster-whisper package")
+
+        try:
+            model = WhisperModel(
+                name,
+                device=self.device,
+                compute_type=settings.CT2_COMPUTE_TYPE,
+                cpu_threads=settings.CT2_CPU_THREADS,
+                num_workers=self.num_workers,
+                download_root=settings.WHISPER_MODEL_DIR
+            )
+        except Exception as e:
+            logger.error(f"Failed to load CTranslate2 Whisper model {name}: {str(e)}")
+            raise RuntimeError(f"Could not initialize Whisper model: {str(e)}")
+
+        logger.info(f"Loaded CTranslate2 Whisper model {name} on {self.device} ({settings.CT2_COMPUTE_TYPE})")
+        return model
+
+    @staticmethod
+    def _to_segment(segment: Any) -> Dict[str, Any]:
+        return {
+            "id": segment.id,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "tokens": list(segment.tokens),
+            "temperature": segment.temperature,
+            "avg_logprob": segment.avg_logprob,
+            "compression_ratio": segment.compression_ratio,
+            "no_speech_prob": segment.no_speech_prob,
+            "confidence": float(np.exp(segment.avg_logprob))
+        }
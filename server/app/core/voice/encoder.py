@@ -2,8 +2,10 @@ import numpy as np
 from scipy.io import wavfile
 import io
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from ...config import settings
+from ..resampler import resample
+from .vad import VoiceActivityDetector
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +13,23 @@ class AudioEncoder:
     def __init__(self):
         self.sample_rate = 16000  # Whisper expects 16kHz
         self.max_length = settings.MAX_AUDIO_LENGTH * self.sample_rate
+        self.max_long_form_length = settings.LONGFORM_MAX_AUDIO_LENGTH * self.sample_rate
+        self.vad = VoiceActivityDetector(self.sample_rate) if settings.VAD_ENABLED else None
 
     def encode(self, audio_data: bytes) -> np.ndarray:
         """Convert audio bytes to numpy array for model processing"""
+        return self.encode_with_metadata(audio_data)[0]
+
+    def encode_with_metadata(
+        self,
+        audio_data: bytes,
+        long_form: bool = False
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Encode audio and report what the pipeline did to it.
+
+        Long-form audio is kept up to ``LONGFORM_MAX_AUDIO_LENGTH`` instead of
+        being cut at Whisper's 30 s window, and is not compacted by the VAD.
+        """
         try:
             # Read WAV data
             with io.BytesIO(audio_data) as buf:
@@ -29,12 +45,22 @@ class AudioEncoder:
             
             # Normalize
             audio_array = self._normalize(audio_array)
+
+            # Drop silence before it reaches the model. Long-form audio keeps
+            # its pauses: windows are cut inside them, and segment timestamps
+            # must point into the recording the client sent
+            metadata: Dict[str, Any] = {}
+            if self.vad and not long_form:
+                audio_array, metadata = self.vad.compact(audio_array)
             
             # Trim to max length
-            if len(audio_array) > self.max_length:
-                audio_array = audio_array[:self.max_length]
+            max_length = self.max_long_form_length if long_form else self.max_length
+            if len(audio_array) > max_length:
+                logger.warning(f"Truncating {len(audio_array) / self.sample_rate:.1f}s of audio")
+                audio_array = audio_array[:max_length]
+                metadata["truncated"] = True
             
-            return audio_array
+            return audio_array, metadata
 
         except Exception as e:
             logger.error(f"Audio encoding failed: {str(e)}")
@@ -42,16 +68,14 @@ class AudioEncoder:
 
     def _normalize(self, audio_array: np.ndarray) -> np.ndarray:
         """Normalize audio array to [-1, 1] range"""
-        return np.float32(audio_array) / np.max(np.abs(audio_array))
+        audio_array = np.asarray(audio_array, dtype=np.float32)
+        peak = np.max(np.abs(audio_array)) if len(audio_array) else 0.0
+        return audio_array / peak if peak > 0 else audio_array
 
     def _resample(self, audio_array: np.ndarray, original_rate: int) -> np.ndarray:
         """Resample audio to target sample rate"""
         try:
-            from scipy import signal
-            duration = len(audio_array) / original_rate
-            time_old = np.linspace(0, duration, len(audio_array))
-            time_new = np.linspace(0, duration, int(len(audio_array) * self.sample_rate / original_rate))
-            return np.interp(time_new, time_old, audio_array)
+            return resample(audio_array, original_rate, self.sample_rate)
         except Exception as e:
             logger.error(f"Resampling failed: {str(e)}")
             raise
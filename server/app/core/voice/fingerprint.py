@@ -0,0 +1,157 @@
+import base64
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ...config import settings
+from ..cache import redis_client
+from ..media import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+FRAME = 400  # 25 ms
+HOP = 160  # 10 ms
+N_FFT = 512
+N_BANDS = 24
+N_SLICES = 32  # Time resolution of the sketch, independent of duration
+N_BITS = N_SLICES * N_BANDS
+DYNAMIC_RANGE_DB = 35.0  # Frames this far below the loudest one are trimmed as silence
+FLOOR_PERCENTILE = 10  # Per-band noise floor estimate
+
+class Fingerprint(NamedTuple):
+    bits: bytes  # Packed sign bits of the log-mel sketch
+    duration: float  # Seconds of voiced audio
+
+@lru_cache(maxsize=1)
+def _mel_filters() -> np.ndarray:
+    """(N_BANDS, N_FFT // 2 + 1) triangular filters between 100 Hz and 7.6 kHz"""
+    def to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+    def to_hz(mel):
+        return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+    edges = to_hz(np.linspace(to_mel(100.0), to_mel(7600.0), N_BANDS + 2))
+    bins = np.fft.rfftfreq(N_FFT, 1.0 / SAMPLE_RATE)
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+def fingerprint(audio: np.ndarray) -> Optional[Fingerprint]:
+    """Quantized log-mel sketch of a 16 kHz utterance.
+
+    Leading and trailing silence is trimmed and the log-mel spectrogram is
+    averaged into ``N_SLICES`` time slices, so the sketch ignores padding
+    and small tempo changes. Each slice is normalized to its mean level
+    (removing gain) and each band to its mean over the utterance (removing
+    the channel); the sketch keeps one sign bit per cell. Bands are clamped
+    at their noise floor first so background noise does not flip bits.
+    Returns None for clips too short (or too flat) to sketch.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if len(audio) < FRAME:
+        return None
+
+    frames = sliding_window_view(audio, FRAME)[::HOP] * np.hanning(FRAME).astype(np.float32)
+    power = np.abs(np.fft.rfft(frames, N_FFT)) ** 2 @ _mel_filters().T
+    log_mel = 10.0 * np.log10(power + 1e-10)
+
+    energy = 10.0 * np.log10(power.sum(axis=1) + 1e-10)
+    threshold = max(energy.max() - DYNAMIC_RANGE_DB, np.percentile(energy, FLOOR_PERCENTILE) + 10.0)
+    voiced = np.flatnonzero(energy >= threshold)
+    if len(voiced) == 0 or voiced[-1] - voiced[0] + 1 < N_SLICES:
+        return None
+
+    floor = np.maximum(np.percentile(log_mel, FLOOR_PERCENTILE, axis=0) + 6.0, log_mel.max() - DYNAMIC_RANGE_DB)
+    log_mel = np.maximum(log_mel[voiced[0]:voiced[-1] + 1], floor)
+
+    edges = np.linspace(0, len(log_mel), N_SLICES + 1).astype(int)
+    sketch = np.add.reduceat(log_mel, edges[:-1], axis=0) / np.diff(edges)[:, None]
+    sketch -= sketch.mean(axis=1, keepdims=True)
+    sketch -= sketch.mean(axis=0)
+    return Fingerprint(np.packbits(sketch > 0).tobytes(), len(log_mel) * HOP / SAMPLE_RATE)
+
+def similarity(a: Fingerprint, b: Fingerprint) -> float:
+    """Fraction of sketch bits on which two fingerprints agree"""
+    if len(a.bits) != len(b.bits):
+        return 0.0
+    x = np.frombuffer(a.bits, dtype=np.uint8)
+    y = np.frombuffer(b.bits, dtype=np.uint8)
+    return 1.0 - int(np.unpackbits(x ^ y).sum()) / N_BITS
+
+class FingerprintCache:
+    """Per-user index of recent utterance fingerprints and their transcripts.
+
+    Users repeat the same short commands ("next track", "lights off"), but
+    never upload identical bytes twice. Each user's most recent
+    ``FINGERPRINT_CACHE_SIZE`` transcripts are kept in one Redis entry with
+    their fingerprints; a new clip whose sketch agrees on at least
+    ``FINGERPRINT_MIN_SIMILARITY`` of its bits (and whose voiced duration is
+    within 20%) reuses the closest transcript. The index is scoped by
+    ``scope`` (language and decode profile), so a hit always answers the
+    same question the decoder would have. Hits report tier ``fingerprint``.
+
+    Off by default (``FINGERPRINT_CACHE_ENABLED``): a sketch cannot tell
+    apart commands that differ in one short sound ("lights on" / "lights
+    off"), so enable it only where the command set has no such pairs.
+    """
+
+    KEY_PREFIX = "stt_fingerprint"
+    MAX_DURATION_RATIO = 1.2
+
+    def __init__(self, cache: Any = None):
+        self.cache = cache or redis_client
+        self.min_similarity = settings.FINGERPRINT_MIN_SIMILARITY
+        self.max_samples = int(settings.FINGERPRINT_MAX_AUDIO_SECONDS * SAMPLE_RATE)
+        self.capacity = settings.FINGERPRINT_CACHE_SIZE
+
+    def sketch(self, audio: np.ndarray) -> Optional[Fingerprint]:
+        """Fingerprint ``audio`` when it is short enough to be a repeated command"""
+        if not settings.FINGERPRINT_CACHE_ENABLED or len(audio) > self.max_samples:
+            return None
+        return fingerprint(audio)
+
+    async def lookup(self, user_id: Any, scope: str, print_: Optional[Fingerprint]) -> Optional[Dict[str, Any]]:
+        """Transcript of the closest recent clip, or None"""
+        if user_id is None or print_ is None:
+            return None
+
+        best, best_score = None, self.min_similarity
+        for entry in await self.cache.get_json(self._key(user_id, scope)) or []:
+            stored = Fingerprint(base64.b64decode(entry["bits"]), entry["duration"])
+            ratio = max(stored.duration, print_.duration) / max(min(stored.duration, print_.duration), 1e-3)
+            if ratio > self.MAX_DURATION_RATIO:
+                continue
+            score = similarity(stored, print_)
+            if score >= best_score:
+                best, best_score = entry, score
+
+        if best is None:
+            return None
+        logger.debug(f"Fingerprint hit for user {user_id} (similarity {best_score:.2f})")
+        return {**best["result"], "tier": "fingerprint", "escalated": False, "fingerprint_similarity": best_score}
+
+    async def store(self, user_id: Any, scope: str, print_: Optional[Fingerprint], result: Dict[str, Any]):
+        """Index ``result`` under ``print_``, evicting the user's oldest entry"""
+        if user_id is None or print_ is None or not result.get("text"):
+            return
+
+        key = self._key(user_id, scope)
+        entries = await self.cache.get_json(key) or []
+        entries.append({
+            "bits": base64.b64encode(print_.bits).decode("ascii"),
+            "duration": print_.duration,
+            "result": result,
+            "stored_at": time.time()
+        })
+        await self.cache.set_json(key, entries[-self.capacity:], expire=settings.FINGERPRINT_CACHE_TTL)
+
+    def _key(self, user_id: Any, scope: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}:{scope}"
+
+fingerprint_cache = FingerprintCache()
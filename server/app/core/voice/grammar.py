@@ -0,0 +1,196 @@
+import asyncio
+import itertools
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..interfaces import STTBackend
+from ..media import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+MAX_EXPANSIONS = 200  # Per pattern, so one template cannot blow up the grammar
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(re.sub(r"[^\w'\s]", " ", text.lower()).split())
+
+def expand_pattern(pattern: str, variables: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Spell out a template pattern as concrete phrases.
+
+    ``{name}`` placeholders are expanded when ``variables[name]`` lists the
+    allowed values. Patterns with open-ended placeholders cannot be
+    constrained and yield nothing; those commands go to Whisper.
+    """
+    names = PLACEHOLDER.findall(pattern)
+    if not names:
+        phrase = normalize_phrase(pattern)
+        return [phrase] if phrase else []
+
+    choices = []
+    for name in names:
+        values = (variables or {}).get(name)
+        if not isinstance(values, list) or not values:
+            return []
+        choices.append([str(v) for v in values])
+
+    phrases = []
+    for combo in itertools.islice(itertools.product(*choices), MAX_EXPANSIONS):
+        values = iter(combo)
+        phrase = normalize_phrase(PLACEHOLDER.sub(lambda _: next(values), pattern))
+        if phrase:
+            phrases.append(phrase)
+    return phrases
+
+def load_template_phrases() -> List[str]:
+    """Concrete phrases for every stored template"""
+    from ...database import SessionLocal
+    from ...models.models import Template
+
+    db = SessionLocal()
+    try:
+        phrases = set()
+        for patterns, variables in db.query(Template.patterns, Template.variables).all():
+            for pattern in patterns or []:
+                phrases.update(expand_pattern(pattern, variables))
+        return sorted(phrases)
+    finally:
+        db.close()
+
+class GrammarRecognizer(STTBackend):
+    """Fast path that recognizes known command phrases with a Vosk grammar.
+
+    Short English utterances are first decoded by a Kaldi recognizer whose
+    grammar holds only the phrases compiled from ``Template.patterns``. The
+    result is accepted when it is an exact phrase with mean word confidence
+    of at least ``GRAMMAR_MIN_CONFIDENCE``; anything else is handed to the
+    ``fallback`` transcriber (Whisper). Accepted results report tier
+    ``grammar``.
+    """
+
+    name = "grammar"
+
+    def __init__(self, fallback: Any, phrase_loader=load_template_phrases):
+        self.fallback = fallback
+        self.phrase_loader = phrase_loader
+        self.min_confidence = settings.GRAMMAR_MIN_CONFIDENCE
+        self.max_samples = int(settings.GRAMMAR_MAX_AUDIO_SECONDS * SAMPLE_RATE)
+        self._model = None
+        self._phrases: frozenset = frozenset()
+        self._grammar: Optional[str] = None
+        self._idle: "queue.SimpleQueue" = queue.SimpleQueue()  # Recognizers for the current grammar
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    async def init(self, model_names: Optional[List[str]] = None):
+        await self.fallback.init(model_names)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.refresh)
+        except Exception as e:
+            logger.error(f"Could not compile command grammar, Whisper only until refresh: {str(e)}")
+
+    async def close(self):
+        await self.fallback.close()
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if len(audio) <= self.max_samples and language in (None, "en"):
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(None, self._recognize, audio)
+            except Exception as e:
+                logger.warning(f"Grammar recognizer failed, using Whisper: {str(e)}")
+                result = None
+            if result is not None:
+                return result
+
+        return await self.fallback.transcribe(audio, model_name=model_name, language=language, profile=profile)
+
+    def refresh(self):
+        """Recompile the grammar from the template store"""
+        self._loaded_at = time.monotonic()  # A failed load also waits out the interval
+        phrases = frozenset(self.phrase_loader())
+        with self._lock:
+            if phrases == self._phrases:
+                return
+            self._phrases = phrases
+            self._grammar = json.dumps(sorted(phrases) + ["[unk]"]) if phrases else None
+            self._idle = queue.SimpleQueue()
+        logger.info(f"Compiled command grammar with {len(phrases)} phrases")
+
+    def _recognize(self, audio: np.ndarray) -> Optional[Dict[str, Any]]:
+        if time.monotonic() - self._loaded_at > settings.GRAMMAR_REFRESH_SECONDS:
+            self.refresh()
+
+        with self._lock:
+            grammar, phrases, idle = self._grammar, self._phrases, self._idle
+        if grammar is None:
+            return None
+
+        recognizer = self._checkout(grammar, idle)
+        try:
+            pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+            recognizer.AcceptWaveform(pcm)
+            parsed = json.loads(recognizer.FinalResult())
+        finally:
+            recognizer.Reset()
+            idle.put(recognizer)
+
+        text = parsed.get("text", "")
+        words = parsed.get("result") or []
+        if not words or text not in phrases:
+            return None
+
+        confidence = float(np.mean([w["conf"] for w in words]))
+        if confidence < self.min_confidence:
+            return None
+
+        return {
+            "text": text,
+            "language": "en",
+            "segments": [{
+                "id": 0,
+                "start": words[0]["start"],
+                "end": words[-1]["end"],
+                "text": text,
+                "confidence": confidence,
+                "no_speech_prob": 0.0
+            }],
+            "tier": "grammar",
+            "escalated": False
+        }
+
+    def _checkout(self, grammar: str, idle: "queue.SimpleQueue") -> Any:
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        from vosk import KaldiRecognizer
+        recognizer = KaldiRecognizer(self._get_model(), SAMPLE_RATE, grammar)
+        recognizer.SetWords(True)
+        return recognizer
+
+    def _get_model(self) -> Any:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    try:
+                        from vosk import Model, SetLogLevel
+                    except ImportError:
+                        raise RuntimeError("GRAMMAR_ENABLED requires the vosk package")
+                    SetLogLevel(-1)
+                    self._model = Model(settings.VOSK_MODEL_PATH)
+                    logger.info(f"Loaded Vosk model from {settings.VOSK_MODEL_PATH}")
+        return self._model
@@ -0,0 +1,70 @@
+import logging
+from typing import Any, Optional, Tuple
+
+from ...config import settings
+from ..cache import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Sizes with an English-only ".en" checkpoint
+ENGLISH_ONLY_SIZES = {"tiny", "base", "small", "medium"}
+
+def default_language() -> Optional[str]:
+    """Configured language, or None when Whisper should detect it"""
+    language = (settings.WHISPER_LANGUAGE or "").lower()
+    return None if language in ("", "auto") else language
+
+def route_model(model_name: str, language: Optional[str]) -> str:
+    """Model size to use for ``language``.
+
+    English goes to the ``.en`` checkpoint of the same size, which is both
+    faster and more accurate. Other languages may map to their own size via
+    ``WHISPER_LANGUAGE_MODELS``; each size gets its own pool.
+    """
+    if not language:
+        return model_name
+    if language == "en":
+        if settings.WHISPER_ENGLISH_ONLY and model_name in ENGLISH_ONLY_SIZES:
+            return f"{model_name}.en"
+        return model_name
+    return settings.WHISPER_LANGUAGE_MODELS.get(language, model_name)
+
+class LanguageRouter:
+    """Resolve the language for a request and route it to a model.
+
+    The request's declared language wins, then the language previously
+    detected for the user (cached in Redis), then ``WHISPER_LANGUAGE``.
+    Only when none is known does Whisper run language detection, and the
+    detected language is remembered for the user's next request.
+    """
+
+    KEY_PREFIX = "stt_language"
+
+    def __init__(self, cache: Any = None):
+        self.cache = cache or redis_client
+
+    async def route(
+        self,
+        model_name: str,
+        user_id: Optional[Any] = None,
+        language: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Return ``(model_name, language)``; language is None when it must be detected"""
+        language = (language or "").lower() or None
+        if language is None and user_id is not None:
+            language = await self.cache.get_json(self._key(user_id))
+        if language is None:
+            language = default_language()
+        return route_model(model_name, language), language
+
+    async def remember(self, user_id: Optional[Any], language: Optional[str]):
+        """Cache a language Whisper detected for ``user_id``"""
+        if user_id is None or not language:
+            return
+        await self.cache.set_json(self._key(user_id), language, expire=settings.LANGUAGE_CACHE_TTL)
+        logger.debug(f"Cached detected language {language} for user {user_id}")
+
+    def _key(self, user_id: Any) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+language_router = LanguageRouter()
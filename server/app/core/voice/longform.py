@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..media import SAMPLE_RATE
+from .backends import get_stt_backend
+from .vad import VoiceActivityDetector
+
+logger = logging.getLogger(__name__)
+
+MAX_OVERLAP_WORDS = 12  # Longest repeated phrase looked for at a hard cut
+
+class Window(NamedTuple):
+    start: int
+    end: int
+    overlaps_previous: bool  # Hard cut with no pause: shares audio with the previous window
+
+class LongFormTranscriber:
+    """Transcribe audio longer than Whisper's 30 s context.
+
+    Audio is split into windows of at most ``LONGFORM_WINDOW_SECONDS``,
+    cutting in the longest VAD pause inside each window's last stretch.
+    When a window has no pause at all it is hard-cut and the next window
+    re-reads ``LONGFORM_OVERLAP_MS`` of audio, with words repeated across
+    the seam dropped when stitching. All windows are submitted at once, so
+    the batcher decodes them together across the model pool.
+    """
+
+    def __init__(
+        self,
+        transcriber: Any = None,
+        window_seconds: Optional[float] = None,
+        min_window_seconds: Optional[float] = None,
+        overlap_ms: Optional[int] = None,
+        sample_rate: int = SAMPLE_RATE
+    ):
+        self.transcriber = transcriber or get_stt_backend()
+        self.sample_rate = sample_rate
+        window_seconds = window_seconds or settings.LONGFORM_WINDOW_SECONDS
+        min_window_seconds = min_window_seconds or settings.LONGFORM_MIN_WINDOW_SECONDS
+        overlap_ms = settings.LONGFORM_OVERLAP_MS if overlap_ms is None else overlap_ms
+        self.window = int(window_seconds * sample_rate)
+        self.min_window = min(int(min_window_seconds * sample_rate), self.window)
+        self.overlap = min(overlap_ms * sample_rate // 1000, self.min_window // 2)
+        self.vad = VoiceActivityDetector(sample_rate, padding_ms=0)
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        windows = self.plan_windows(audio)
+        results = await asyncio.gather(*(
+            self.transcriber.transcribe(
+                audio[w.start:w.end], model_name=model_name, language=language, profile=profile
+            )
+            for w in windows
+        ))
+        logger.debug(f"Transcribed {len(audio) / self.sample_rate:.1f}s of audio in {len(windows)} windows")
+        return self.stitch(windows, results)
+
+    def plan_windows(self, audio: np.ndarray) -> List[Window]:
+        total = len(audio)
+        if total <= self.window:
+            return [Window(0, total, False)]
+
+        mask = self.vad.speech_mask(audio)
+        frame = self.vad.frame_length
+        windows: List[Window] = []
+        start, overlaps = 0, False
+
+        while total - start > self.window:
+            cut = self._pause_cut(mask, frame, start + self.min_window, start + self.window)
+            if cut is not None:
+                windows.append(Window(start, cut, overlaps))
+                start, overlaps = cut, False
+            else:
+                end = start + self.window
+                windows.append(Window(start, end, overlaps))
+                start, overlaps = end - self.overlap, True
+
+        windows.append(Window(start, total, overlaps))
+        return windows
+
+    @staticmethod
+    def _pause_cut(mask: np.ndarray, frame: int, lo: int, hi: int) -> Optional[int]:
+        """Sample index at the middle of the longest pause within [lo, hi)"""
+        first, last = -(-lo // frame), min(hi // frame, len(mask))
+        silent = np.flatnonzero(~mask[first:last]) + first
+        if not len(silent):
+            return None
+
+        runs = np.split(silent, np.flatnonzero(np.diff(silent) > 1) + 1)
+        # Longest pause wins; among equals, the latest keeps windows full
+        best = max(reversed(runs), key=len)
+        return int((best[0] + best[-1] + 1) * frame // 2)
+
+    def stitch(self, windows: List[Window], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        segments: List[Dict[str, Any]] = []
+        languages: List[str] = []
+
+        for window, result in zip(windows, results):
+            if result.get("language"):
+                languages.append(result["language"])
+            offset = window.start / self.sample_rate
+            window_segments = [dict(s) for s in result.get("segments") or []]
+
+            if window.overlaps_previous and segments and window_segments:
+                self._drop_repeated_words(segments, window_segments)
+
+            for segment in window_segments:
+                segment["start"] = round(segment.get("start", 0.0) + offset, 3)
+                segment["end"] = round(segment.get("end", 0.0) + offset, 3)
+                if segments:
+                    segment["start"] = max(segment["start"], segments[-1]["end"])
+                if segment.get("text", "").strip():
+                    segment["id"] = len(segments)
+                    segments.append(segment)
+
+        stitched = {
+            "text": " ".join(s["text"].strip() for s in segments),
+            "language": max(set(languages), key=languages.count) if languages else None,
+            "segments": segments,
+            "windows": len(windows)
+        }
+        # Keep the cascade's report: any escalated window means the larger tier answered
+        tiered = [r for r in results if "tier" in r]
+        if tiered:
+            escalated = [r for r in tiered if r.get("escalated")]
+            stitched["tier"] = (escalated or tiered)[0]["tier"]
+            stitched["escalated"] = bool(escalated)
+        return stitched
+
+    @staticmethod
+    def _drop_repeated_words(previous: List[Dict[str, Any]], current: List[Dict[str, Any]]):
+        """Remove words at the start of ``current`` already heard at the end of ``previous``"""
+        tail = " ".join(s["text"] for s in previous[-3:]).split()[-MAX_OVERLAP_WORDS:]
+        head_text = current[0].get("text", "")
+        head = head_text.split()
+
+        def norm(words: List[str]) -> List[str]:
+            return [re.sub(r"[^\w']", "", w.lower()) for w in words]
+
+        tail_norm, head_norm = norm(tail), norm(head[:MAX_OVERLAP_WORDS])
+        for k in range(min(len(tail_norm), len(head_norm)), 0, -1):
+            if tail_norm[-k:] == head_norm[:k]:
+                current[0]["text"] = " ".join(head[k:])
+                return
@@ -0,0 +1,183 @@
+import asyncio
+import copy
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import torch
+import whisper
+
+from ...config import settings
+from ..cancellation import check_cancelled
+from .backends import configured_model_names
+from .quantization import load_quantized_model
+from .weights import load_mapped_model
+
+logger = logging.getLogger(__name__)
+
+def _check_cancelled(module: Any, args: Any):
+    check_cancelled()
+
+def install_cancellation_checks(model: Any):
+    """Abort a decode at the next encoder pass or decoder step once its
+    executor job is cancelled (see ``run_cancellable``)"""
+    model.encoder.register_forward_pre_hook(_check_cancelled)
+    model.decoder.register_forward_pre_hook(_check_cancelled)
+
+class WhisperModelPool:
+    """Process-wide pool of Whisper models with checkout/checkin semantics.
+
+    Each configured model size is loaded from disk once per process and
+    replicated ``WHISPER_POOL_REPLICAS`` times in memory. Callers borrow a
+    replica for the duration of a single transcription.
+    """
+
+    def __init__(self):
+        self._replicas: Dict[str, List[Any]] = {}
+        self._free: Dict[str, asyncio.Queue] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.device = settings.WHISPER_DEVICE
+
+    @property
+    def model_names(self) -> List[str]:
+        return configured_model_names()
+
+    async def init(self, model_names: Optional[List[str]] = None):
+        """Load every configured model size. Safe to call more than once."""
+        for name in model_names or self.model_names:
+            await self._ensure_loaded(name)
+        logger.info(f"Whisper model pool ready: {self.stats()}")
+
+    def preload(self, model_names: Optional[List[str]] = None):
+        """Load weights synchronously, before any event loop exists.
+
+        The pre-fork server calls this in the gunicorn master; workers
+        inherit the replicas and only build their free-lists on first use,
+        so weight pages stay shared copy-on-write.
+        """
+        for name in model_names or self.model_names:
+            if name not in self._replicas:
+                self._replicas[name] = self._load_replicas(name)
+
+    async def close(self):
+        """Release all replicas"""
+        self._replicas.clear()
+        self._free.clear()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info("Whisper model pool closed")
+
+    async def checkout(self, name: Optional[str] = None) -> Any:
+        """Borrow a replica of ``name``, waiting until one is free"""
+        name = name or settings.WHISPER_MODEL
+        await self._ensure_loaded(name)
+        return await self._free[name].get()
+
+    def checkin(self, name: Optional[str], model: Any):
+        """Return a replica obtained from :meth:`checkout`"""
+        name = name or settings.WHISPER_MODEL
+        if name in self._free:
+            self._free[name].put_nowait(model)
+
+    @asynccontextmanager
+    async def acquire(self, name: Optional[str] = None) -> AsyncIterator[Any]:
+        model = await self.checkout(name)
+        try:
+            yield model
+        finally:
+            self.checkin(name, model)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {
+                "replicas": len(replicas),
+                "available": self._free[name].qsize() if name in self._free else 0
+            }
+            for name, replicas in self._replicas.items()
+        }
+
+    async def _ensure_loaded(self, name: str):
+        self._bind_loop()
+        if name in self._free:
+            return
+
+        async with self._lock:
+            if name in self._free:
+                return
+            if name not in self._replicas:
+                self._replicas[name] = await asyncio.get_running_loop().run_in_executor(
+                    None, self._load_replicas, name
+                )
+            self._free[name] = self._new_queue(self._replicas[name])
+
+    def _bind_loop(self):
+        """Rebuild loop-bound primitives when called from a new event loop.
+
+        Celery tasks run each job under a fresh ``asyncio.run`` loop, so the
+        free-lists are recreated while the loaded weights are kept.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._free = {
+            name: self._new_queue(replicas)
+            for name, replicas in self._replicas.items()
+        }
+
+    @staticmethod
+    def _new_queue(replicas: List[Any]) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        for replica in replicas:
+            queue.put_nowait(replica)
+        return queue
+
+    def _load_replicas(self, name: str) -> List[Any]:
+        if self.device == "cuda" and not torch.cuda.is_available():
+            logger.warning("CUDA not available, falling back to CPU")
+            self.device = "cpu"
+
+        quantization = settings.WHISPER_QUANTIZATION
+        if quantization != "none" and self.device != "cpu":
+            logger.warning(f"WHISPER_QUANTIZATION={quantization} needs CPU inference, loading fp32 on {self.device}")
+            quantization = "none"
+
+        # Mapped replicas each map the same file, so their weight pages stay
+        # shared; a deepcopy would give every replica a private copy
+        mapped = quantization == "none" and settings.WHISPER_MMAP_WEIGHTS
+        try:
+            if quantization != "none":
+                model = load_quantized_model(name, quantization, settings.WHISPER_MODEL_DIR)
+            elif mapped:
+                model = load_mapped_model(name, settings.WHISPER_MODEL_DIR, self.device)
+            else:
+                model = whisper.load_model(
+                    name,
+                    device=self.device,
+                    download_root=settings.WHISPER_MODEL_DIR
+                )
+            model.eval()
+            install_cancellation_checks(model)
+
+            replicas = [model]
+            for _ in range(max(settings.WHISPER_POOL_REPLICAS, 1) - 1):
+                if mapped:
+                    replica = load_mapped_model(name, settings.WHISPER_MODEL_DIR, self.device)
+                    replica.eval()
+                    install_cancellation_checks(replica)
+                else:
+                    replica = copy.deepcopy(model)
+                replicas.append(replica)
+        except Exception as e:
+            logger.error(f"Failed to load Whisper model {name}: {str(e)}")
+            raise RuntimeError(f"Could not initialize Whisper model: {str(e)}")
+
+        logger.info(
+            f"Loaded Whisper model {name} on {self.device} "
+            f"(quantization={quantization}, {len(replicas)} replicas)"
+        )
+        return replicas
+
+model_pool = WhisperModelPool()
@@ -1,42 +1,81 @@
-import whisper
+import hashlib
 import torch
 import numpy as np
 from typing import Optional, Dict, Any
 import logging
+from datetime import datetime
 from ...config import settings
 from .encoder import AudioEncoder
-from .validator import AudioValidator
-from ..cache import AsyncRedisCache
+from .backends import get_transcriber
+from .fingerprint import fingerprint_cache
+from ..cache import redis_client
+from ..deadline import require_budget, within_budget
+from .language import language_router, route_model
+from .longform import LongFormTranscriber
+from .profiles import fit_to_budget, resolve_profile
 
 logger = logging.getLogger(__name__)
 
 class VoiceProcessor:
     def __init__(self):
-        self.model = whisper.load_model(settings.WHISPER_MODEL)
+        self.batcher = get_transcriber()
+        self.long_form = LongFormTranscriber(self.batcher)
+        self.language_router = language_router
+        self.fingerprints = fingerprint_cache
         self.device = torch.device(settings.WHISPER_DEVICE)
         self.encoder = AudioEncoder()
-        self.validator = AudioValidator()
-        self.cache = AsyncRedisCache()
-        self.model.to(self.device)
-        logger.info(f"Voice processor initialized with {settings.WHISPER_MODEL} model on {self.device}")
+        self.cache = redis_client
+        logger.info(f"Voice processor initialized with {settings.WHISPER_MODEL} on the {settings.STT_BACKEND} backend")
 
-    async def process_audio(self, audio_data: bytes, user_id: str) -> Dict[str, Any]:
-        """Process audio data and return transcription and metadata"""
+    async def process_audio(
+        self,
+        audio_data: bytes,
+        user_id: str,
+        long_form: bool = False,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Process audio data and return transcription and metadata.
+
+        ``long_form`` keeps audio past 30 s and transcribes it in parallel windows.
+        ``language`` is the declared language, otherwise the user's cached one.
+        ``profile`` names the decode profile; long-form defaults to dictation.
+        A latency budget too tight for it degrades to the small model.
+        """
         try:
+            decode_profile = resolve_profile(profile, long_form=long_form)
+
+            # Route by language first: the cached transcript must come from the
+            # model and language this user's request would be decoded with
+            model_name, language = await self.language_router.route(settings.WHISPER_MODEL, user_id, language)
+
             # Check cache first
-            cache_key = f"voice_process:{self._generate_audio_hash(audio_data)}"
-            cached_result = await self.cache.get(cache_key)
+            mode = "long" if long_form else "short"
+            audio_hash = self._generate_audio_hash(audio_data)
+            cache_key = self._result_key(mode, decode_profile.name, model_name, language, audio_hash)
+            cached_result = await self.cache.get_json(cache_key)
             if cached_result:
                 return cached_result
 
-            # Validate audio
-            self.validator.validate(audio_data)
-            
-            # Encode audio for model
-            audio_array = self.encoder.encode(audio_data)
+            # Decode and validate audio for model
+            require_budget("decode")
+            audio_array, audio_metadata = self.encoder.encode_with_metadata(audio_data, long_form=long_form)
             
             # Process with Whisper
-            result = await self._transcribe(audio_array)
+            model_name, decode_profile, degraded = fit_to_budget(model_name, language, decode_profile)
+
+            # Repeated short commands reuse the transcript of a near-identical clip
+            scope = f"{decode_profile.name}:{language or 'auto'}"
+            print_ = None if long_form else self.fingerprints.sketch(audio_array)
+            result = await self.fingerprints.lookup(user_id, scope, print_)
+            if result is None:
+                result = await within_budget(self._transcribe(
+                    audio_array, model_name, language, decode_profile.name, long_form=long_form
+                ), "transcribe")
+                if not degraded:
+                    await self.fingerprints.store(user_id, scope, print_, result)
+            if language is None:
+                await self.language_router.remember(user_id, result["language"])
             
             # Add metadata
             processed_result = {
@@ -45,14 +84,26 @@ class VoiceProcessor:
                 "segments": result["segments"],
                 "confidence": float(result["segments"][0]["confidence"]) if result["segments"] else 0.0,
                 "processing_metadata": {
-                    "model": settings.WHISPER_MODEL,
+                    "model": result.get("tier", model_name),
+                    "profile": decode_profile.name,
+                    "escalated": result.get("escalated", False),
+                    "degraded": degraded,
+                    "windows": result.get("windows", 1),
                     "device": str(self.device),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.utcnow().isoformat(),
+                    **audio_metadata
                 }
             }
 
-            # Cache result
-            await self.cache.set(cache_key, processed_result, expire=3600)
+            # Cache result; a degraded answer is not what the key asked for. A
+            # detected language is routed to next time, so the result is also
+            # filed under that language when it routes to the same model.
+            if not degraded:
+                await self.cache.set_json(cache_key, processed_result, expire=3600)
+                detected = result["language"]
+                if language is None and detected and route_model(model_name, detected) == model_name:
+                    detected_key = self._result_key(mode, decode_profile.name, model_name, detected, audio_hash)
+                    await self.cache.set_json(detected_key, processed_result, expire=3600)
             
             return processed_result
 
@@ -60,29 +111,34 @@ class VoiceProcessor:
             logger.error(f"Voice processing failed: {str(e)}")
             raise
 
-    async def _transcribe(self, audio_array: np.ndarray) -> Dict[str, Any]:
+    async def _transcribe(
+        self,
+        audio_array: np.ndarray,
+        model_name: str,
+        language: Optional[str],
+        profile: str,
+        long_form: bool = False
+    ) -> Dict[str, Any]:
         """Transcribe audio using Whisper model"""
         try:
-            with torch.no_grad():
-                result = self.model.transcribe(
-                    audio_array,
-                    language=settings.WHISPER_LANGUAGE,
-                    task="transcribe"
-                )
-            return result
+            transcriber = self.long_form if long_form else self.batcher
+            return await transcriber.transcribe(
+                audio_array,
+                model_name=model_name,
+                language=language,
+                profile=profile
+            )
         except Exception as e:
             logger.error(f"Transcription failed: {str(e)}")
             raise
 
+    @staticmethod
+    def _result_key(mode: str, profile: str, model_name: str, language: Optional[str], audio_hash: str) -> str:
+        return f"voice_process:{mode}:{profile}:{model_name}:{language or 'auto'}:{audio_hash}"
+
     def _generate_audio_hash(self, audio_data: bytes) -> str:
         """Generate a hash for audio data for caching"""
         return hashlib.sha256(audio_data).hexdigest()
 
     async def cleanup(self):
-        """Cleanup resources"""
-        try:
-            if hasattr(self, 'model'):
-                del self.model
-            torch.cuda.empty_cache()
-        except Exception as e:
-            logger.error(f"Cleanup failed: {str(e)}")
+        """Cleanup resources. Pooled models outlive the processor."""
@@ -0,0 +1,105 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ...config import settings
+from ..deadline import fits_budget, require_budget
+from .backends import configured_model_names
+from .language import route_model
+
+class DecodeProfile(NamedTuple):
+    """Decoding strategy applied by every STT backend"""
+    name: str
+    beam_size: Optional[int]  # None decodes greedily
+    best_of: Optional[int]  # Samples drawn at temperatures above zero
+    temperatures: Tuple[float, ...]  # Fallback ladder; one entry disables fallback
+    condition_on_previous_text: bool
+    sample_len: Optional[int]  # Maximum tokens per window
+    compression_ratio_threshold: Optional[float] = 2.4
+    logprob_threshold: Optional[float] = -1.0
+    no_speech_threshold: Optional[float] = 0.6
+
+    def transcribe_options(self) -> Dict[str, Any]:
+        """Keyword arguments for ``whisper``'s ``model.transcribe``"""
+        return {
+            "temperature": self.temperatures,
+            "beam_size": self.beam_size,
+            "best_of": self.best_of,
+            "sample_len": self.sample_len,
+            "condition_on_previous_text": self.condition_on_previous_text,
+            "compression_ratio_threshold": self.compression_ratio_threshold,
+            "logprob_threshold": self.logprob_threshold,
+            "no_speech_threshold": self.no_speech_threshold
+        }
+
+    def needs_fallback(self, result: Any) -> bool:
+        """Whether a decode at one temperature should be retried at the next"""
+        if self.no_speech_threshold is not None and result.no_speech_prob > self.no_speech_threshold:
+            return False  # Silence; a hotter retry would only hallucinate
+        if self.compression_ratio_threshold is not None and result.compression_ratio > self.compression_ratio_threshold:
+            return True
+        return self.logprob_threshold is not None and result.avg_logprob < self.logprob_threshold
+
+PROFILES: Dict[str, DecodeProfile] = {
+    # Whisper's own transcribe() defaults: greedy, with the temperature fallback ladder
+    "default": DecodeProfile(
+        name="default",
+        beam_size=None,
+        best_of=5,
+        temperatures=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        condition_on_previous_text=True,
+        sample_len=None
+    ),
+    # Short voice commands: one greedy pass with no retry loop, so latency stays flat
+    "command": DecodeProfile(
+        name="command",
+        beam_size=None,
+        best_of=None,
+        temperatures=(0.0,),
+        condition_on_previous_text=False,
+        sample_len=settings.COMMAND_MAX_TOKENS
+    ),
+    # Dictation and notes: beam search with Whisper's temperature fallback
+    "dictation": DecodeProfile(
+        name="dictation",
+        beam_size=5,
+        best_of=5,
+        temperatures=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        condition_on_previous_text=True,
+        sample_len=None
+    )
+}
+
+def get_profile(name: Optional[str] = None) -> DecodeProfile:
+    name = name or settings.WHISPER_DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown decode profile: {name} (expected one of {', '.join(PROFILES)})")
+    return PROFILES[name]
+
+def resolve_profile(name: Optional[str] = None, long_form: bool = False) -> DecodeProfile:
+    """Profile for a request; long-form audio defaults to dictation"""
+    if name is None and long_form:
+        name = "dictation"
+    return get_profile(name)
+
+def fit_to_budget(
+    model_name: str,
+    language: Optional[str],
+    profile: DecodeProfile,
+    expected: Optional[float] = None
+) -> Tuple[str, DecodeProfile, bool]:
+    """Model and profile that fit the current latency budget.
+
+    When the requested decode is expected (``expected`` seconds, default
+    ``DEADLINE_STT_ESTIMATE_MS``) to overrun the deadline, fall back to the
+    ``command`` profile, on the cascade's small model when that is already
+    loaded (loading it would cost more than the decode saves); abort when
+    not even that can start. Returns ``(model_name, profile, degraded)``.
+    """
+    if expected is None:
+        expected = settings.DEADLINE_STT_ESTIMATE_MS / 1000
+    if fits_budget(expected):
+        return model_name, profile, False
+    require_budget("transcribe")
+    fallback = route_model(settings.WHISPER_CASCADE_MODEL, language)
+    if fallback not in configured_model_names():
+        fallback = model_name
+    return fallback, PROFILES["command"], True
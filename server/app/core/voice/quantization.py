@@ -0,0 +1,77 @@
+import logging
+import os
+from typing import Any
+
+import torch
+import whisper
+from torch import nn
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SCHEMES = ("none", "int8")
+
+def cache_path(name: str, scheme: str, model_dir: str) -> str:
+    """Location of the serialized quantized model.
+
+    The torch version is part of the name because packed int8 weights are
+    not guaranteed to unpickle across releases.
+    """
+    return os.path.join(model_dir, f"{name}.{scheme}.torch-{torch.__version__}.pt")
+
+def load_quantized_model(name: str, scheme: str, model_dir: str) -> Any:
+    """Load ``name`` with dynamic ``scheme`` quantization, reusing the disk cache.
+
+    Dynamic quantization only has CPU kernels, so the model always lives on
+    the CPU.
+    """
+    if scheme not in SUPPORTED_SCHEMES or scheme == "none":
+        raise ValueError(f"Unsupported Whisper quantization: {scheme}")
+
+    path = cache_path(name, scheme, model_dir)
+    if os.path.exists(path):
+        try:
+            model = torch.load(path, map_location="cpu", weights_only=False)
+            model.eval()
+            logger.info(f"Loaded cached {scheme} Whisper model from {path}")
+            return model
+        except Exception as e:
+            logger.warning(f"Discarding unreadable quantized cache {path}: {str(e)}")
+
+    model = whisper.load_model(name, device="cpu", download_root=model_dir)
+    model = quantize_dynamic(model)
+    _save_atomic(model, path)
+    logger.info(f"Quantized Whisper model {name} to {scheme} and cached it at {path}")
+    return model
+
+def quantize_dynamic(model: nn.Module) -> nn.Module:
+    """Apply int8 dynamic quantization to every linear layer"""
+    model.eval()
+    _replace_linear_subclasses(model)
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+def _replace_linear_subclasses(module: nn.Module):
+    """Swap Whisper's ``Linear`` subclass for ``nn.Linear``.
+
+    Dynamic quantization matches module types exactly, so subclasses would be
+    skipped. Whisper's subclass only casts weights to the input dtype, which
+    is a no-op for fp32 CPU inference.
+    """
+    for child_name, child in module.named_children():
+        if isinstance(child, nn.Linear) and type(child) is not nn.Linear:
+            plain = nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+            plain.weight = child.weight
+            plain.bias = child.bias
+            setattr(module, child_name, plain)
+        else:
+            _replace_linear_subclasses(child)
+
+def _save_atomic(model: nn.Module, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        torch.save(model, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not cache quantized model at {path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
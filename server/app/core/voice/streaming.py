@@ -0,0 +1,203 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..media import SAMPLE_RATE
+from ..resampler import StreamingResampler
+from ..interfaces import STTBackend
+from .backends import get_stt_backend
+from .language import default_language, route_model
+from .profiles import get_profile
+
+logger = logging.getLogger(__name__)
+
+EventCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+FRAME_SAMPLES = SAMPLE_RATE // 50  # 20 ms energy frames
+MAX_SEGMENT_SAMPLES = 30 * SAMPLE_RATE  # Whisper's context window
+STREAM_SAMPLE_RATES = frozenset({8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000})
+
+def parse_sample_rate(value: Any) -> int:
+    """The ``sample_rate`` a client declared for its stream, validated"""
+    if value is None:
+        return SAMPLE_RATE
+    try:
+        rate = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid sample rate: {value!r}")
+    if isinstance(value, bool) or rate not in STREAM_SAMPLE_RATES:
+        supported = ", ".join(str(r) for r in sorted(STREAM_SAMPLE_RATES))
+        raise ValueError(f"Unsupported sample rate {value!r}, expected one of {supported}")
+    return rate
+
+class StreamingTranscriber:
+    """Incremental transcription of a live PCM stream for one connection.
+
+    Binary frames (16-bit little-endian mono PCM) are appended to a rolling
+    buffer holding the current utterance. Every ``STREAM_PARTIAL_INTERVAL_MS``
+    of new audio the buffer is re-decoded in the background and a
+    ``partial`` event is emitted. Once ``STREAM_SILENCE_MS`` of trailing
+    silence follows speech (or the buffer reaches 30 s), the utterance is
+    decoded one last time, a ``final`` event is emitted and the buffer resets.
+    """
+
+    def __init__(
+        self,
+        on_event: EventCallback,
+        batcher: Optional[STTBackend] = None,
+        sample_rate: int = SAMPLE_RATE,
+        language: Optional[str] = None,
+        profile: Optional[str] = None
+    ):
+        self.on_event = on_event
+        self.batcher = batcher or get_stt_backend()
+        self.sample_rate = sample_rate
+        self.resampler = StreamingResampler(sample_rate, SAMPLE_RATE) if sample_rate != SAMPLE_RATE else None
+        self.language = language or default_language()
+        self.model_name = route_model(settings.WHISPER_MODEL, self.language)
+        self.profile = get_profile(profile).name
+        self.partial_samples = settings.STREAM_PARTIAL_INTERVAL_MS * SAMPLE_RATE // 1000
+        self.silence_samples = settings.STREAM_SILENCE_MS * SAMPLE_RATE // 1000
+        self.silence_threshold = settings.STREAM_SILENCE_THRESHOLD
+
+        self._chunks: List[np.ndarray] = []
+        self._samples = 0
+        self._since_partial = 0
+        self._trailing_silence = 0
+        self._has_speech = False
+        self._offset = 0.0  # Stream time at which the current utterance began
+        self._generation = 0
+        self._partial_task: Optional[asyncio.Task] = None
+
+    async def push(self, frame: bytes):
+        """Append a PCM frame and emit events that are now due"""
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32) / 32768.0
+        if self.resampler:
+            samples = self.resampler.process(samples)
+        if not len(samples):
+            return
+
+        self._append(samples)
+        if self._has_speech and self._trailing_silence >= self.silence_samples:
+            await self.finalize()
+        elif self._samples >= MAX_SEGMENT_SAMPLES:
+            await self.finalize()
+        elif self._has_speech and self._since_partial >= self.partial_samples:
+            self._schedule_partial()
+
+    async def end(self):
+        """The client ended the stream: decode everything it sent.
+
+        The resampler's filter delay still holds the last few milliseconds
+        of audio; they are drained into the utterance before the final
+        decode, and a fresh resampler serves any audio sent afterwards.
+        """
+        if self.resampler:
+            tail = self.resampler.flush()
+            self.resampler = StreamingResampler(self.sample_rate, SAMPLE_RATE)
+            if len(tail):
+                self._append(tail)
+        await self.finalize()
+
+    async def finalize(self):
+        """Decode the buffered utterance and emit a ``final`` event"""
+        audio = self._take_buffer()
+        if audio is None:
+            return
+
+        start = self._offset
+        self._offset += len(audio) / SAMPLE_RATE
+        speech = audio[:len(audio) - min(self._trailing_silence, len(audio))]
+        self._trailing_silence = 0
+
+        result = await self.batcher.transcribe(
+            speech, model_name=self.model_name, language=self.language, profile=self.profile
+        )
+        await self.on_event(self._event("final", result, start, start + len(speech) / SAMPLE_RATE))
+
+    async def close(self):
+        self._generation += 1
+        if self._partial_task and not self._partial_task.done():
+            self._partial_task.cancel()
+            try:
+                await self._partial_task
+            except asyncio.CancelledError:
+                pass
+
+    def _append(self, samples: np.ndarray):
+        self._chunks.append(samples)
+        self._samples += len(samples)
+        self._since_partial += len(samples)
+        self._track_silence(samples)
+
+    def _take_buffer(self) -> Optional[np.ndarray]:
+        """Detach the current utterance and invalidate in-flight partials"""
+        self._generation += 1
+        audio = np.concatenate(self._chunks) if self._chunks else None
+        had_speech = self._has_speech
+
+        self._chunks = []
+        self._samples = 0
+        self._since_partial = 0
+        self._has_speech = False
+
+        if audio is not None and not had_speech:
+            self._offset += len(audio) / SAMPLE_RATE
+            self._trailing_silence = 0
+            return None
+        return audio
+
+    def _track_silence(self, samples: np.ndarray):
+        usable = len(samples) - len(samples) % FRAME_SAMPLES
+        if not usable:
+            # Too short to frame; judge the fragment as a whole
+            voiced = np.sqrt(np.mean(samples ** 2)) >= self.silence_threshold
+            self._trailing_silence = 0 if voiced else self._trailing_silence + len(samples)
+            self._has_speech |= bool(voiced)
+            return
+
+        frames = samples[:usable].reshape(-1, FRAME_SAMPLES)
+        voiced = np.flatnonzero(np.sqrt(np.mean(frames ** 2, axis=1)) >= self.silence_threshold)
+        if len(voiced):
+            self._has_speech = True
+            self._trailing_silence = len(samples) - (voiced[-1] + 1) * FRAME_SAMPLES
+        else:
+            self._trailing_silence += len(samples)
+
+    def _schedule_partial(self):
+        if self._partial_task and not self._partial_task.done():
+            return
+        self._since_partial = 0
+        audio = np.concatenate(self._chunks)
+        self._partial_task = asyncio.get_running_loop().create_task(
+            self._emit_partial(self._generation, audio)
+        )
+
+    async def _emit_partial(self, generation: int, audio: np.ndarray):
+        try:
+            result = await self.batcher.transcribe(
+                audio, model_name=self.model_name, language=self.language, profile=self.profile
+            )
+        except Exception as e:
+            logger.error(f"Partial transcription failed: {str(e)}")
+            return
+        # Drop partials that were overtaken by a final for the same utterance
+        if generation == self._generation:
+            await self.on_event(
+                self._event("partial", result, self._offset, self._offset + len(audio) / SAMPLE_RATE)
+            )
+
+    @staticmethod
+    def _event(kind: str, result: Dict[str, Any], start: float, end: float) -> Dict[str, Any]:
+        segments = result.get("segments") or []
+        return {
+            "type": kind,
+            "text": result["text"],
+            "language": result.get("language"),
+            "confidence": float(np.mean([s["confidence"] for s in segments])) if segments else 0.0,
+            "start": round(start, 3),
+            "end": round(end, 3)
+        }
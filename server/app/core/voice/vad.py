@@ -0,0 +1,115 @@
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ...config import settings
+from ..media import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+class VoiceActivityDetector:
+    """Frame energy / zero-crossing VAD used to compact audio before Whisper.
+
+    Frames are voiced when their RMS clears an adaptive threshold derived
+    from the clip's noise floor, estimated from its quietest frames and
+    capped so a clip that is nearly all speech does not mistake soft speech
+    for noise. Frames with a high zero-crossing rate that still sit clearly
+    above the floor are kept as unvoiced consonants; hiss at the floor is
+    not. Leading and trailing silence is
+    trimmed and internal pauses longer than ``max_pause_ms`` are shortened
+    to that length.
+    """
+
+    FRAME_MS = 30
+    QUIET_FRACTION = 0.05  # Share of frames, the quietest, the noise floor is read from
+    MAX_NOISE_FLOOR = 0.005  # Quietest frames louder than this are speech, not noise
+    ENERGY_RATIO = 3.0  # Voiced frames sit this far above the noise floor
+    MIN_ENERGY = 0.01  # Absolute floor for normalized audio
+    UNVOICED_FLOOR_RATIO = 2.0  # Unvoiced frames must clear the measured floor by this much
+    MIN_UNVOICED_ENERGY = 0.003
+    UNVOICED_ZCR = 0.25
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        max_pause_ms: int = None,
+        padding_ms: int = None
+    ):
+        self.sample_rate = sample_rate
+        self.frame_length = sample_rate * self.FRAME_MS // 1000
+        max_pause_ms = settings.VAD_MAX_PAUSE_MS if max_pause_ms is None else max_pause_ms
+        padding_ms = settings.VAD_PADDING_MS if padding_ms is None else padding_ms
+        self.max_pause_frames = max(max_pause_ms // self.FRAME_MS, 1)
+        self.padding_frames = padding_ms // self.FRAME_MS
+
+    def speech_mask(self, audio: np.ndarray) -> np.ndarray:
+        """Boolean speech decision for each complete frame"""
+        n_frames = len(audio) // self.frame_length
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+
+        frames = audio[:n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+        energy = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+        quietest = np.sort(energy)[:max(int(n_frames * self.QUIET_FRACTION), 1)]
+        noise_floor = float(np.median(quietest))
+        threshold = max(min(noise_floor, self.MAX_NOISE_FLOOR) * self.ENERGY_RATIO, self.MIN_ENERGY)
+        voiced = energy >= threshold
+        unvoiced_threshold = max(noise_floor * self.UNVOICED_FLOOR_RATIO, self.MIN_UNVOICED_ENERGY)
+        unvoiced = (energy >= unvoiced_threshold) & (zcr >= self.UNVOICED_ZCR)
+        mask = voiced | unvoiced
+
+        if self.padding_frames and mask.any():
+            window = np.ones(2 * self.padding_frames + 1)
+            mask = np.convolve(mask, window, mode="same") > 0
+        return mask
+
+    def compact(self, audio: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Trim edge silence and collapse long pauses.
+
+        Returns the compacted audio and metadata including ``speech_ratio``.
+        """
+        original_duration = len(audio) / self.sample_rate
+        mask = self.speech_mask(audio)
+        speech_frames = int(mask.sum())
+
+        if speech_frames == 0:
+            # Nothing confidently voiced: leave the clip for Whisper's own no-speech check
+            return audio, {
+                "speech_ratio": 0.0,
+                "original_duration": original_duration,
+                "compacted_duration": original_duration
+            }
+
+        keep = mask.copy()
+        speech_idx = np.flatnonzero(mask)
+        first, last = speech_idx[0], speech_idx[-1]
+
+        # Internal pauses: keep at most max_pause_frames, split around the gap
+        gaps = np.flatnonzero(np.diff(speech_idx) > 1)
+        head = self.max_pause_frames // 2
+        tail = self.max_pause_frames - head
+        for gap in gaps:
+            start, end = speech_idx[gap] + 1, speech_idx[gap + 1]
+            if end - start <= self.max_pause_frames:
+                keep[start:end] = True
+            else:
+                keep[start:start + head] = True
+                keep[end - tail:end] = True
+
+        keep[:first] = False
+        keep[last + 1:] = False
+
+        sample_keep = np.repeat(keep, self.frame_length)
+        compacted = audio[:len(sample_keep)][sample_keep]
+        if last == len(mask) - 1:
+            # Speech runs into the partial frame at the end of the clip
+            compacted = np.concatenate([compacted, audio[len(sample_keep):]])
+
+        return compacted, {
+            "speech_ratio": round(speech_frames / len(mask), 3),
+            "original_duration": original_duration,
+            "compacted_duration": len(compacted) / self.sample_rate
+        }
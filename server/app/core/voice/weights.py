@@ -0,0 +1,91 @@
+import json
+import logging
+import os
+from dataclasses import asdict
+from typing import Any
+
+import numpy as np
+import torch
+import whisper
+from safetensors import safe_open
+from safetensors.torch import load_file, save_file
+from whisper.model import ModelDimensions, Whisper
+
+logger = logging.getLogger(__name__)
+
+def cache_path(name: str, model_dir: str) -> str:
+    """Location of the converted fp32 weights for checkpoint ``name``"""
+    return os.path.join(model_dir, f"{name}.safetensors")
+
+def load_mapped_model(name: str, model_dir: str, device: str = "cpu") -> Any:
+    """Load ``name`` from its safetensors cache, converting it on first use.
+
+    ``load_file`` maps the file (privately, copy-on-write) rather than
+    reading it, and the module is built on the meta device, so nothing is
+    allocated or initialized up front: weight pages are faulted in from the
+    page cache on first use and shared by every process that maps the same
+    file. On CUDA the weights are copied to the device once mapped.
+    """
+    path = cache_path(name, model_dir)
+    if os.path.exists(path):
+        try:
+            return _map_to(path, name, device)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable weight cache {path}: {str(e)}")
+
+    # Convert on CPU, then map the new file: even the first boot (and the
+    # pre-fork master) gets file-backed weights rather than a private copy
+    model = whisper.load_model(name, device="cpu", download_root=model_dir)
+    if not _save_atomic(model, path):
+        return model.to(device) if device != "cpu" else model
+    del model
+    return _map_to(path, name, device)
+
+def _map_to(path: str, name: str, device: str) -> Whisper:
+    model = _map(path, name)
+    logger.info(f"Mapped Whisper model {name} from {path}")
+    return model.to(device) if device != "cpu" else model
+
+def _map(path: str, name: str) -> Whisper:
+    with safe_open(path, framework="pt") as f:
+        dims = ModelDimensions(**json.loads(f.metadata()["dims"]))
+    state = load_file(path, device="cpu")
+
+    try:
+        with torch.device("meta"):
+            model = Whisper(dims)
+    except Exception:
+        model = Whisper(dims)  # Meta build unsupported here: allocate, then replace
+    model.load_state_dict(state, assign=True)
+    _rebuild_buffers(model, name)
+    return model
+
+def _save_atomic(model: Whisper, path: str) -> bool:
+    """Write the fp32 weights in safetensors layout, with the dimensions as
+    metadata. Returns whether the cache was written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        state = {key: tensor.detach().cpu().contiguous() for key, tensor in model.state_dict().items()}
+        save_file(state, tmp_path, metadata={"dims": json.dumps(asdict(model.dims))})
+        os.replace(tmp_path, path)
+        logger.info(f"Cached Whisper weights for memory mapping at {path}")
+        return True
+    except Exception as e:
+        logger.warning(f"Could not cache Whisper weights at {path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return False
+
+def _rebuild_buffers(model: Whisper, name: str):
+    """Recreate on CPU the buffers ``state_dict`` leaves out, which the meta
+    build left without storage"""
+    n_ctx = model.dims.n_text_ctx
+    mask = torch.empty(n_ctx, n_ctx).fill_(-np.inf).triu_(1)
+    model.decoder.register_buffer("mask", mask, persistent=False)
+
+    heads = torch.zeros(model.dims.n_text_layer, model.dims.n_text_head, dtype=torch.bool)
+    heads[model.dims.n_text_layer // 2:] = True
+    model.register_buffer("alignment_heads", heads.to_sparse(), persistent=False)
+    if name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[name])
@@ -1,8 +1,14 @@
+import hashlib
 import json
-from typing import Dict, List, Optional
+import logging
+import pickle
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel
 import os
 
+logger = logging.getLogger(__name__)
+
 class Voice(BaseModel):
     id: str
     name: str
@@ -19,21 +25,67 @@ class Voice(BaseModel):
     tempo: Optional[str] = None
     texture: Optional[str] = None
 
+INDEXED_FIELDS = ("language_code", "gender", "style", "voice_engine")
+SNAPSHOT_VERSION = 1
+
 class VoiceRegistry:
-    def __init__(self, voice_file_path: str):
-        self.voices: Dict[str, Voice] = {}
-        self.load_voices(voice_file_path)
+    """Voice catalogue with per-attribute indexes.
+
+    The JSON catalogue is validated once and compiled into a binary
+    snapshot next to it (``<catalogue>.snapshot``); later processes load
+    the snapshot instead, skipping JSON parsing and validation. Nothing is
+    read until the catalogue is first used.
+    """
+
+    def __init__(self, voice_file_path: str, snapshot_path: Optional[str] = None):
+        if not os.path.exists(voice_file_path):
+            raise FileNotFoundError(f"Voice configuration file not found: {voice_file_path}")
+        self.file_path = voice_file_path
+        self.snapshot_path = snapshot_path or f"{voice_file_path}.snapshot"
+        self._voices: Optional[Dict[str, Voice]] = None
+        self._index: Dict[str, Dict[str, List[str]]] = {}
+        self._default: Optional[Voice] = None
+        self.etag = ""
+
+    @property
+    def voices(self) -> Dict[str, Voice]:
+        if self._voices is None:
+            self.load_voices(self.file_path)
+        return self._voices
+
+    def ensure_loaded(self) -> "VoiceRegistry":
+        self.voices
+        return self
 
     def load_voices(self, file_path: str) -> None:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Voice configuration file not found: {file_path}")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            voices_data = json.load(f)
-            self.voices = {
+
+        source = _source_stamp(file_path)
+        snapshot = self._read_snapshot(source) if file_path == self.file_path else None
+        if snapshot is not None:
+            # Validated when the snapshot was compiled
+            voices = {data["id"]: Voice.model_construct(**data) for data in snapshot["voices"]}
+            self.etag = snapshot["etag"]
+        else:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            voices = {
                 voice_data["id"]: Voice(**voice_data)
-                for voice_data in voices_data
+                for voice_data in json.loads(content)
             }
+            self.etag = hashlib.sha256(content).hexdigest()[:16]
+            if file_path == self.file_path:
+                self._write_snapshot(source, voices)
+
+        self._voices = voices
+        self._index = {field: {} for field in INDEXED_FIELDS}
+        for voice in voices.values():
+            for field in INDEXED_FIELDS:
+                value = getattr(voice, field)
+                if value is not None:
+                    self._index[field].setdefault(value, []).append(voice.id)
+        self._default = None
 
     def get_voice(self, voice_id: str) -> Optional[Voice]:
         return self.voices.get(voice_id)
@@ -41,22 +93,71 @@ class VoiceRegistry:
     def list_voices(self, 
                     language: Optional[str] = None,
                     gender: Optional[str] = None,
-                    style: Optional[str] = None) -> List[Voice]:
-        filtered_voices = self.voices.values()
-        
-        if language:
-            filtered_voices = [v for v in filtered_voices if v.language_code == language]
-        if gender:
-            filtered_voices = [v for v in filtered_voices if v.gender == gender]
-        if style:
-            filtered_voices = [v for v in filtered_voices if v.style == style]
-            
-        return list(filtered_voices)
+                    style: Optional[str] = None,
+                    engine: Optional[str] = None) -> List[Voice]:
+        voices = self.voices
+        filters = {
+            "language_code": language,
+            "gender": gender,
+            "style": style,
+            "voice_engine": engine
+        }
+        matches = [self._index[field].get(value, []) for field, value in filters.items() if value]
+        if not matches:
+            return list(voices.values())
+
+        # Walk the smallest posting list, in catalogue order, checking the rest
+        matches.sort(key=len)
+        others = [set(ids) for ids in matches[1:]]
+        return [voices[voice_id] for voice_id in matches[0] if all(voice_id in ids for ids in others)]
 
     def get_default_voice(self) -> Voice:
         # Return a reliable default voice (you may want to adjust this based on your needs)
-        default_voices = [v for v in self.voices.values() 
-                         if v.language_code == "en-US" and 
-                            v.voice_engine == "PlayHT2.0" and 
-                            v.style == "narrative"]
-        return default_voices[0] if default_voices else next(iter(self.voices.values()))
+        if self._default is None:
+            default_voices = self.list_voices(language="en-US", style="narrative", engine="PlayHT2.0")
+            self._default = default_voices[0] if default_voices else next(iter(self.voices.values()))
+        return self._default
+
+    def _read_snapshot(self, source: Tuple[int, int]) -> Optional[dict]:
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable voice snapshot {self.snapshot_path}: {str(e)}")
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("source") != source:
+            return None
+        return snapshot
+
+    def _write_snapshot(self, source: Tuple[int, int], voices: Dict[str, Voice]):
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "source": source,
+            "etag": self.etag,
+            "voices": [voice.model_dump() for voice in voices.values()]
+        }
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"Could not write voice snapshot {self.snapshot_path}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+def _source_stamp(file_path: str) -> Tuple[int, int]:
+    """Size and modification time, which invalidate a compiled snapshot"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+@lru_cache(maxsize=None)
+def load_voice_registry(voice_file_path: str, snapshot_path: Optional[str] = None) -> VoiceRegistry:
+    """Process-wide registry per catalogue file, loaded on first use.
+
+    Loading it before gunicorn forks lets every worker share the parsed
+    catalogue instead of building its own.
+    """
+    return VoiceRegistry(voice_file_path, snapshot_path)
@@ -1,9 +1,9 @@
 from fastapi import WebSocket
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 import logging
 import asyncio
 from datetime import datetime
-from .metrics import websocket_connections, websocket_messages
+from .metrics import active_websocket_connections as websocket_connections, websocket_messages_total as websocket_messages
 from .cache import redis_client
 
 logger = logging.getLogger(__name__)
@@ -1,8 +1,10 @@
+from contextlib import contextmanager
+from typing import Iterator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from .config import settings
 
-SQLALCHEMY_DATABASE_URL = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_SERVER}/{settings.POSTGRES_DB}"
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -14,3 +16,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Session for one unit of work, for long-lived services that outlive a request"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,8 +1,14 @@
 from typing import Generator, AsyncGenerator
 from fastapi import Depends, HTTPException, status
+from starlette.requests import HTTPConnection
 from .database import SessionLocal
 from .core.cache import redis_client
 from .core.ai.azure_client import AzureAIClient
+from .core.command.processor import CommandProcessor
+from .core.container import ServiceContainer
+from .core.voice_registry import VoiceRegistry
+from .services.azure_ai import AzureAIService
+from .services.tts_service import TTSService
 from .services.voice import VoiceService
 from sqlalchemy.orm import Session
 import logging
@@ -17,13 +23,35 @@ async def get_db() -> AsyncGenerator[Session, None]:
     finally:
         db.close()
 
-async def get_voice_service() -> AsyncGenerator[VoiceService, None]:
+def get_services(connection: HTTPConnection) -> ServiceContainer:
+    """Dependency for the lifespan-managed service container"""
+    services = getattr(connection.app.state, "services", None)
+    if services is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Services are not initialized"
+        )
+    return services
+
+def get_voice_service(services: ServiceContainer = Depends(get_services)) -> VoiceService:
     """Dependency for voice service"""
-    service = VoiceService()
-    try:
-        yield service
-    finally:
-        await service.cleanup()
+    return services.voice_service
+
+def get_command_processor(services: ServiceContainer = Depends(get_services)) -> CommandProcessor:
+    """Dependency for command processor"""
+    return services.command_processor
+
+def get_azure_ai_service(services: ServiceContainer = Depends(get_services)) -> AzureAIService:
+    """Dependency for Azure AI service"""
+    return services.azure_ai_service
+
+def get_tts_service(services: ServiceContainer = Depends(get_services)) -> TTSService:
+    """Dependency for text-to-speech service"""
+    return services.tts_service
+
+def get_voice_registry(services: ServiceContainer = Depends(get_services)) -> VoiceRegistry:
+    """Dependency for voice registry"""
+    return services.voice_registry
 
 async def get_ai_client() -> AsyncGenerator[AzureAIClient, None]:
     """Dependency for AI client"""
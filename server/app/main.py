@@ -2,12 +2,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api.v1.api import api_router
 from .api.v1.endpoints import websocket
+from .middleware.deadline import DeadlineMiddleware
 from .middleware.logging import RequestLoggingMiddleware
 from .config import settings
 from prometheus_client import make_asgi_app
 import sentry_sdk
 from .core.performance import configure_performance
 from .core.cache import redis_client
+from .core.container import ServiceContainer
 from .core.logging import setup_logging
 from contextlib import asynccontextmanager
 
@@ -30,9 +32,12 @@ configure_performance()
 async def lifespan(app: FastAPI):
     # Startup
     await redis_client.init()
+    app.state.services = ServiceContainer()
+    await app.state.services.warm_up()
     logger.info("Application startup complete")
     yield
     # Shutdown
+    await app.state.services.shutdown()
     await redis_client.close()
     logger.info("Application shutdown complete")
 
@@ -52,6 +57,7 @@ def create_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(DeadlineMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
 
     # Mount Prometheus metrics
@@ -66,4 +72,6 @@ def create_application() -> FastAPI:
         tags=["websocket"]
     )
 
-    return app
\ No newline at end of file
+    return app
+
+app = create_application()
@@ -0,0 +1,29 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Callable
+from ..core.deadline import BUDGET_HEADER, DeadlineExceeded, deadline_scope, parse_budget
+from ..core.logging import setup_logging
+
+logger = setup_logging()
+
+class DeadlineMiddleware(BaseHTTPMiddleware):
+    """Give each request the latency budget from ``X-Request-Budget-Ms``.
+
+    Every stage downstream sees the deadline (see ``core.deadline``) and
+    degrades or aborts; a request that runs out answers 504 instead of
+    finishing work nobody is waiting for.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        try:
+            deadline = parse_budget(request.headers.get(BUDGET_HEADER))
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"detail": str(e)})
+
+        try:
+            with deadline_scope(deadline):
+                return await call_next(request)
+        except DeadlineExceeded as e:
+            logger.warning(f"Deadline exceeded for {request.method} {request.url.path}: {str(e)}")
+            return JSONResponse(status_code=504, content={"detail": str(e)})
@@ -1,19 +1,11 @@
-from prometheus_client import Counter, Histogram, generate_latest
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from ..core.metrics import http_request_duration_seconds, http_requests_total
 import time
 
-REQUEST_COUNT = Counter(
-    'http_requests_total',
-    'Total HTTP requests',
-    ['method', 'endpoint', 'status']
-)
-
-REQUEST_LATENCY = Histogram(
-    'http_request_duration_seconds',
-    'HTTP request latency',
-    ['method', 'endpoint']
-)
+# Registered once in core.metrics; a second registration fails at import
+REQUEST_COUNT = http_requests_total
+REQUEST_LATENCY = http_request_duration_seconds
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
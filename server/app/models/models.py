@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Floa
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
+from .user import User
 
 user_device = Table(
     'user_devices',
@@ -17,7 +18,7 @@ class Device(Base):
     name = Column(String)
     type = Column(String)
     last_seen = Column(DateTime(timezone=True))
-    metadata = Column(JSON)
+    device_metadata = Column("metadata", JSON)  # "metadata" is reserved by declarative classes
     users = relationship("User", secondary=user_device, back_populates="devices")
 
 class VoiceProfile(Base):
@@ -14,7 +14,7 @@ class VoiceCommand(Base):
     confidence_score = Column(Float)
     execution_time = Column(Float)  # in seconds
     response_data = Column(JSON)
-    metadata = Column(JSON)
+    command_metadata = Column("metadata", JSON)  # "metadata" is reserved by declarative classes
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from ..core.voice_registry import Voice
+
+class SpeechRequest(BaseModel):
+    text: str = Field(..., min_length=1, max_length=5000)
+    voice_id: Optional[str] = None
+    speed: float = Field(1.0, gt=0.0, le=3.0)
+    format: Optional[str] = Field(None, description="wav, mp3, ogg, flac, mulaw, pcm or opus; defaults to the Accept header")
+    sample_rate: Optional[int] = Field(None, description="Output sample rate in Hz")
+
+class VoicePage(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    next_offset: Optional[int] = None
+    voices: List[Voice]
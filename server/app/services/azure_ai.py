@@ -10,12 +10,15 @@ from azure.ai.inference.models import (
     ImageUrl, ImageDetailLevel
 )
 from azure.core.credentials import AzureKeyCredential
+from ..core.cancellation import (
+    CancellationToken, OperationCancelled, check_cancelled, current_token, run_cancellable
+)
+from ..core.deadline import fits_budget, require_budget, within_budget
 from ..core.logging import setup_logging
 from ..config import settings
+from ..core.media import image_data_url
 from datetime import datetime
-import asyncio
 from enum import Enum
-import tempfile
 
 logger = setup_logging()
 
@@ -229,9 +232,16 @@ class AzureAIService:
         stream: bool = False,
         image_data: Optional[bytes] = None
     ) -> Dict[str, Any]:
-        """Process requests with appropriate model and configuration"""
+        """Process requests with appropriate model and configuration.
+
+        Under a tight latency budget GPT-4o answers as GPT-4o mini and tools
+        are dropped, since a tool call costs a second completion.
+        """
         try:
             start_time = datetime.now()
+            require_budget("ai processing")
+            if model_type == ModelType.GPT4O and not fits_budget(settings.DEADLINE_AI_ESTIMATE_MS / 1000):
+                model_type = ModelType.GPT4O_MINI
             
             # Prepare messages
             formatted_messages = self._format_messages(messages, image_data)
@@ -242,6 +252,9 @@ class AzureAIService:
                 for tool in (tools or [])
                 if tool in self.available_tools
             ]
+            if selected_tools and not fits_budget(settings.DEADLINE_TOOLS_MIN_MS / 1000):
+                logger.info("Latency budget too tight for tool calls, answering without tools")
+                selected_tools = []
             
             # Process with appropriate model
             client = self.clients[model_type.value]
@@ -280,21 +293,18 @@ class AzureAIService:
                 formatted.append(SystemMessage(content=content))
             elif role == "user":
                 if image_data and len(formatted) == 0:
-                    # Handle image input
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as temp_file:
-                        temp_file.write(image_data)
-                        formatted.append(UserMessage(
-                            content=[
-                                TextContentItem(text=content),
-                                ImageContentItem(
-                                    image_url=ImageUrl.load(
-                                        image_file=temp_file.name,
-                                        image_format="jpg",
-                                        detail=ImageDetailLevel.HIGH
-                                    )
-                                ),
-                            ],
-                        ))
+                    # Handle image input, inlined as a data URL
+                    formatted.append(UserMessage(
+                        content=[
+                            TextContentItem(text=content),
+                            ImageContentItem(
+                                image_url=ImageUrl(
+                                    url=image_data_url(image_data, "jpeg"),
+                                    detail=ImageDetailLevel.HIGH
+                                )
+                            ),
+                        ],
+                    ))
                 else:
                     formatted.append(UserMessage(content=content))
             elif role == "assistant":
@@ -311,14 +321,17 @@ class AzureAIService:
     ) -> Dict[str, Any]:
         """Process request with specific model"""
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
+            # The blocking HTTP call cannot be interrupted, but a cancelled
+            # request makes no further round trips once it returns
+            response = await within_budget(run_cancellable(
                 None,
                 lambda: client.complete(
                     messages=messages,
                     tools=tools if tools else None,
                     model=model_type.value
                 )
-            )
+            ), "completion")
+            check_cancelled()
             
             if (response.choices[0].finish_reason == 
                 CompletionsFinishReason.TOOL_CALLS):
@@ -352,6 +365,8 @@ class AzureAIService:
         results = []
         for tool_call in response.choices[0].message.tool_calls:
             if isinstance(tool_call, ChatCompletionsToolCall):
+                check_cancelled()
+                require_budget("tool call")
                 function_args = json.loads(
                     tool_call.function.arguments.replace("'", '"')
                 )
@@ -366,14 +381,16 @@ class AzureAIService:
                 results.append(result)
         
         # Get final response
-        final_response = await asyncio.get_event_loop().run_in_executor(
+        check_cancelled()
+        require_budget("tool follow-up")
+        final_response = await within_budget(run_cancellable(
             None,
             lambda: client.complete(
                 messages=messages,
                 tools=tools,
                 model=model_type.value
             )
-        )
+        ), "tool follow-up")
         
         return {
             "content": final_response.choices[0].message.content,
@@ -475,7 +492,8 @@ class AzureAIService:
         model_type: ModelType
     ):
         """Stream responses from the model"""
-        response = await asyncio.get_event_loop().run_in_executor(
+        token = current_token()
+        response = await run_cancellable(
             None,
             lambda: client.complete(
                 stream=True,
@@ -485,27 +503,51 @@ class AzureAIService:
         )
         
         async def response_generator():
-            for update in response:
-                if update.choices:
-                    yield update.choices[0].delta.content or ""
+            try:
+                for update in response:
+                    if token is not None and token.cancelled:
+                        break  # Barge-in: stop reading and drop the connection
+                    if update.choices:
+                        yield update.choices[0].delta.content or ""
+            finally:
+                response.close()
                     
         return response_generator()
 
-    async def analyze_text(self, text: str) -> dict:
+    async def analyze_text(self, text: str, token: Optional[CancellationToken] = None) -> dict:
+        """Intent and emotion of ``text``.
+
+        Runs under ``token`` (default: the current one); once it is
+        cancelled the call raises ``OperationCancelled`` instead of
+        reporting an empty analysis.
+        """
+        client = self.clients[ModelType.GPT4O_MINI.value]
         try:
-            response = await self.chat_client.chat.create_completion(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Analyze the user's intent and emotion from their message."},
-                    {"role": "user", "content": text}
-                ],
-                temperature=0.7,
-                max_tokens=150
+            response = await run_cancellable(
+                None,
+                lambda: client.complete(
+                    messages=[
+                        SystemMessage(content="Analyze the user's intent and emotion from their message."),
+                        UserMessage(content=text)
+                    ],
+                    model=ModelType.GPT4O_MINI.value,
+                    temperature=0.7,
+                    max_tokens=150
+                ),
+                token=token
             )
+            (token or CancellationToken(current_token())).raise_if_cancelled()
             return {
                 "analysis": response.choices[0].message.content,
-                "usage": response.usage.dict() if response.usage else {}
+                "usage": response.usage.as_dict() if response.usage else {}
             }
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to analyze text: {str(e)}")
             return {"analysis": "", "error": str(e)}
+
+    def close(self):
+        """Close the per-model inference clients"""
+        for client in self.clients.values():
+            client.close()
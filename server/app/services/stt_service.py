@@ -1,104 +1,134 @@
 import os
-import torch
-import whisper
 from ..config import settings
 from ..core.logging import setup_logging
-import asyncio
-import tempfile
-from typing import Dict, Any
+from ..core.media import decode_audio
+from ..core.cancellation import check_cancelled, run_cancellable
+from ..core.deadline import require_budget, within_budget
+from ..core.metrics import stt_decode_duration_seconds
+from ..core.stats import get_stats_store
+from ..core.interfaces import STTInterface
+from ..core.voice.backends import get_transcriber
+from ..core.voice.fingerprint import fingerprint_cache
+from ..core.voice.language import language_router
+from ..core.voice.longform import LongFormTranscriber
+from ..core.voice.profiles import fit_to_budget, resolve_profile
+import time
+from typing import Any, Dict, Optional
 import numpy as np
 from datetime import datetime
 
 logger = setup_logging()
 
-class STTService:
-    def __init__(self):
-        self.model = None
-        self.processing_history = {}
-        self._initialize_model()
+class STTService(STTInterface):
+    def __init__(self, model_name: str = None):
+        self.model_name = model_name or settings.WHISPER_MODEL
+        self.batcher = get_transcriber()
+        self.long_form = LongFormTranscriber(self.batcher)
+        self.language_router = language_router
+        self.fingerprints = fingerprint_cache
+        self.stats = get_stats_store("stt")
 
-    def _initialize_model(self):
-        """Initialize Whisper model with proper error handling"""
-        try:
-            # Ensure CUDA is available if specified
-            if settings.WHISPER_DEVICE == "cuda" and not torch.cuda.is_available():
-                logger.warning("CUDA not available, falling back to CPU")
-                settings.WHISPER_DEVICE = "cpu"
-
-            # Load model
-            self.model = whisper.load_model(
-                settings.WHISPER_MODEL,
-                device=settings.WHISPER_DEVICE,
-                download_root=os.path.join(os.path.dirname(__file__), "models")
-            )
-            logger.info(f"Whisper model loaded successfully on {settings.WHISPER_DEVICE}")
-            
-        except Exception as e:
-            logger.error(f"Failed to load Whisper model: {str(e)}")
-            raise RuntimeError(f"Could not initialize Whisper model: {str(e)}")
-
-    async def speech_to_text(self, audio_data: bytes) -> Dict[str, Any]:
-        """Convert speech to text using Whisper"""
-        if not self.model:
-            raise RuntimeError("Whisper model not initialized")
+    async def speech_to_text(
+        self,
+        audio_data: bytes,
+        language: Optional[str] = None,
+        user_id: Optional[Any] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Convert speech to text with the configured STT backend.
 
+        ``language`` is the request's declared language; without it the
+        user's previously detected language is reused when known.
+        ``profile`` names the decode profile (``command`` or ``dictation``).
+        Under a latency budget too tight for the requested decode, the
+        cascade's small model with the ``command`` profile is used instead
+        and the result is marked ``degraded``.
+        """
         process_id = os.urandom(16).hex()
         start_time = datetime.now()
+        stage = "decode"
+        stage_start = time.perf_counter()
 
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-                temp_file.write(audio_data)
-                temp_file.close()
+            # Decode straight from the request buffer, no temp file round trip
+            require_budget(stage)
+            audio = await run_cancellable(None, decode_audio, audio_data)
+            self.stats.observe(stage, time.perf_counter() - stage_start)
+            check_cancelled()
+            stage, stage_start = "transcribe", time.perf_counter()
 
-                # Run transcription in thread pool
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self._transcribe_audio,
-                    temp_file.name
-                )
+            # Near-duplicates of the user's recent clips reuse their transcript.
+            # Otherwise batched with concurrent requests on a pooled replica, optionally
+            # behind the grammar fast path and model cascade. Audio past one window is
+            # split at pauses and its windows decoded in parallel.
+            model_name, language = await self.language_router.route(self.model_name, user_id, language)
+            long_form = len(audio) > self.long_form.window
+            decode_profile = resolve_profile(profile, long_form=long_form)
+            model_name, decode_profile, degraded = fit_to_budget(
+                model_name,
+                language,
+                decode_profile,
+                self.stats.estimate(f"{stage}:{decode_profile.name}", settings.DEADLINE_QUANTILE)
+            )
+            scope = f"{decode_profile.name}:{language or 'auto'}"
+            print_ = None if long_form else self.fingerprints.sketch(audio)
+            result = await self.fingerprints.lookup(user_id, scope, print_)
+            if result is None:
+                transcriber = self.long_form if long_form else self.batcher
+                result = await within_budget(transcriber.transcribe(
+                    audio,
+                    model_name=model_name,
+                    language=language,
+                    profile=decode_profile.name
+                ), stage)
+                if not degraded:
+                    await self.fingerprints.store(user_id, scope, print_, result)
+            if language is None:
+                await self.language_router.remember(user_id, result["language"])
+            tier = result.get("tier", model_name)
+            elapsed = time.perf_counter() - stage_start
+            self.stats.observe(stage, elapsed)
+            if tier != "fingerprint":
+                # Per-profile timings of full decodes predict the next one's cost
+                self.stats.observe(f"{stage}:{'degraded' if degraded else decode_profile.name}", elapsed)
+            stt_decode_duration_seconds.labels(profile=decode_profile.name, tier=tier).observe(elapsed)
+            stage = None
 
-                # Calculate metrics
-                confidence = np.mean([s["confidence"] for s in result["segments"]])
+            # Calculate metrics
+            confidence = np.mean([s["confidence"] for s in result["segments"]])
 
-                self.processing_history[process_id] = {
-                    "timestamp": start_time,
-                    "duration": (datetime.now() - start_time).total_seconds(),
-                    "confidence": confidence,
-                    "language": result["language"]
-                }
+            duration = (datetime.now() - start_time).total_seconds()
+            self.stats.observe("total", duration)
+            self.stats.record(process_id, {
+                "timestamp": start_time,
+                "duration": duration,
+                "confidence": float(confidence),
+                "language": result["language"],
+                "tier": tier,
+                "profile": decode_profile.name,
+                "degraded": degraded
+            })
 
-                return {
-                    "text": result["text"],
-                    "language": result["language"],
-                    "segments": result["segments"],
-                    "confidence": float(confidence),
-                    "process_id": process_id
-                }
+            return {
+                "text": result["text"],
+                "language": result["language"],
+                "segments": result["segments"],
+                "confidence": float(confidence),
+                "tier": tier,
+                "profile": decode_profile.name,
+                "degraded": degraded,
+                "process_id": process_id
+            }
 
         except Exception as e:
-            self.processing_history[process_id] = {
+            self.stats.observe(stage or "total", time.perf_counter() - stage_start, error=True)
+            self.stats.record(process_id, {
                 "timestamp": start_time,
                 "error": str(e)
-            }
+            })
             logger.error(f"Speech-to-text conversion failed: {str(e)}")
             raise
-        finally:
-            if 'temp_file' in locals():
-                os.unlink(temp_file.name)
 
     def get_processing_history(self, limit: int = 100) -> Dict[str, Dict]:
-        """Get recent processing history"""
-        sorted_items = sorted(
-            self.processing_history.items(),
-            key=lambda x: x[1]["timestamp"],
-            reverse=True
-        )
-        return dict(sorted_items[:limit])
-
-    def _transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
-        """Transcribe audio file using Whisper"""
-        return self.model.transcribe(
-            audio_path,
-            language=settings.WHISPER_LANGUAGE,
-            fp16=False
-        )
+        """Get recent processing history, newest first"""
+        return self.stats.recent(limit)
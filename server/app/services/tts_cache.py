@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import time
+import unicodedata
+from typing import Any, BinaryIO, Iterator, Optional
+
+from ..config import settings
+from ..core.cache import redis_client
+from ..core.logging import setup_logging
+from ..core.metrics import (
+    tts_cache_bytes_saved_total, tts_cache_evictions_total, tts_cache_requests_total, tts_cache_size_bytes
+)
+
+logger = setup_logging()
+
+ENTRIES_KEY = "tts_cache:entries"  # Hash: audio key -> size in bytes
+LRU_KEY = "tts_cache:lru"  # Sorted set: audio key -> last use
+BYTES_KEY = "tts_cache:bytes"
+READ_CHUNK = 64 * 1024
+EVICT_BATCH = 16
+
+def normalize_text(text: str) -> str:
+    """Collapse the differences that do not change the spoken audio"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+class TTSAudioCache:
+    """Content-addressed store of synthesized audio.
+
+    Files live in ``TTS_CACHE_DIR`` (a volume shared by the replicas) under
+    a hash of everything that determines the audio. The Redis index holds
+    each entry's size and last use, so every replica sees the same entries
+    and evicts least-recently-used ones once ``TTS_CACHE_MAX_BYTES`` is
+    exceeded. Redis failures degrade to cache misses.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None, cache: Any = None):
+        self.directory = directory or settings.TTS_CACHE_DIR
+        self.max_bytes = max_bytes or settings.TTS_CACHE_MAX_BYTES
+        self.cache = cache or redis_client
+
+    @staticmethod
+    def key(text: str, voice_id: str, speed: float, audio_format: str, sample_rate: int) -> str:
+        identity = [normalize_text(text), voice_id, round(speed, 3), audio_format, sample_rate]
+        return hashlib.sha256(json.dumps(identity).encode("utf-8")).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        """Short responses are cached, and only while the shared index is reachable"""
+        return (
+            settings.TTS_CACHE_ENABLED
+            and len(text) <= settings.TTS_CACHE_MAX_TEXT_CHARS
+            and self.cache.client is not None
+        )
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def temp_path(self, key: str) -> str:
+        """Where a synthesis in progress writes its copy of the audio"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return f"{path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+
+    async def open(self, key: str) -> Optional[BinaryIO]:
+        """The cached audio for ``key``, opened for reading, or None on a miss.
+
+        The file is opened before it is handed out: once open it stays
+        readable even if another replica evicts (unlinks) it meanwhile.
+        """
+        redis = self.cache.client
+        f = None
+        try:
+            size = await redis.hget(ENTRIES_KEY, key)
+            if size is not None:
+                try:
+                    f = open(self.path(key), "rb")
+                except FileNotFoundError:
+                    await self._drop(redis, key)  # Removed behind the index's back
+            if f is None:
+                tts_cache_requests_total.labels(result="miss").inc()
+                return None
+            await redis.zadd(LRU_KEY, {key: time.time()}, xx=True)
+        except Exception as e:
+            logger.error(f"TTS cache lookup failed: {str(e)}")
+            if f is not None:
+                f.close()
+            tts_cache_requests_total.labels(result="miss").inc()
+            return None
+
+        tts_cache_requests_total.labels(result="hit").inc()
+        tts_cache_bytes_saved_total.inc(int(size))
+        return f
+
+    async def commit(self, key: str, temp_path: str):
+        """Publish a completed synthesis written to ``temp_path``"""
+        redis = self.cache.client
+        path = self.path(key)
+        try:
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+            if await redis.hsetnx(ENTRIES_KEY, key, size):
+                pipe = redis.pipeline()
+                pipe.zadd(LRU_KEY, {key: time.time()})
+                pipe.incrby(BYTES_KEY, size)
+                await pipe.execute()
+            await self._evict(redis)
+        except Exception as e:
+            logger.error(f"TTS cache store failed: {str(e)}")
+
+    @staticmethod
+    def discard(temp_path: str):
+        """Remove an unfinished synthesis; a no-op once committed"""
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def read(f: BinaryIO) -> Iterator[bytes]:
+        """Chunks of a file from :meth:`open`, closing it at the end"""
+        with f:
+            while chunk := f.read(READ_CHUNK):
+                yield chunk
+
+    async def _evict(self, redis: Any):
+        total = int(await redis.get(BYTES_KEY) or 0)
+        while total > self.max_bytes:
+            oldest = await redis.zrange(LRU_KEY, 0, EVICT_BATCH - 1)
+            if not oldest:
+                break
+            for key in oldest:
+                key = key.decode() if isinstance(key, bytes) else key
+                if await self._drop(redis, key):
+                    tts_cache_evictions_total.inc()
+                    try:
+                        os.unlink(self.path(key))
+                    except FileNotFoundError:
+                        pass
+                total = int(await redis.get(BYTES_KEY) or 0)
+                if total <= self.max_bytes:
+                    break
+        tts_cache_size_bytes.set(total)
+
+    @staticmethod
+    async def _drop(redis: Any, key: str) -> bool:
+        """Remove ``key`` from the index; only the replica that removes it adjusts the byte count"""
+        size = await redis.hget(ENTRIES_KEY, key)
+        await redis.zrem(LRU_KEY, key)
+        if size is None or not await redis.hdel(ENTRIES_KEY, key):
+            return False
+        await redis.decrby(BYTES_KEY, int(size))
+        return True
+
+tts_audio_cache = TTSAudioCache()
@@ -0,0 +1,144 @@
+from typing import AsyncIterator, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from ..config import settings
+from ..core.media import transcode_stream
+from .tts_pipeline import join_wav
+
+MEDIA_TYPES = {
+    "FORMAT_WAV": "audio/wav",
+    "FORMAT_MP3": "audio/mpeg",
+    "FORMAT_OGG": "audio/ogg",
+    "FORMAT_FLAC": "audio/flac",
+    "FORMAT_MULAW": "audio/basic"
+}
+
+PROVIDER_RATES = frozenset({8000, 16000, 22050, 24000, 44100, 48000})
+OPUS_RATES = frozenset({8000, 12000, 16000, 24000, 48000})
+
+class OutputCodec(NamedTuple):
+    provider_format: str  # What PlayHT is asked for
+    sample_rates: FrozenSet[int]
+    default_rate: int  # When TTS_SAMPLE_RATE is not one of ``sample_rates``
+    encoded: bool = False  # Converted from the provider's WAV by encode()
+
+CODECS = {
+    "wav": OutputCodec("FORMAT_WAV", PROVIDER_RATES, 24000),
+    "mp3": OutputCodec("FORMAT_MP3", PROVIDER_RATES, 24000),
+    "ogg": OutputCodec("FORMAT_OGG", PROVIDER_RATES, 24000),
+    "flac": OutputCodec("FORMAT_FLAC", PROVIDER_RATES, 24000),
+    "mulaw": OutputCodec("FORMAT_MULAW", frozenset({8000}), 8000),
+    "pcm": OutputCodec("FORMAT_WAV", PROVIDER_RATES, 16000, encoded=True),  # Raw 16-bit little-endian mono
+    "opus": OutputCodec("FORMAT_WAV", OPUS_RATES, 24000, encoded=True)  # Opus in Ogg
+}
+
+# Accept header media types, for clients that negotiate instead of naming a codec
+ACCEPT_CODECS = {
+    "audio/ogg": "opus",
+    "audio/opus": "opus",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+    "audio/pcm": "pcm",
+    "audio/flac": "flac",
+    "audio/basic": "mulaw"
+}
+
+class UnsupportedOutputFormat(ValueError):
+    """Raised when a requested codec or sample rate cannot be produced"""
+
+class OutputFormat(NamedTuple):
+    codec: str
+    sample_rate: int
+
+    @property
+    def provider_format(self) -> str:
+        return CODECS[self.codec].provider_format
+
+    @property
+    def encoded(self) -> bool:
+        return CODECS[self.codec].encoded
+
+    @property
+    def media_type(self) -> str:
+        if self.codec == "pcm":
+            return f"audio/pcm;rate={self.sample_rate}"
+        if self.codec == "opus":
+            return "audio/ogg; codecs=opus"
+        return MEDIA_TYPES.get(self.provider_format, "application/octet-stream")
+
+def default_output() -> OutputFormat:
+    """The ``TTS_OUTPUT_FORMAT``/``TTS_SAMPLE_RATE`` output used when a
+    request does not ask for one"""
+    codec = next(
+        (name for name, spec in CODECS.items() if spec.provider_format == settings.TTS_OUTPUT_FORMAT and not spec.encoded),
+        "wav"
+    )
+    return OutputFormat(codec, _sample_rate(codec))
+
+def negotiate_output(
+    codec: Optional[str] = None,
+    sample_rate: Optional[int] = None,
+    accept: Optional[str] = None
+) -> OutputFormat:
+    """Pick the output for a request: an explicit ``codec`` wins over the
+    Accept header, which wins over the configured default"""
+    codec = codec or _accepted_codec(accept) or default_output().codec
+    if codec not in CODECS:
+        raise UnsupportedOutputFormat(f"Unsupported audio format: {codec}")
+
+    sample_rate = sample_rate or _sample_rate(codec)
+    if sample_rate not in CODECS[codec].sample_rates:
+        supported = ", ".join(str(rate) for rate in sorted(CODECS[codec].sample_rates))
+        raise UnsupportedOutputFormat(f"{codec} supports sample rates {supported}, not {sample_rate}")
+    return OutputFormat(codec, sample_rate)
+
+def encode(chunks: AsyncIterator[bytes], output: OutputFormat) -> AsyncIterator[bytes]:
+    """Convert the provider's stream to ``output`` chunk by chunk.
+
+    Opus is encoded by ffmpeg as the WAV arrives, flushing an Ogg page
+    every 20ms so playback can start after the first sentence's first
+    chunks rather than once the clip is complete.
+    """
+    if output.codec == "pcm":
+        return join_wav(chunks, first=False)
+    if output.codec == "opus":
+        return transcode_stream(chunks, _opus_args(output.sample_rate))
+    return chunks
+
+def _opus_args(sample_rate: int) -> List[str]:
+    return [
+        "-vn",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-c:a", "libopus",
+        "-b:a", settings.TTS_OPUS_BITRATE,
+        "-application", "voip",
+        "-page_duration", "20000",
+        "-flush_packets", "1",
+        "-f", "ogg"
+    ]
+
+def _sample_rate(codec: str) -> int:
+    spec = CODECS[codec]
+    return settings.TTS_SAMPLE_RATE if settings.TTS_SAMPLE_RATE in spec.sample_rates else spec.default_rate
+
+def _accepted_codec(accept: Optional[str]) -> Optional[str]:
+    """The supported codec the Accept header prefers, if it names one"""
+    if not accept:
+        return None
+    ranked: List[Tuple[float, int, str]] = []
+    for position, item in enumerate(accept.split(",")):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        codec = ACCEPT_CODECS.get(media_type.lower())
+        if codec and quality > 0:
+            ranked.append((-quality, position, codec))
+    return min(ranked)[2] if ranked else None
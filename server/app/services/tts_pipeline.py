@@ -0,0 +1,119 @@
+import asyncio
+import re
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+SENTENCE_END = re.compile(r"(?<=[.!?…。！？])\s+")
+STREAMING_SIZE = (0xFFFFFFFF).to_bytes(4, "little")  # "Unknown length", as streamed WAV uses
+MAX_WAV_HEADER = 4096
+
+_END = object()
+
+def split_sentences(text: str, min_chars: int = 0) -> List[str]:
+    """Split ``text`` after sentence-ending punctuation.
+
+    Pieces shorter than ``min_chars`` ("Dr.", "OK.") are joined to the
+    next one: a provider call per fragment costs more than it saves, and
+    the fragment would be spoken without its sentence's intonation.
+    """
+    sentences: List[str] = []
+    pending = ""
+    for piece in SENTENCE_END.split(text.strip()):
+        pending = f"{pending} {piece}" if pending else piece
+        if len(pending) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {pending}"
+        else:
+            sentences.append(pending)
+    return sentences
+
+async def synthesize_in_order(
+    sentences: List[str],
+    synthesize: Callable[[int, str], Awaitable[AsyncIterator[bytes]]],
+    window: int
+) -> AsyncIterator[bytes]:
+    """Stream the audio of ``sentences`` strictly in order while up to
+    ``window`` of them are synthesized concurrently.
+
+    Sentence ``i`` streams as soon as it is its turn; the audio of the
+    sentences after it is buffered until then, so the window also bounds
+    memory. A new sentence starts each time one has been fully passed on.
+    Closing the stream cancels the syntheses still running.
+    """
+    queues = [asyncio.Queue() for _ in sentences]
+    tasks: List[asyncio.Task] = []
+
+    async def produce(index: int):
+        try:
+            async for chunk in await synthesize(index, sentences[index]):
+                queues[index].put_nowait((chunk, None))
+            queues[index].put_nowait((_END, None))
+        except Exception as e:
+            queues[index].put_nowait((_END, e))
+
+    def start(index: int):
+        if index < len(sentences):
+            tasks.append(asyncio.create_task(produce(index)))
+
+    for index in range(min(max(window, 1), len(sentences))):
+        start(index)
+    try:
+        for index in range(len(sentences)):
+            while True:
+                chunk, error = await queues[index].get()
+                if error is not None:
+                    raise error
+                if chunk is _END:
+                    break
+                yield chunk
+            start(index + max(window, 1))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def _wav_data_offset(header: bytes) -> Optional[int]:
+    """Offset of the sample data in a WAV stream, 0 if it is not WAV,
+    None while the header is incomplete"""
+    if len(header) < 12:
+        return None
+    if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return 0
+    position = 12
+    while len(header) >= position + 8:
+        chunk_id = header[position:position + 4]
+        size = int.from_bytes(header[position + 4:position + 8], "little")
+        if chunk_id == b"data":
+            return position + 8
+        position += 8 + size + (size & 1)
+    return None
+
+async def join_wav(chunks: AsyncIterator[bytes], first: bool) -> AsyncIterator[bytes]:
+    """Make per-sentence WAV streams play back as one.
+
+    The first sentence keeps its header with the lengths set to "unknown"
+    (the total is not known until the last sentence is done); later
+    sentences contribute only their samples.
+    """
+    header = b""
+    async for chunk in chunks:
+        if header is None:
+            yield chunk
+            continue
+
+        header += chunk
+        offset = _wav_data_offset(header)
+        if offset is None and len(header) < MAX_WAV_HEADER:
+            continue
+        if not offset:
+            yield header  # Not WAV after all: pass it through untouched
+        elif first:
+            yield header[:4] + STREAMING_SIZE + header[8:offset - 4] + STREAMING_SIZE + header[offset:]
+        else:
+            yield header[offset:]
+        header = None
+
+    if header:
+        yield header
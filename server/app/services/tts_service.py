@@ -1,18 +1,36 @@
 from pyht import Client
 from pyht.client import TTSOptions, Format
 from ..config import settings
+from ..core.cancellation import check_cancelled, stream_cancellable
+from ..core.deadline import require_budget
 from ..core.logging import setup_logging
 from ..core.voice_registry import VoiceRegistry, Voice
-import asyncio
-import tempfile
-import os
-from typing import AsyncGenerator, Optional, Union
+from .tts_cache import TTSAudioCache, tts_audio_cache
+from .tts_output import MEDIA_TYPES, OutputFormat, default_output, encode
+from .tts_pipeline import join_wav, split_sentences, synthesize_in_order
+from contextlib import nullcontext
+from typing import AsyncGenerator, AsyncIterator, BinaryIO, Iterator, NamedTuple, Optional, Tuple, Union
 from unittest.mock import Mock
 
 logger = setup_logging()
 
+# Formats whose per-sentence streams play back concatenated (WAV via join_wav)
+JOINABLE_FORMATS = {"FORMAT_WAV", "FORMAT_MP3", "FORMAT_MULAW"}
+
+class SpeechAudio(NamedTuple):
+    """Audio for one request: ``file`` is the open cache entry when the
+    audio is served as stored (send it as is), ``chunks`` always streams it"""
+    file: Optional[BinaryIO]
+    chunks: AsyncIterator[bytes]
+    media_type: str
+
 class TTSService:
-    def __init__(self, test_mode: bool = False):
+    def __init__(
+        self,
+        test_mode: bool = False,
+        voice_registry: Optional[VoiceRegistry] = None,
+        audio_cache: Optional[TTSAudioCache] = None
+    ):
         try:
             if test_mode:
                 self.client = Mock()
@@ -29,20 +47,17 @@ class TTSService:
             logger.error(f"Failed to initialize TTS service: {str(e)}")
             self.client = None
 
-        self.voice_registry = VoiceRegistry(settings.VOICE_CONFIG_PATH)
+        self.voice_registry = voice_registry or VoiceRegistry(settings.VOICE_CONFIG_PATH)
+        self.audio_cache = audio_cache or tts_audio_cache
         
         # Initialize default voice
         default_voice = self.voice_registry.get_default_voice()
-        
-        # Handle format properly
-        output_format = Format.FORMAT_WAV
-        if hasattr(Format, settings.TTS_OUTPUT_FORMAT):
-            output_format = getattr(Format, settings.TTS_OUTPUT_FORMAT)
+        self.default_output = default_output()
         
         self.default_options = TTSOptions(
             voice=default_voice.id,
-            format=output_format,
-            sample_rate=settings.TTS_SAMPLE_RATE
+            format=self._provider_format(self.default_output),
+            sample_rate=self.default_output.sample_rate
         )
 
     async def text_to_speech(
@@ -56,72 +71,168 @@ class TTSService:
             raise RuntimeError("TTS service not available")
 
         try:
+            # Speaking an answer after the deadline only delays the next one
+            require_budget("tts", settings.DEADLINE_TTS_MIN_MS / 1000)
+
             # For test mode
             if hasattr(self, 'test_chunks'):
                 for chunk in self.test_chunks:
                     yield chunk
                 return
 
-            # Validate and get voice
-            voice = None
-            if voice_id:
-                voice = self.voice_registry.get_voice(voice_id)
-                if not voice:
-                    logger.warning(f"Voice ID {voice_id} not found, using default voice")
-                    voice = self.voice_registry.get_default_voice()
-            else:
-                voice = self.voice_registry.get_default_voice()
-
-            options = TTSOptions(
-                voice=voice.id,
-                format=self.default_options.format,
-                sample_rate=self.default_options.sample_rate
-            )
-            # Handle speed separately if needed
-            options.speed = speed
-
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self._generate_audio,
-                    text,
-                    options,
-                    temp_file.name,
-                    voice.voice_engine
-                )
-
-                chunk_size = 1024 * 8
-                with open(temp_file.name, 'rb') as audio_file:
-                    while chunk := audio_file.read(chunk_size):
-                        yield chunk
-
-            finally:
-                temp_file.close()
-                os.unlink(temp_file.name)
+            audio = await self.speak(text, voice_id, speed)
+            async for chunk in audio.chunks:
+                yield chunk
 
         except Exception as e:
             logger.error(f"TTS generation failed: {str(e)}")
             raise
 
-    def _generate_audio(self, text: str, options: TTSOptions, output_path: str, voice_engine: str):
-        """Generate audio using TTS service"""
-        with open(output_path, "wb") as audio_file:
-            # Remove voice_engine from kwargs if not supported
-            kwargs = {}
-            if hasattr(self.client, 'voice_engine'):
-                kwargs['voice_engine'] = voice_engine
+    async def speak(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        speed: float = 1.0,
+        output: Optional[OutputFormat] = None
+    ) -> SpeechAudio:
+        """Audio for a whole response, in the negotiated ``output`` format.
+
+        A multi-sentence response is split into sentences that are
+        synthesized ``TTS_PIPELINE_WINDOW`` at a time and streamed strictly
+        in order, so playback starts as soon as the first sentence is ready
+        instead of after the whole answer. Encoded outputs (Opus, raw PCM)
+        are synthesized as WAV and converted as the joined stream arrives.
+        """
+        output = output or self.default_output
+        sentences = [text]
+        if settings.TTS_PIPELINE_ENABLED and output.provider_format in JOINABLE_FORMATS:
+            sentences = split_sentences(text, settings.TTS_PIPELINE_MIN_SENTENCE_CHARS)
+        if len(sentences) <= 1:
+            audio = await self.synthesize(text, voice_id, speed, output)
+            if not output.encoded:
+                return audio
+            return SpeechAudio(None, encode(audio.chunks, output), output.media_type)
+
+        async def sentence_audio(index: int, sentence: str) -> AsyncIterator[bytes]:
+            audio = await self.synthesize(sentence, voice_id, speed, output)
+            if output.provider_format == "FORMAT_WAV":
+                return join_wav(audio.chunks, first=index == 0)
+            return audio.chunks
+
+        chunks = synthesize_in_order(sentences, sentence_audio, settings.TTS_PIPELINE_WINDOW)
+        return SpeechAudio(None, encode(chunks, output), output.media_type)
+
+    async def synthesize(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        speed: float = 1.0,
+        output: Optional[OutputFormat] = None
+    ) -> SpeechAudio:
+        """Resolve ``text`` to cached audio or a live synthesis of the
+        provider format behind ``output``.
+
+        Audio is content-addressed by the normalized text, voice, speed,
+        format and sample rate, so repeated responses are read from disk
+        instead of being synthesized again; a miss is cached as it streams.
+        """
+        output = output or self.default_output
+        voice, options = self._options(voice_id, speed, output)
+        media_type = MEDIA_TYPES.get(output.provider_format, "application/octet-stream")
+
+        key = None
+        if self.audio_cache.cacheable(text):
+            key = self.audio_cache.key(text, voice.id, speed, output.provider_format, output.sample_rate)
+            cached = await self.audio_cache.open(key)
+            if cached is not None:
+                chunks = stream_cancellable(None, self.audio_cache.read, cached, maxsize=settings.TTS_STREAM_BUFFER_CHUNKS)
+                return SpeechAudio(cached, chunks, media_type)
+
+        if not self.client:
+            raise RuntimeError("TTS service not available")
+        return SpeechAudio(None, self._stream(text, options, voice.voice_engine, key), media_type)
+
+    @staticmethod
+    def _provider_format(output: OutputFormat) -> Format:
+        return getattr(Format, output.provider_format, Format.FORMAT_WAV)
+
+    def _options(self, voice_id: Optional[str], speed: float, output: OutputFormat) -> Tuple[Voice, TTSOptions]:
+        # Validate and get voice
+        voice = None
+        if voice_id:
+            voice = self.voice_registry.get_voice(voice_id)
+            if not voice:
+                logger.warning(f"Voice ID {voice_id} not found, using default voice")
+                voice = self.voice_registry.get_default_voice()
+        else:
+            voice = self.voice_registry.get_default_voice()
+
+        options = TTSOptions(
+            voice=voice.id,
+            format=self._provider_format(output),
+            sample_rate=output.sample_rate
+        )
+        # Handle speed separately if needed
+        options.speed = speed
+        return voice, options
+
+    async def _stream(
+        self,
+        text: str,
+        options: TTSOptions,
+        voice_engine: str,
+        cache_key: Optional[str] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream a synthesis, keeping a copy under ``cache_key`` once it completes"""
+        temp_path = self.audio_cache.temp_path(cache_key) if cache_key else None
+        try:
+            # Chunks are passed on as PlayHT sends them, so the first audio
+            # reaches the client after the provider's first-chunk latency
+            async for chunk in stream_cancellable(
+                None,
+                self._generate_audio,
+                text,
+                options,
+                voice_engine,
+                temp_path,
+                maxsize=settings.TTS_STREAM_BUFFER_CHUNKS
+            ):
+                yield chunk
+            if temp_path:
+                await self.audio_cache.commit(cache_key, temp_path)
+        finally:
+            if temp_path:
+                self.audio_cache.discard(temp_path)
+
+    def _generate_audio(
+        self,
+        text: str,
+        options: TTSOptions,
+        voice_engine: str,
+        copy_path: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Generate audio using TTS service, chunk by chunk, optionally
+        copying it to ``copy_path``"""
+        # Remove voice_engine from kwargs if not supported
+        kwargs = {}
+        if hasattr(self.client, 'voice_engine'):
+            kwargs['voice_engine'] = voice_engine
 
+        with open(copy_path, "wb") if copy_path else nullcontext() as copy:
             for chunk in self.client.tts(text, options, **kwargs):
-                audio_file.write(chunk)
+                check_cancelled()
+                if copy is not None:
+                    copy.write(chunk)
+                yield chunk
 
     def list_available_voices(self, language: Optional[str] = None,
                             gender: Optional[str] = None,
-                            style: Optional[str] = None):
+                            style: Optional[str] = None,
+                            engine: Optional[str] = None):
         """
         Get a list of available voices with optional filtering
         """
-        return self.voice_registry.list_voices(language, gender, style)
+        return self.voice_registry.list_voices(language, gender, style, engine)
 
     def get_voice_details(self, voice_id: str) -> Optional[Voice]:
         """
@@ -1,27 +1,31 @@
 from typing import Dict, Any, List, Optional
 import logging
 from fastapi import UploadFile, BackgroundTasks
-from ..core.voice import VoiceProcessor
-from ..core.command import CommandProcessor
-from ..models import VoiceCommand, VoiceProfile
-from ..database import get_db
-from sqlalchemy.orm import Session
+from ..core.voice.processor import VoiceProcessor
+from ..core.command.processor import CommandProcessor
+from ..models.voice_command import VoiceCommand
+from ..models.models import VoiceProfile
+from ..database import session_scope
 import json
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class VoiceService:
-    def __init__(self):
-        self.voice_processor = VoiceProcessor()
-        self.command_processor = CommandProcessor()
-        self.db = next(get_db())
+    def __init__(
+        self,
+        voice_processor: Optional[VoiceProcessor] = None,
+        command_processor: Optional[CommandProcessor] = None
+    ):
+        self.voice_processor = voice_processor or VoiceProcessor()
+        self.command_processor = command_processor or CommandProcessor()
 
     async def process_voice_command(
         self,
         audio: UploadFile,
         user_id: int,
-        background_tasks: Optional[BackgroundTasks] = None
+        background_tasks: Optional[BackgroundTasks] = None,
+        profile: Optional[str] = None
     ) -> Dict[str, Any]:
         """Process voice command and return response"""
         try:
@@ -29,10 +33,10 @@ class VoiceService:
             audio_data = await audio.read()
             
             # Process voice command
-            text_result = await self.voice_processor.transcribe(audio_data)
+            text_result = await self.voice_processor.process_audio(audio_data, user_id, profile=profile)
             
             # Process command
-            command_result = await self.command_processor.process(
+            command_result = await self.command_processor.process_command(
                 text_result["text"],
                 user_id
             )
@@ -43,17 +47,19 @@ class VoiceService:
                 text=text_result["text"],
                 confidence=text_result["confidence"],
                 result=command_result,
-                audio_metadata=text_result["metadata"]
+                audio_metadata=text_result["processing_metadata"]
             )
-            self.db.add(command)
-            self.db.commit()
+            with session_scope() as db:
+                db.add(command)
+                db.commit()
             
-            return {
-                "id": command.id,
-                "text": text_result["text"],
-                "confidence": text_result["confidence"],
-                "result": command_result
-            }
+                return {
+                    "id": command.id,
+                    "text": text_result["text"],
+                    "confidence": text_result["confidence"],
+                    "profile": text_result["processing_metadata"]["profile"],
+                    "result": command_result
+                }
             
         except Exception as e:
             logger.error(f"Voice processing failed: {str(e)}")
@@ -76,14 +82,15 @@ class VoiceService:
                 user_id=user_id,
                 model_data=profile_data
             )
-            self.db.add(profile)
-            self.db.commit()
+            with session_scope() as db:
+                db.add(profile)
+                db.commit()
             
-            return {
-                "id": profile.id,
-                "created_at": profile.created_at.isoformat(),
-                "status": "completed"
-            }
+                return {
+                    "id": profile.id,
+                    "created_at": profile.created_at.isoformat(),
+                    "status": "completed"
+                }
             
         except Exception as e:
             logger.error(f"Voice training failed: {str(e)}")
@@ -92,20 +99,21 @@ class VoiceService:
     async def get_voice_profile(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user's voice profile"""
         try:
-            profile = self.db.query(VoiceProfile).filter(
-                VoiceProfile.user_id == user_id,
-                VoiceProfile.is_active == True
-            ).first()
+            with session_scope() as db:
+                profile = db.query(VoiceProfile).filter(
+                    VoiceProfile.user_id == user_id,
+                    VoiceProfile.is_active == True
+                ).first()
             
-            if not profile:
-                return None
+                if not profile:
+                    return None
                 
-            return {
-                "id": profile.id,
-                "created_at": profile.created_at.isoformat(),
-                "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
-                "metadata": profile.model_data.get("metadata", {})
-            }
+                return {
+                    "id": profile.id,
+                    "created_at": profile.created_at.isoformat(),
+                    "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
+                    "metadata": profile.model_data.get("metadata", {})
+                }
             
         except Exception as e:
             logger.error(f"Failed to get voice profile: {str(e)}")
@@ -1,13 +1,14 @@
 from fastapi import UploadFile
 import asyncio
 from typing import Dict, Any, Optional
-import aiofiles
-import os
 from ..config import settings
 from .stt_service import STTService
+from ..core.cancellation import CancellationToken, OperationCancelled, cancellation_scope, current_token
 from ..core.logging import setup_logging
 from ..core.interfaces import VoiceProcessorInterface
+from ..core.stats import get_stats_store
 from .azure_ai import AzureAIService
+import time
 import uuid
 from datetime import datetime
 
@@ -16,71 +17,98 @@ logger = setup_logging()
 class VoiceProcessor(VoiceProcessorInterface):
     def __init__(self):
         self.active_tasks: Dict[str, asyncio.Task] = {}
+        self.active_tokens: Dict[str, CancellationToken] = {}
+        self.active_by_user: Dict[Any, str] = {}  # Latest utterance per user, for barge-in
         self.stt_service = STTService()
         self.ai_service = AzureAIService()
-        self.processing_stats: Dict[str, Dict] = {}
+        # Bounded, TTL-evicted store shared across instances
+        self.processing_stats = get_stats_store("voice_processor")
 
-    async def process_audio(self, audio_file: UploadFile) -> Dict[str, Any]:
+    async def process_audio(self, audio_file: UploadFile, user_id: Optional[Any] = None) -> Dict[str, Any]:
+        """Transcribe and analyze an utterance.
+
+        When ``user_id`` is given, a new utterance barges in on the user's
+        previous one: its decode and AI calls are cancelled and their
+        capacity freed instead of finishing work nobody will read.
+        """
         task_id = str(uuid.uuid4())
-        temp_path = f"temp_{task_id}_{audio_file.filename}"
         
         try:
             # Initialize processing stats
-            self.processing_stats[task_id] = {
+            stats = self.processing_stats.record(task_id, {
                 "start_time": datetime.now(),
                 "status": "processing",
                 "file_size": 0
-            }
+            })
 
-            # Save uploaded file
-            async with aiofiles.open(temp_path, 'wb') as f:
-                content = await audio_file.read()
-                self.processing_stats[task_id]["file_size"] = len(content)
-                await f.write(content)
+            if user_id is not None:
+                previous = self.active_by_user.get(user_id)
+                if previous is not None:
+                    logger.info(f"Barge-in from user {user_id}, interrupting task {previous}")
+                    await self.interrupt_processing(previous)
+                self.active_by_user[user_id] = task_id
+
+            # Keep the upload in memory; STT decodes it without touching disk
+            content = await audio_file.read()
+            stats["file_size"] = len(content)
             
             # Create and track processing task
-            task = asyncio.create_task(self._process_audio_file(temp_path, task_id))
+            token = CancellationToken()
+            with cancellation_scope(token):
+                task = asyncio.create_task(self._process_audio_data(content, task_id, user_id))
             self.active_tasks[task_id] = task
+            self.active_tokens[task_id] = token
             
             result = await task
             
             # Update stats
-            self.processing_stats[task_id].update({
+            stats.update({
                 "end_time": datetime.now(),
                 "status": "completed",
-                "duration": (datetime.now() - self.processing_stats[task_id]["start_time"]).total_seconds()
+                "duration": (datetime.now() - stats["start_time"]).total_seconds()
             })
+            self.processing_stats.observe("total", stats["duration"])
             
             return {
                 "task_id": task_id,
                 "result": result,
-                "stats": self.processing_stats[task_id]
+                "stats": stats
             }
             
-        except asyncio.CancelledError:
-            self.processing_stats[task_id]["status"] = "cancelled"
+        except (asyncio.CancelledError, OperationCancelled):
+            if stats["status"] != "interrupted":
+                stats["status"] = "cancelled"
             logger.info(f"Audio processing cancelled for task {task_id}")
             raise
         except Exception as e:
-            self.processing_stats[task_id]["status"] = "failed"
-            self.processing_stats[task_id]["error"] = str(e)
+            stats["status"] = "failed"
+            stats["error"] = str(e)
+            self.processing_stats.observe(
+                "total", (datetime.now() - stats["start_time"]).total_seconds(), error=True
+            )
             logger.error(f"Audio processing failed: {str(e)}")
             raise
         finally:
-            if task_id in self.active_tasks:
-                del self.active_tasks[task_id]
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            self.active_tasks.pop(task_id, None)
+            self.active_tokens.pop(task_id, None)
+            if user_id is not None and self.active_by_user.get(user_id) == task_id:
+                del self.active_by_user[user_id]
 
-    async def _process_audio_file(self, file_path: str, task_id: str) -> Dict[str, Any]:
-        async with aiofiles.open(file_path, 'rb') as f:
-            audio_data = await f.read()
-            
+    async def _process_audio_data(
+        self,
+        audio_data: bytes,
+        task_id: str,
+        user_id: Optional[Any] = None
+    ) -> Dict[str, Any]:
         # Speech to text
-        stt_result = await self.stt_service.speech_to_text(audio_data)
+        stage_start = time.perf_counter()
+        stt_result = await self.stt_service.speech_to_text(audio_data, user_id=user_id)
+        self.processing_stats.observe("stt", time.perf_counter() - stage_start)
         
         # AI analysis
-        intent_analysis = await self.ai_service.analyze_text(stt_result["text"])
+        stage_start = time.perf_counter()
+        intent_analysis = await self.ai_service.analyze_text(stt_result["text"], token=current_token())
+        self.processing_stats.observe("analysis", time.perf_counter() - stage_start)
         
         return {
             "text": stt_result["text"],
@@ -92,26 +120,33 @@ class VoiceProcessor(VoiceProcessorInterface):
 
     async def interrupt_processing(self, task_id: str) -> bool:
         if task_id in self.active_tasks:
+            # The token stops work already running on executor threads; cancelling
+            # the task stops the awaits. Awaiting it waits for both to wind down.
+            token = self.active_tokens.get(task_id)
+            if token is not None:
+                token.cancel("interrupted")
             self.active_tasks[task_id].cancel()
             try:
                 await self.active_tasks[task_id]
-            except asyncio.CancelledError:
+            except (asyncio.CancelledError, OperationCancelled):
                 pass
             
             # Initialize stats if not exists
-            if task_id not in self.processing_stats:
-                self.processing_stats[task_id] = {
+            stats = self.processing_stats.get(task_id)
+            if stats is None:
+                stats = self.processing_stats.record(task_id, {
                     "start_time": datetime.now(),
                     "status": "initialized"
-                }
+                })
                 
-            self.processing_stats[task_id]["status"] = "interrupted"
-            self.processing_stats[task_id]["end_time"] = datetime.now()
-            del self.active_tasks[task_id]
+            stats["status"] = "interrupted"
+            stats["end_time"] = datetime.now()
+            self.active_tasks.pop(task_id, None)
+            self.active_tokens.pop(task_id, None)
             return True
         return False
 
     def get_processing_stats(self, task_id: Optional[str] = None) -> Dict:
         if task_id:
-            return self.processing_stats.get(task_id, {})
-        return self.processing_stats
+            return self.processing_stats.get(task_id) or {}
+        return self.processing_stats.recent(settings.STATS_HISTORY_SIZE)
@@ -2,12 +2,15 @@ from ..core.celery_app import celery_app
 from ..services.stt_service import STTService
 from ..core.logging import setup_logging
 from typing import Dict, Any
+import asyncio
 import numpy as np
 
 logger = setup_logging()
 
 class VoiceTaskProcessor:
     def __init__(self):
+        # STTService borrows replicas from the process-wide model pool,
+        # so constructing it per task does not reload Whisper
         self.stt_service = STTService()
 
     async def process_voice_data(self, audio_data: bytes) -> Dict[str, Any]:
@@ -0,0 +1,102 @@
+import pytest
+import asyncio
+import time
+import numpy as np
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+from ..core.cancellation import check_cancelled
+from ..core.voice.batcher import TranscriptionBatcher
+
+class FakePool:
+    def __init__(self):
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def acquire(self, name=None):
+        self.checkouts += 1
+        yield Mock(name=name)
+
+@pytest.fixture
+def batcher():
+    batcher = TranscriptionBatcher(FakePool(), window_ms=20, max_batch_size=4)
+    batcher.batch_sizes = []
+
+    def decode_batch(model, audios, language, profile):
+        batcher.batch_sizes.append(len(audios))
+        return [{"text": f"len={len(audio)}", "language": language, "segments": []} for audio in audios]
+
+    batcher._decode_batch = decode_batch
+    return batcher
+
+class TestTranscriptionBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self, batcher):
+        audios = [np.zeros(16000 * (i + 1), dtype=np.float32) for i in range(3)]
+        results = await asyncio.gather(*(
+            batcher.transcribe(audio, model_name="base", language="en") for audio in audios
+        ))
+
+        assert batcher.batch_sizes == [3]
+        assert batcher.pool.checkouts == 1
+        assert [r["text"] for r in results] == [f"len={len(a)}" for a in audios]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self, batcher):
+        audios = [np.zeros(1600, dtype=np.float32) for _ in range(6)]
+        await asyncio.gather(*(batcher.transcribe(audio, "base", "en") for audio in audios))
+        assert batcher.batch_sizes == [4, 2]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_keyed_by_model_and_language(self, batcher):
+        audio = np.zeros(1600, dtype=np.float32)
+        await asyncio.gather(
+            batcher.transcribe(audio, "base", "en"),
+            batcher.transcribe(audio, "tiny", "en"),
+            batcher.transcribe(audio, "base", "de")
+        )
+        assert batcher.batch_sizes == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_keyed_by_profile(self, batcher):
+        audio = np.zeros(1600, dtype=np.float32)
+        await asyncio.gather(
+            batcher.transcribe(audio, "base", "en", profile="command"),
+            batcher.transcribe(audio, "base", "en", profile="dictation"),
+            batcher.transcribe(audio, "base", "en", profile="command")
+        )
+        assert sorted(batcher.batch_sizes) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_errors_fan_out_to_every_caller(self, batcher):
+        def failing_decode(model, audios, language, profile):
+            raise RuntimeError("decode failed")
+        batcher._decode_batch = failing_decode
+
+        audio = np.zeros(1600, dtype=np.float32)
+        results = await asyncio.gather(
+            batcher.transcribe(audio, "base", "en"),
+            batcher.transcribe(audio, "base", "en"),
+            return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_abandoned_batch_stops_decoding(self, batcher):
+        steps = []
+
+        def slow_decode(model, audios, language, profile):
+            for step in range(1000):
+                check_cancelled()
+                steps.append(step)
+                time.sleep(0.005)
+
+        batcher._decode_batch = slow_decode
+        audio = np.zeros(1600, dtype=np.float32)
+        callers = [asyncio.create_task(batcher.transcribe(audio, "base", "en")) for _ in range(2)]
+        await asyncio.sleep(0.1)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.gather(*batcher._running)
+
+        assert 0 < len(steps) < 1000
@@ -0,0 +1,132 @@
+import pytest
+import asyncio
+import threading
+import time
+from ..core.cancellation import (
+    CancellationToken, OperationCancelled, cancellation_scope, check_cancelled, current_token, run_cancellable,
+    stream_cancellable
+)
+
+def busy_loop(steps: int, progress: list) -> int:
+    """Stand-in for a decoder loop that checks its token every step"""
+    for step in range(steps):
+        check_cancelled()
+        progress.append(step)
+        time.sleep(0.005)
+    return steps
+
+def chunk_source(count: int, produced: list, release: threading.Event = None):
+    """Stand-in for a provider's blocking chunk iterator"""
+    for index in range(count):
+        check_cancelled()
+        produced.append(index)
+        yield index
+        if release is not None:
+            release.wait(1)
+
+class TestCancellationToken:
+    def test_children_follow_their_parent(self):
+        parent = CancellationToken()
+        child = parent.child()
+        parent.cancel("barge-in")
+        assert child.cancelled
+        assert child.reason == "barge-in"
+        with pytest.raises(OperationCancelled, match="barge-in"):
+            child.raise_if_cancelled()
+
+    def test_cancelling_a_child_leaves_the_parent(self):
+        parent = CancellationToken()
+        parent.child().cancel()
+        assert not parent.cancelled
+
+    @pytest.mark.asyncio
+    async def test_scope_is_inherited_by_tasks(self):
+        token = CancellationToken()
+        with cancellation_scope(token):
+            task = asyncio.create_task(asyncio.sleep(0, result=None))
+            assert current_token() is token
+        await task
+        assert current_token() is None
+
+class TestRunCancellable:
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        assert await run_cancellable(None, busy_loop, 3, []) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_stops_the_thread(self):
+        progress = []
+        task = asyncio.create_task(run_cancellable(None, busy_loop, 1000, progress))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The job had already stopped when the cancellation surfaced
+        stopped_at = len(progress)
+        await asyncio.sleep(0.05)
+        assert len(progress) == stopped_at < 1000
+
+    @pytest.mark.asyncio
+    async def test_request_token_aborts_the_job(self):
+        token = CancellationToken()
+        progress = []
+        with cancellation_scope(token):
+            job = asyncio.create_task(run_cancellable(None, busy_loop, 1000, progress))
+        await asyncio.sleep(0.05)
+        token.cancel("interrupted")
+        with pytest.raises(OperationCancelled, match="interrupted"):
+            await job
+        assert len(progress) < 1000
+
+    @pytest.mark.asyncio
+    async def test_thread_token_is_unbound_afterwards(self):
+        await run_cancellable(None, busy_loop, 1, [])
+        seen = []
+        await asyncio.get_running_loop().run_in_executor(None, lambda: seen.append(current_token()))
+        assert seen == [None]
+
+class TestStreamCancellable:
+    @pytest.mark.asyncio
+    async def test_yields_items_in_order(self):
+        items = [item async for item in stream_cancellable(None, chunk_source, 20, [], maxsize=4)]
+        assert items == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_first_item_arrives_before_the_source_finishes(self):
+        release = threading.Event()
+        stream = stream_cancellable(None, chunk_source, 3, [], release)
+        assert await asyncio.wait_for(stream.__anext__(), timeout=0.5) == 0
+        release.set()
+        assert [item async for item in stream] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_pauses_the_thread(self):
+        produced = []
+        stream = stream_cancellable(None, chunk_source, 100, produced, maxsize=4)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        assert len(produced) <= 6  # Handed over, queued, and one waiting for room
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closing_early_stops_the_thread(self):
+        produced = []
+        stream = stream_cancellable(None, chunk_source, 100, produced, maxsize=2)
+        await stream.__anext__()
+        await stream.aclose()
+
+        stopped_at = len(produced)
+        await asyncio.sleep(0.05)
+        assert len(produced) == stopped_at < 100
+
+    @pytest.mark.asyncio
+    async def test_source_errors_reach_the_consumer(self):
+        def failing():
+            yield b"audio"
+            raise ConnectionError("provider dropped")
+
+        stream = stream_cancellable(None, failing)
+        assert await stream.__anext__() == b"audio"
+        with pytest.raises(ConnectionError):
+            await stream.__anext__()
@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from ..core.voice.cascade import ModelCascade
+
+def transcript(text: str, confidence: float, no_speech_prob: float = 0.05):
+    return {
+        "text": text,
+        "language": "en",
+        "segments": [{"text": text, "confidence": confidence, "no_speech_prob": no_speech_prob}]
+    }
+
+@pytest.fixture
+def batcher():
+    return AsyncMock()
+
+@pytest.fixture
+def cascade(batcher):
+    return ModelCascade(batcher, first_tier="tiny", min_confidence=0.6, max_no_speech_prob=0.5)
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+class TestModelCascade:
+    @pytest.mark.asyncio
+    async def test_confident_first_tier_answers(self, cascade, batcher):
+        batcher.transcribe.return_value = transcript("open the door", 0.9)
+
+        result = await cascade.transcribe(AUDIO, model_name="small", language="en")
+
+        assert result["tier"] == "tiny.en"
+        assert result["escalated"] is False
+        batcher.transcribe.assert_awaited_once_with(AUDIO, model_name="tiny.en", language="en", profile=None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("first", [
+        transcript("open the dour", 0.3),
+        transcript("open the door", 0.9, no_speech_prob=0.8),
+        transcript("", 0.9)
+    ])
+    async def test_uncertain_first_tier_escalates(self, cascade, batcher, first):
+        batcher.transcribe.side_effect = [first, transcript("open the door", 0.95)]
+
+        result = await cascade.transcribe(AUDIO, model_name="small")
+
+        assert result["tier"] == "small"
+        assert result["escalated"] is True
+        assert result["text"] == "open the door"
+        assert [c.kwargs["model_name"] for c in batcher.transcribe.await_args_list] == ["tiny", "small"]
+
+    @pytest.mark.asyncio
+    async def test_single_tier_when_final_is_first(self, cascade, batcher):
+        batcher.transcribe.return_value = transcript("hi", 0.1)
+
+        result = await cascade.transcribe(AUDIO, model_name="tiny")
+
+        assert result["tier"] == "tiny"
+        assert batcher.transcribe.await_count == 1
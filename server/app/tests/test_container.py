@@ -0,0 +1,51 @@
+import pytest
+from fastapi import HTTPException
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from ..core.container import ServiceContainer
+from ..dependencies import get_command_processor, get_services, get_voice_service
+
+@pytest.fixture
+def container():
+    with patch('app.core.container.load_voice_registry') as registry, \
+         patch('app.core.container.TTSService') as tts, \
+         patch('app.core.container.AzureAIService') as azure, \
+         patch('app.core.container.CommandProcessor') as command, \
+         patch('app.core.container.VoiceProcessor'), \
+         patch('app.core.container.VoiceService') as voice:
+        command.return_value.warm_up = AsyncMock()
+        command.return_value.close = AsyncMock()
+        services = ServiceContainer()
+        yield services, SimpleNamespace(registry=registry, tts=tts, azure=azure, command=command, voice=voice)
+
+def test_services_are_built_once_and_shared(container):
+    services, mocks = container
+    mocks.tts.assert_called_once_with(voice_registry=services.voice_registry)
+    assert mocks.voice.call_args.kwargs["command_processor"] is services.command_processor
+
+    connection = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(services=services)))
+    first = get_voice_service(get_services(connection))
+    second = get_voice_service(get_services(connection))
+    assert first is second is services.voice_service
+    assert get_command_processor(services) is services.command_processor
+    mocks.voice.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_warm_up_and_shutdown_hooks(container):
+    services, _ = container
+    transcriber = Mock(init=AsyncMock(), close=AsyncMock())
+    with patch('app.core.container.get_transcriber', return_value=transcriber):
+        await services.warm_up()
+        transcriber.init.assert_awaited_once()
+        services.command_processor.warm_up.assert_awaited_once()
+
+        await services.shutdown()
+        services.command_processor.close.assert_awaited_once()
+        services.azure_ai_service.close.assert_called_once()
+        transcriber.close.assert_awaited_once()
+
+def test_missing_container_is_unavailable():
+    connection = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+    with pytest.raises(HTTPException) as exc:
+        get_services(connection)
+    assert exc.value.status_code == 503
@@ -0,0 +1,94 @@
+import pytest
+import asyncio
+import time
+from ..config import settings
+from ..core.cancellation import check_cancelled, run_cancellable
+from ..core.deadline import (
+    Deadline, DeadlineExceeded, current_deadline, deadline_scope, fits_budget, parse_budget,
+    require_budget, within_budget
+)
+from ..core.stats import StatsStore
+from ..core.voice.profiles import PROFILES, fit_to_budget
+
+class TestDeadline:
+    def test_budget_parsing(self, monkeypatch):
+        monkeypatch.setattr(settings, "REQUEST_BUDGET_MS", 0)
+        assert parse_budget(None) is None
+        assert 0.4 < parse_budget("500").remaining() <= 0.5
+        with pytest.raises(ValueError):
+            parse_budget("soon")
+
+    def test_default_budget_applies(self, monkeypatch):
+        monkeypatch.setattr(settings, "REQUEST_BUDGET_MS", 2000)
+        assert parse_budget(None).remaining() > 1.9
+
+    def test_require_without_deadline_is_a_no_op(self):
+        require_budget("stt", 10.0)
+        assert fits_budget(10.0)
+
+    def test_require_aborts_when_short(self):
+        with deadline_scope(Deadline.from_budget(100)):
+            assert current_deadline() is not None
+            require_budget("decode", 0.01)
+            with pytest.raises(DeadlineExceeded, match="tts"):
+                require_budget("tts", 0.5)
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_expiry_stops_executor_work(self):
+        steps = []
+
+        def decode():
+            for step in range(1000):
+                check_cancelled()
+                steps.append(step)
+                time.sleep(0.005)
+
+        with deadline_scope(Deadline.from_budget(50)):
+            with pytest.raises(DeadlineExceeded):
+                await run_cancellable(None, decode)
+        assert len(steps) < 1000
+
+    @pytest.mark.asyncio
+    async def test_within_budget_times_out(self):
+        with deadline_scope(Deadline.from_budget(20)):
+            with pytest.raises(DeadlineExceeded, match="ai"):
+                await within_budget(asyncio.sleep(1), "ai")
+
+class TestFitToBudget:
+    def test_full_decode_when_it_fits(self):
+        with deadline_scope(Deadline.from_budget(5000)):
+            assert fit_to_budget("small", "en", PROFILES["dictation"], 1.0) == ("small", PROFILES["dictation"], False)
+
+    def test_degrades_to_small_model_when_short(self, monkeypatch):
+        monkeypatch.setattr(settings, "WHISPER_CASCADE_ENABLED", True)
+        monkeypatch.setattr(settings, "WHISPER_CASCADE_MODEL", "tiny")
+        monkeypatch.setattr(settings, "WHISPER_ENGLISH_ONLY", True)
+        monkeypatch.setattr(settings, "WHISPER_LANGUAGE", "en")
+        with deadline_scope(Deadline.from_budget(500)):
+            model, profile, degraded = fit_to_budget("small", "en", PROFILES["dictation"], 2.0)
+        assert (model, profile.name, degraded) == ("tiny.en", "command", True)
+
+    def test_keeps_model_when_small_one_is_not_loaded(self, monkeypatch):
+        monkeypatch.setattr(settings, "WHISPER_CASCADE_ENABLED", False)
+        monkeypatch.setattr(settings, "WHISPER_POOL_MODELS", [])
+        monkeypatch.setattr(settings, "WHISPER_CASCADE_MODEL", "tiny")
+        with deadline_scope(Deadline.from_budget(500)):
+            model, profile, degraded = fit_to_budget("small", "en", PROFILES["dictation"], 2.0)
+        assert (model, profile.name, degraded) == ("small", "command", True)
+
+    def test_aborts_when_nothing_fits(self):
+        with deadline_scope(Deadline.from_budget(1)):
+            time.sleep(0.002)
+            with pytest.raises(DeadlineExceeded):
+                fit_to_budget("small", "en", PROFILES["command"], 2.0)
+
+class TestStageEstimate:
+    def test_needs_enough_samples(self):
+        store = StatsStore("test")
+        for _ in range(5):
+            store.observe("transcribe:command", 0.2)
+        assert store.estimate("transcribe:command", min_samples=10) is None
+        for _ in range(5):
+            store.observe("transcribe:command", 0.2)
+        assert store.estimate("transcribe:command", min_samples=10) == pytest.approx(0.2, rel=0.02)
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+import fakeredis.aioredis
+from scipy.signal import lfilter
+from ..core.cache import RedisClient
+from ..core.voice.fingerprint import FingerprintCache, fingerprint, similarity
+
+SAMPLE_RATE = 16000
+
+def vowel(f0, formants, seconds=0.2):
+    """A square-wave glottal source shaped by two formant resonators"""
+    n = int(seconds * SAMPLE_RATE)
+    out = 0.5 * np.sign(np.sin(2 * np.pi * f0 * np.arange(n) / SAMPLE_RATE))
+    for fc in formants:
+        r, theta = np.exp(-np.pi * 100 / SAMPLE_RATE), 2 * np.pi * fc / SAMPLE_RATE
+        out = lfilter([1 - r], [1, -2 * r * np.cos(theta), r * r], out)
+    return out * np.hanning(n)
+
+def utterance(vowels):
+    """A toy command: a few vowels padded with silence"""
+    pad = np.zeros(SAMPLE_RATE // 4)
+    audio = np.concatenate([pad, *(vowel(*v) for v in vowels), pad])
+    return (0.3 * audio / np.abs(audio).max()).astype(np.float32)
+
+LIGHTS_OFF = utterance([(120, (700, 1200)), (130, (300, 2300)), (110, (500, 900))])
+NEXT_TRACK = utterance([(140, (300, 900)), (125, (700, 1800)), (115, (400, 2000))])
+
+class TestFingerprint:
+    def test_robust_to_gain_noise_and_padding(self):
+        rng = np.random.default_rng(0)
+        repeat = np.concatenate([np.zeros(3000, np.float32), 0.5 * LIGHTS_OFF])
+        repeat = repeat + rng.normal(0, 0.001, len(repeat)).astype(np.float32)
+
+        assert similarity(fingerprint(LIGHTS_OFF), fingerprint(repeat)) > 0.9
+
+    def test_different_commands_differ(self):
+        assert similarity(fingerprint(LIGHTS_OFF), fingerprint(NEXT_TRACK)) < 0.8
+
+    def test_too_short_to_sketch(self):
+        assert fingerprint(np.zeros(100, np.float32)) is None
+        assert fingerprint(utterance([(120, (700, 1200), 0.1)])) is None
+
+    def test_steady_tone_has_no_voiced_span(self):
+        tone = 0.3 * np.sin(2 * np.pi * 220 * np.arange(SAMPLE_RATE) / SAMPLE_RATE)
+        assert fingerprint(tone.astype(np.float32)) is None
+
+class TestFingerprintCache:
+    @pytest.fixture
+    def redis(self):
+        return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    @pytest.fixture
+    def cache(self, redis, monkeypatch):
+        monkeypatch.setattr('app.config.settings.FINGERPRINT_CACHE_ENABLED', True)
+        client = RedisClient()
+        client._redis = redis  # Decoded responses, as RedisClient.init connects
+        return FingerprintCache(client)
+
+    def test_disabled_by_default(self):
+        assert FingerprintCache(RedisClient()).sketch(LIGHTS_OFF) is None
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_reuses_transcript(self, cache):
+        result = {"text": "lights off", "language": "en", "segments": []}
+        await cache.store(7, "command:en", cache.sketch(LIGHTS_OFF), result)
+
+        hit = await cache.lookup(7, "command:en", cache.sketch(0.8 * LIGHTS_OFF))
+
+        assert hit["text"] == "lights off"
+        assert hit["tier"] == "fingerprint"
+        assert hit["fingerprint_similarity"] > 0.9
+
+    @pytest.mark.asyncio
+    async def test_misses_other_users_scopes_and_commands(self, cache):
+        await cache.store(7, "command:en", cache.sketch(LIGHTS_OFF), {"text": "lights off"})
+
+        assert await cache.lookup(8, "command:en", cache.sketch(LIGHTS_OFF)) is None
+        assert await cache.lookup(7, "dictation:en", cache.sketch(LIGHTS_OFF)) is None
+        assert await cache.lookup(7, "command:en", cache.sketch(NEXT_TRACK)) is None
+
+    @pytest.mark.asyncio
+    async def test_index_is_bounded_per_user(self, cache):
+        cache.capacity = 2
+        for text in ("one", "two", "three"):
+            await cache.store(7, "command:en", cache.sketch(LIGHTS_OFF), {"text": text})
+
+        entries = await cache.cache.get_json("stt_fingerprint:7:command:en")
+        assert [e["result"]["text"] for e in entries] == ["two", "three"]
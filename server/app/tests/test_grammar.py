@@ -0,0 +1,75 @@
+import json
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, MagicMock, patch
+from ..core.voice.grammar import GrammarRecognizer, expand_pattern
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+def vosk_result(text: str, conf: float) -> str:
+    words = [{"word": w, "conf": conf, "start": i * 0.3, "end": i * 0.3 + 0.3} for i, w in enumerate(text.split())]
+    return json.dumps({"text": text, "result": words})
+
+@pytest.fixture
+def vosk():
+    module = MagicMock()
+    with patch.dict("sys.modules", {"vosk": module}):
+        yield module
+
+@pytest.fixture
+def recognizer(vosk):
+    fallback = AsyncMock()
+    fallback.transcribe.return_value = {"text": "whisper text", "language": "en", "segments": []}
+    return GrammarRecognizer(fallback, phrase_loader=lambda: ["turn on the lights", "stop"])
+
+class TestExpandPattern:
+    def test_plain_pattern_is_normalized(self):
+        assert expand_pattern("Turn on the lights!") == ["turn on the lights"]
+
+    def test_enumerated_placeholders_are_expanded(self):
+        phrases = expand_pattern("turn {state} the {room} lights", {"state": ["on", "off"], "room": ["kitchen"]})
+        assert phrases == ["turn on the kitchen lights", "turn off the kitchen lights"]
+
+    def test_open_placeholders_are_skipped(self):
+        assert expand_pattern("remind me to {task}", {"task": "string"}) == []
+
+class TestGrammarRecognizer:
+    @pytest.mark.asyncio
+    async def test_confident_phrase_skips_whisper(self, recognizer, vosk):
+        vosk.KaldiRecognizer.return_value.FinalResult.return_value = vosk_result("turn on the lights", 0.97)
+
+        result = await recognizer.transcribe(AUDIO, language="en")
+
+        assert result["text"] == "turn on the lights"
+        assert result["tier"] == "grammar"
+        assert result["segments"][0]["confidence"] == pytest.approx(0.97)
+        recognizer.fallback.transcribe.assert_not_awaited()
+        grammar = json.loads(vosk.KaldiRecognizer.call_args.args[2])
+        assert grammar == ["stop", "turn on the lights", "[unk]"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text,conf", [("turn on the lights", 0.5), ("turn on the", 0.99), ("", 0.0)])
+    async def test_poor_results_fall_back_to_whisper(self, recognizer, vosk, text, conf):
+        vosk.KaldiRecognizer.return_value.FinalResult.return_value = vosk_result(text, conf)
+
+        result = await recognizer.transcribe(AUDIO, model_name="base", language="en")
+
+        assert result["text"] == "whisper text"
+        recognizer.fallback.transcribe.assert_awaited_once_with(AUDIO, model_name="base", language="en", profile=None)
+
+    @pytest.mark.asyncio
+    async def test_long_or_foreign_audio_goes_straight_to_whisper(self, recognizer, vosk):
+        await recognizer.transcribe(np.zeros(16000 * 10, dtype=np.float32), language="en")
+        await recognizer.transcribe(AUDIO, language="de")
+
+        vosk.KaldiRecognizer.assert_not_called()
+        assert recognizer.fallback.transcribe.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recognizers_are_reused(self, recognizer, vosk):
+        vosk.KaldiRecognizer.return_value.FinalResult.return_value = vosk_result("stop", 0.99)
+
+        await recognizer.transcribe(AUDIO)
+        await recognizer.transcribe(AUDIO)
+
+        assert vosk.KaldiRecognizer.call_count == 1
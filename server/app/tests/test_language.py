@@ -0,0 +1,62 @@
+import pytest
+import fakeredis.aioredis
+from unittest.mock import AsyncMock
+from ..core.cache import RedisClient
+from ..core.voice.language import LanguageRouter, route_model
+
+@pytest.fixture
+def cache():
+    cache = AsyncMock()
+    cache.get_json.return_value = None
+    return cache
+
+@pytest.fixture
+def router(cache):
+    return LanguageRouter(cache)
+
+class TestRouteModel:
+    def test_english_uses_en_checkpoint(self):
+        assert route_model("base", "en") == "base.en"
+        assert route_model("large-v3", "en") == "large-v3"
+
+    def test_other_languages_use_configured_pool(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.WHISPER_LANGUAGE_MODELS', {"de": "small"})
+        assert route_model("base", "de") == "small"
+        assert route_model("base", "fr") == "base"
+
+    def test_unknown_language_keeps_multilingual_model(self):
+        assert route_model("base", None) == "base"
+
+class TestLanguageRouter:
+    @pytest.mark.asyncio
+    async def test_declared_language_wins(self, router, cache):
+        assert await router.route("base", user_id=1, language="EN") == ("base.en", "en")
+        cache.get_json.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_user_language_skips_detection(self, router, cache):
+        cache.get_json.return_value = "de"
+        assert await router.route("base", user_id=7) == ("base", "de")
+        cache.get_json.assert_awaited_once_with("stt_language:7")
+
+    @pytest.mark.asyncio
+    async def test_detects_when_nothing_is_known(self, router, monkeypatch):
+        monkeypatch.setattr('app.config.settings.WHISPER_LANGUAGE', "auto")
+        assert await router.route("base", user_id=7) == ("base", None)
+
+    @pytest.mark.asyncio
+    async def test_remembers_detected_language(self, router, cache):
+        await router.remember(7, "fr")
+        await router.remember(None, "fr")
+        cache.set_json.assert_awaited_once()
+        assert cache.set_json.call_args.args[:2] == ("stt_language:7", "fr")
+
+@pytest.mark.asyncio
+async def test_remembered_language_round_trips_through_redis(monkeypatch):
+    monkeypatch.setattr('app.config.settings.WHISPER_LANGUAGE', "auto")
+    client = RedisClient()
+    client._redis = fakeredis.aioredis.FakeRedis(decode_responses=True)  # As RedisClient.init connects
+    router = LanguageRouter(client)
+
+    await router.remember(7, "de")
+    assert await router.route("base", user_id=7) == ("base", "de")
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from ..core.voice.longform import LongFormTranscriber, Window
+
+SAMPLE_RATE = 16000
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 200 * t) * 0.8).astype(np.float32)
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+def transcript(text: str, duration: float, **extra):
+    return {"text": text, "language": "en", "segments": [
+        {"start": 0.0, "end": duration, "text": text, "confidence": 0.9}
+    ], **extra}
+
+@pytest.fixture
+def long_form():
+    return LongFormTranscriber(AsyncMock(), window_seconds=10, min_window_seconds=5, overlap_ms=1000)
+
+class TestLongFormTranscriber:
+    def test_short_audio_is_one_window(self, long_form):
+        assert long_form.plan_windows(tone(8)) == [Window(0, 8 * SAMPLE_RATE, False)]
+
+    def test_cuts_inside_pauses(self, long_form):
+        audio = np.concatenate([tone(7), silence(1), tone(7), silence(1), tone(4)])
+        windows = long_form.plan_windows(audio)
+
+        assert len(windows) == 3
+        assert all(w.end - w.start <= 10 * SAMPLE_RATE for w in windows)
+        assert not any(w.overlaps_previous for w in windows)
+        # First cut lands in the middle of the first pause
+        assert windows[0].end == pytest.approx(7.5 * SAMPLE_RATE, abs=0.05 * SAMPLE_RATE)
+        assert windows[-1].end == len(audio)
+
+    def test_hard_cut_overlaps_without_pause(self, long_form):
+        # Trailing silence gives the adaptive VAD a noise floor; it is out of reach of the first cuts
+        windows = long_form.plan_windows(np.concatenate([tone(25), silence(3)]))
+
+        assert windows[0] == Window(0, 10 * SAMPLE_RATE, False)
+        assert windows[1].start == 9 * SAMPLE_RATE
+        assert windows[1].overlaps_previous
+
+    @pytest.mark.asyncio
+    async def test_transcribes_windows_concurrently_and_stitches(self, long_form):
+        audio = np.concatenate([tone(7), silence(1), tone(7)])
+        long_form.transcriber.transcribe.side_effect = [
+            transcript("turn on the lights", 7.5),
+            transcript("and close the blinds", 7.5)
+        ]
+
+        result = await long_form.transcribe(audio, model_name="base", language="en")
+
+        assert long_form.transcriber.transcribe.await_count == 2
+        assert result["text"] == "turn on the lights and close the blinds"
+        assert result["windows"] == 2
+        assert result["segments"][1]["start"] == pytest.approx(7.5, abs=0.05)
+        assert [s["id"] for s in result["segments"]] == [0, 1]
+
+    def test_stitch_drops_words_repeated_across_hard_cut(self, long_form):
+        windows = [Window(0, 160000, False), Window(144000, 200000, True)]
+        results = [
+            transcript("please remind me to call the", 10.0),
+            transcript("call the dentist tomorrow", 3.5, tier="small", escalated=True)
+        ]
+
+        result = long_form.stitch(windows, results)
+
+        assert result["text"] == "please remind me to call the dentist tomorrow"
+        assert result["segments"][1]["start"] == pytest.approx(10.0)
+        assert result["tier"] == "small"
+        assert result["escalated"] is True
@@ -0,0 +1,99 @@
+import pytest
+import io
+import base64
+import asyncio
+import sys
+import numpy as np
+from scipy.io import wavfile
+from ..core.media import AudioDecodeError, TranscodeError, decode_audio, image_data_url, pipe_stream
+
+def make_wav(samples: np.ndarray, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    wavfile.write(buffer, sample_rate, samples)
+    return buffer.getvalue()
+
+class TestDecodeAudio:
+    def test_decodes_int16_wav(self):
+        samples = (np.sin(np.linspace(0, 100, 16000)) * 16000).astype(np.int16)
+        audio = decode_audio(make_wav(samples))
+
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, samples / 32768.0, atol=1e-6)
+
+    def test_decodes_float32_stereo_wav_to_mono(self):
+        left = np.full(1600, 0.5, dtype=np.float32)
+        right = np.full(1600, -0.25, dtype=np.float32)
+        audio = decode_audio(make_wav(np.stack([left, right], axis=1)))
+
+        assert audio.shape == (1600,)
+        np.testing.assert_allclose(audio, 0.125, atol=1e-6)
+
+    def test_accepts_memoryview_and_resamples(self):
+        samples = np.zeros(44100, dtype=np.int16)
+        audio = decode_audio(memoryview(make_wav(samples, 44100)))
+        assert len(audio) == 16000
+
+    def test_rejects_empty_payload(self):
+        with pytest.raises(AudioDecodeError):
+            decode_audio(b"")
+
+    def test_rejects_truncated_wav(self):
+        with pytest.raises(AudioDecodeError):
+            decode_audio(b"RIFF\x00\x00\x00\x00WAVE")
+
+    @pytest.mark.parametrize("cut", [20, 24, 30])  # Inside the fmt chunk's fields
+    def test_rejects_truncated_fmt_chunk(self, cut):
+        wav = make_wav(np.zeros(160, dtype=np.int16))
+        with pytest.raises(AudioDecodeError):
+            decode_audio(wav[:cut])
+
+    def test_rejects_undersized_fmt_chunk(self):
+        wav = make_wav(np.zeros(160, dtype=np.int16))
+        short_fmt = wav[:12] + b"fmt \x08\x00\x00\x00" + wav[20:28] + wav[36:]
+        with pytest.raises(AudioDecodeError):
+            decode_audio(short_fmt)
+
+def test_image_data_url():
+    url = image_data_url(b"\xff\xd8\xff", "jpeg")
+    assert url.startswith("data:image/jpeg;base64,")
+    assert base64.b64decode(url.split(",", 1)[1]) == b"\xff\xd8\xff"
+
+async def chunks_of(*chunks: bytes, error: Exception = None):
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(0)
+    if error is not None:
+        raise error
+
+class TestPipeStream:
+    @pytest.mark.asyncio
+    async def test_output_streams_before_input_ends(self):
+        release = asyncio.Event()
+
+        async def slow_input():
+            yield b"first"
+            await release.wait()
+            yield b"second"
+
+        stream = pipe_stream(["cat"], slow_input())
+        assert await asyncio.wait_for(stream.__anext__(), timeout=2) == b"first"
+        release.set()
+        assert b"".join([chunk async for chunk in stream]) == b"second"
+
+    @pytest.mark.asyncio
+    async def test_input_failure_surfaces(self):
+        with pytest.raises(ConnectionError):
+            async for _ in pipe_stream(["cat"], chunks_of(b"audio", error=ConnectionError("provider dropped"))):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_process_failure_raises(self):
+        with pytest.raises(TranscodeError):
+            async for _ in pipe_stream([sys.executable, "-c", "import sys; sys.exit(1)"], chunks_of(b"audio")):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_missing_encoder_raises(self):
+        with pytest.raises(TranscodeError):
+            async for _ in pipe_stream(["no-such-encoder"], chunks_of(b"audio")):
+                pass
@@ -0,0 +1,91 @@
+import pytest
+import asyncio
+from unittest.mock import Mock, patch
+from ..core.voice.model_pool import WhisperModelPool
+
+@pytest.fixture
+def model_pool(monkeypatch):
+    monkeypatch.setattr('app.config.settings.WHISPER_MODEL', "base")
+    monkeypatch.setattr('app.config.settings.WHISPER_POOL_MODELS', ["tiny"])
+    monkeypatch.setattr('app.config.settings.WHISPER_POOL_REPLICAS', 2)
+    monkeypatch.setattr('app.config.settings.WHISPER_ENGLISH_ONLY', False)
+    monkeypatch.setattr('app.config.settings.WHISPER_MMAP_WEIGHTS', False)
+    with patch('app.core.voice.model_pool.whisper.load_model') as mock_load, \
+         patch('app.core.voice.model_pool.copy.deepcopy', side_effect=lambda m: Mock(name="replica")):
+        mock_load.side_effect = lambda name, **kwargs: Mock(name=name)
+        pool = WhisperModelPool()
+        pool.device = "cpu"
+        pool.load_model = mock_load
+        yield pool
+
+class TestWhisperModelPool:
+    @pytest.mark.asyncio
+    async def test_loads_each_model_once(self, model_pool):
+        await model_pool.init()
+        await model_pool.init()
+
+        assert model_pool.load_model.call_count == 2
+        assert model_pool.stats() == {
+            "base": {"replicas": 2, "available": 2},
+            "tiny": {"replicas": 2, "available": 2}
+        }
+
+    def test_english_default_loads_en_checkpoints(self, model_pool, monkeypatch):
+        monkeypatch.setattr('app.config.settings.WHISPER_ENGLISH_ONLY', True)
+        monkeypatch.setattr('app.config.settings.WHISPER_LANGUAGE', "en")
+        assert model_pool.model_names == ["base.en", "tiny.en"]
+
+    @pytest.mark.asyncio
+    async def test_checkout_and_checkin(self, model_pool):
+        first = await model_pool.checkout("base")
+        second = await model_pool.checkout("base")
+        assert first is not second
+        assert model_pool.stats()["base"]["available"] == 0
+
+        waiter = asyncio.create_task(model_pool.checkout("base"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        model_pool.checkin("base", first)
+        assert await asyncio.wait_for(waiter, timeout=1) is first
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_replica(self, model_pool):
+        async with model_pool.acquire() as model:
+            assert model is not None
+            assert model_pool.stats()["base"]["available"] == 1
+        assert model_pool.stats()["base"]["available"] == 2
+
+    @pytest.mark.asyncio
+    async def test_loads_quantized_model_on_cpu(self, model_pool, monkeypatch):
+        monkeypatch.setattr('app.config.settings.WHISPER_QUANTIZATION', "int8")
+        with patch('app.core.voice.model_pool.load_quantized_model') as mock_quantized:
+            mock_quantized.side_effect = lambda name, scheme, model_dir: Mock(name=f"{name}-{scheme}")
+            await model_pool.init(["base"])
+
+        mock_quantized.assert_called_once()
+        assert mock_quantized.call_args.args[:2] == ("base", "int8")
+        model_pool.load_model.assert_not_called()
+
+    def test_preloaded_replicas_are_reused_by_workers(self, model_pool):
+        model_pool.preload(["base"])  # In the gunicorn master, no event loop yet
+        assert model_pool.load_model.call_count == 1
+
+        async def worker():
+            await model_pool.init(["base"])
+            return await model_pool.checkout("base")
+
+        assert asyncio.run(worker()) in model_pool._replicas["base"]
+        assert model_pool.load_model.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_maps_weights_from_cache(self, model_pool, monkeypatch):
+        monkeypatch.setattr('app.config.settings.WHISPER_MMAP_WEIGHTS', True)
+        with patch('app.core.voice.model_pool.load_mapped_model') as mock_mapped:
+            mock_mapped.side_effect = lambda name, model_dir, device: Mock(name=f"{name}-mapped")
+            await model_pool.init(["base"])
+
+        # Every replica maps the file itself instead of deep-copying the first
+        assert [c.args[0] for c in mock_mapped.call_args_list] == ["base", "base"]
+        assert [m._mock_name for m in model_pool._replicas["base"]] == ["base-mapped", "base-mapped"]
+        model_pool.load_model.assert_not_called()
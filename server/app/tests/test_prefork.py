@@ -0,0 +1,26 @@
+import pytest
+from unittest.mock import patch
+from ..core.prefork import configure_worker, worker_threads
+
+class TestPrefork:
+    def test_splits_cores_between_workers(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.TORCH_NUM_THREADS', 0)
+        with patch('app.core.prefork.os.cpu_count', return_value=8):
+            assert worker_threads(1) == 8
+            assert worker_threads(4) == 2
+            assert worker_threads(16) == 1
+
+    def test_explicit_thread_count_wins(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.TORCH_NUM_THREADS', 3)
+        assert worker_threads(4) == 3
+
+    def test_configure_worker_sets_torch_and_ctranslate2_threads(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.TORCH_NUM_THREADS', 0)
+        monkeypatch.setattr('app.config.settings.CT2_CPU_THREADS', 0)
+        with patch('app.core.prefork.os.cpu_count', return_value=8), \
+             patch('app.core.prefork.torch.set_num_threads') as set_threads:
+            configure_worker(2)
+
+        set_threads.assert_called_once_with(4)
+        from ..config import settings
+        assert settings.CT2_CPU_THREADS == 4
@@ -0,0 +1,134 @@
+import io
+import pytest
+import numpy as np
+import fakeredis.aioredis
+from scipy.io import wavfile
+from unittest.mock import patch
+from ..core.cache import RedisClient
+from ..core.voice.fingerprint import FingerprintCache
+from ..core.voice.language import LanguageRouter
+from ..core.voice.processor import VoiceProcessor
+
+class FakeBackend:
+    def __init__(self):
+        self.calls = []
+
+    async def transcribe(self, audio, model_name=None, language=None, profile=None):
+        self.calls.append((model_name, language, profile))
+        return {
+            "text": "lights off",
+            "language": "en",
+            "segments": [{"text": "lights off", "confidence": np.float32(0.9)}]
+        }
+
+class OnsetBackend(FakeBackend):
+    """Reports one segment starting where its window's audio turns loud"""
+
+    async def transcribe(self, audio, model_name=None, language=None, profile=None):
+        self.calls.append((model_name, language, profile))
+        onset = np.flatnonzero(np.abs(audio) > 0.1)[0] / 16000
+        return {
+            "text": "note",
+            "language": "en",
+            "segments": [{"text": "note", "start": onset, "end": len(audio) / 16000, "confidence": 0.9}]
+        }
+
+def tone_wav(parts, sample_rate: int = 16000) -> bytes:
+    """WAV of ``(seconds, amplitude)`` stretches of a 220 Hz tone"""
+    chunks = []
+    for seconds, amplitude in parts:
+        t = np.arange(int(seconds * sample_rate)) / sample_rate
+        chunks.append((np.sin(2 * np.pi * 220 * t) * amplitude * 8000).astype(np.int16))
+    buffer = io.BytesIO()
+    wavfile.write(buffer, sample_rate, np.concatenate(chunks))
+    return buffer.getvalue()
+
+def speech_wav(seconds: float = 1.0, sample_rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = np.clip(np.sin(np.pi * t / seconds) * 2, 0, 1)  # Fades in and out like an utterance
+    samples = (np.sin(2 * np.pi * 220 * t) * envelope * 8000).astype(np.int16)
+    samples = np.concatenate([np.zeros(sample_rate // 4, np.int16), samples, np.zeros(sample_rate // 4, np.int16)])
+    buffer = io.BytesIO()
+    wavfile.write(buffer, sample_rate, samples)
+    return buffer.getvalue()
+
+@pytest.fixture
+def cache():
+    # Configured like the app's RedisClient connection
+    client = RedisClient()
+    client._redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return client
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+@pytest.fixture
+def processor(cache, backend, monkeypatch):
+    monkeypatch.setattr('app.config.settings.WHISPER_LANGUAGE', "auto")
+    with patch('app.core.voice.processor.get_transcriber', return_value=backend):
+        processor = VoiceProcessor()
+    processor.cache = cache
+    processor.language_router = LanguageRouter(cache)
+    processor.fingerprints = FingerprintCache(cache)
+    return processor
+
+class TestVoiceProcessor:
+    @pytest.mark.asyncio
+    async def test_transcribes_through_the_backend(self, processor, backend):
+        result = await processor.process_audio(speech_wav(), user_id="7", profile="command")
+
+        assert result["text"] == "lights off"
+        assert result["confidence"] == pytest.approx(0.9)
+        assert result["processing_metadata"]["profile"] == "command"
+        assert [profile for _, _, profile in backend.calls] == ["command"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_upload_is_served_from_cache(self, processor, backend):
+        audio = speech_wav()
+        first = await processor.process_audio(audio, user_id="7", language="en")
+        second = await processor.process_audio(audio, user_id="7", language="en")
+
+        assert second == first
+        assert len(backend.calls) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("english_only, models", [
+        (False, ["base"]),  # The detected language routes to the same model: a hit
+        (True, ["base", "base.en"])  # Now routed to the English model: decoded again
+    ])
+    async def test_repeat_after_detection_follows_the_route(self, processor, backend, monkeypatch, english_only, models):
+        monkeypatch.setattr('app.config.settings.WHISPER_MODEL', "base")
+        monkeypatch.setattr('app.config.settings.WHISPER_ENGLISH_ONLY', english_only)
+        audio = speech_wav()
+        await processor.process_audio(audio, user_id="7")
+        await processor.process_audio(audio, user_id="7")
+
+        assert [model for model, _, _ in backend.calls] == models
+
+    @pytest.mark.asyncio
+    async def test_rejects_audio_that_is_not_wav(self, processor, backend):
+        with pytest.raises(Exception):
+            await processor.process_audio(b"not audio", user_id="7")
+        assert backend.calls == []
+
+    @pytest.mark.asyncio
+    async def test_long_form_timestamps_follow_the_recording(self, processor):
+        processor.long_form.transcriber = OnsetBackend()
+        audio = tone_wav([(20.0, 1.0), (10.0, 0.0), (15.0, 1.0)])  # Speech resumes at 30 s
+
+        result = await processor.process_audio(audio, user_id="7", long_form=True)
+
+        assert result["processing_metadata"]["windows"] == 2
+        assert result["segments"][1]["start"] == pytest.approx(30.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_cached_transcript_is_not_shared_across_languages(self, processor, backend):
+        await processor.language_router.remember("7", "en")
+        await processor.language_router.remember("8", "de")
+        audio = speech_wav()
+
+        await processor.process_audio(audio, user_id="7")
+        await processor.process_audio(audio, user_id="8")
+
+        assert [language for _, language, _ in backend.calls] == ["en", "de"]
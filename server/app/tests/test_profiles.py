@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from ..core.voice.batcher import TranscriptionBatcher
+from ..core.voice.profiles import PROFILES, get_profile, resolve_profile
+
+def decoding(text: str, avg_logprob: float = -0.2, compression_ratio: float = 1.2, no_speech_prob: float = 0.01):
+    return SimpleNamespace(
+        text=text, language="en", tokens=[1], temperature=0.0,
+        avg_logprob=avg_logprob, compression_ratio=compression_ratio, no_speech_prob=no_speech_prob
+    )
+
+class TestProfiles:
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_profile("karaoke")
+
+    def test_requests_without_a_profile_keep_whisper_defaults(self):
+        profile = resolve_profile(None)
+        assert profile.name == "default"
+        assert profile.sample_len is None
+        assert profile.temperatures == (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+    def test_long_form_defaults_to_dictation(self):
+        assert resolve_profile(None, long_form=True).name == "dictation"
+        assert resolve_profile("command", long_form=True).name == "command"
+
+    def test_command_profile_is_single_greedy_pass(self):
+        command = PROFILES["command"]
+        assert command.beam_size is None
+        assert command.temperatures == (0.0,)
+        assert command.condition_on_previous_text is False
+        assert command.sample_len is not None
+
+    @pytest.mark.parametrize("result,expected", [
+        (decoding("ok"), False),
+        (decoding("again again again", compression_ratio=3.0), True),
+        (decoding("mumble", avg_logprob=-1.5), True),
+        (decoding("", avg_logprob=-1.5, no_speech_prob=0.9), False)
+    ])
+    def test_needs_fallback(self, result, expected):
+        assert PROFILES["dictation"].needs_fallback(result) is expected
+
+class TestBatchedFallback:
+    def decode(self, audios, profile, outcomes):
+        """Run ``_decode_batch`` with ``whisper.decode`` answering from ``outcomes[temperature]``"""
+        calls = []
+
+        def fake_decode(model, mel, options):
+            calls.append((options.temperature, len(mel)))
+            return [outcomes[options.temperature] for _ in range(len(mel))]
+
+        model = MagicMock()
+        with patch("app.core.voice.batcher.whisper") as whisper, \
+                patch("app.core.voice.batcher.torch") as torch:
+            whisper.audio.SAMPLE_RATE = 16000
+            whisper.DecodingOptions.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+            whisper.decode.side_effect = fake_decode
+            torch.stack.return_value.to.return_value = np.zeros((len(audios), 80, 3000))
+            results = TranscriptionBatcher(MagicMock())._decode_batch(model, audios, "en", get_profile(profile))
+        return results, calls
+
+    def test_command_never_retries(self):
+        audios = [np.zeros(1600, dtype=np.float32)] * 2
+        results, calls = self.decode(audios, "command", {0.0: decoding("mumble", avg_logprob=-2.0)})
+        assert calls == [(0.0, 2)]
+        assert [r["text"] for r in results] == ["mumble", "mumble"]
+
+    def test_dictation_retries_rejected_decodes(self):
+        audios = [np.zeros(1600, dtype=np.float32)] * 3
+        outcomes = {0.0: decoding("mumble", avg_logprob=-2.0), 0.2: decoding("open the door")}
+        results, calls = self.decode(audios, "dictation", outcomes)
+        assert calls == [(0.0, 3), (0.2, 3)]
+        assert [r["text"] for r in results] == ["open the door"] * 3
@@ -0,0 +1,40 @@
+import os
+import pytest
+import torch
+from torch import nn
+from unittest.mock import patch
+from ..core.voice import quantization
+
+class CastingLinear(nn.Linear):
+    """Stand-in for whisper.model.Linear"""
+
+class TinyModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.proj = CastingLinear(8, 4)
+        self.blocks = nn.Sequential(nn.Linear(4, 4), nn.ReLU())
+
+    def forward(self, x):
+        return self.blocks(self.proj(x))
+
+class TestQuantization:
+    def test_quantizes_linear_subclasses(self):
+        model = quantization.quantize_dynamic(TinyModel())
+
+        assert isinstance(model.proj, torch.ao.nn.quantized.dynamic.Linear)
+        assert isinstance(model.blocks[0], torch.ao.nn.quantized.dynamic.Linear)
+        assert model(torch.randn(2, 8)).shape == (2, 4)
+
+    def test_reuses_disk_cache(self, tmp_path):
+        with patch('app.core.voice.quantization.whisper.load_model', side_effect=lambda *a, **k: TinyModel()) as mock_load:
+            first = quantization.load_quantized_model("tiny", "int8", str(tmp_path))
+            second = quantization.load_quantized_model("tiny", "int8", str(tmp_path))
+
+        assert mock_load.call_count == 1
+        assert os.path.exists(quantization.cache_path("tiny", "int8", str(tmp_path)))
+        x = torch.randn(1, 8)
+        assert torch.allclose(first(x), second(x))
+
+    def test_rejects_unknown_scheme(self, tmp_path):
+        with pytest.raises(ValueError):
+            quantization.load_quantized_model("tiny", "int4", str(tmp_path))
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from scipy.signal import resample_poly
+from ..core.resampler import StreamingResampler, get_filter_bank, output_length, resample
+
+def noise(n: int) -> np.ndarray:
+    return np.random.default_rng(0).standard_normal(n).astype(np.float32)
+
+class TestResampler:
+    @pytest.mark.parametrize("src_rate,dst_rate", [(48000, 16000), (44100, 16000), (8000, 16000)])
+    def test_matches_resample_poly(self, src_rate, dst_rate):
+        audio = noise(src_rate // 2)
+        up, down = get_filter_bank(src_rate, dst_rate)[:2]
+
+        out = resample(audio, src_rate, dst_rate)
+
+        assert out.dtype == np.float32
+        assert len(out) == output_length(len(audio), src_rate, dst_rate)
+        np.testing.assert_allclose(out, resample_poly(audio, up, down), atol=1e-4)
+
+    def test_same_rate_is_passthrough(self):
+        audio = noise(1000)
+        assert resample(audio, 16000, 16000) is audio
+
+    def test_filter_bank_is_cached(self):
+        get_filter_bank.cache_clear()
+        resample(noise(4800), 48000, 16000)
+        resample(noise(4800), 48000, 16000)
+        assert get_filter_bank.cache_info().hits >= 1
+        assert get_filter_bank.cache_info().misses == 1
+
+    def test_attenuates_above_nyquist(self):
+        t = np.arange(48000) / 48000
+        tone = np.sin(2 * np.pi * 10000 * t).astype(np.float32)
+
+        out = resample(tone, 48000, 16000)
+
+        # A 10 kHz tone cannot be represented at 16 kHz and must not fold back
+        assert np.sqrt(np.mean(out[100:-100] ** 2)) < 0.01
+
+class TestStreamingResampler:
+    @pytest.mark.parametrize("src_rate,chunk", [(48000, 960), (44100, 441), (44100, 1000), (8000, 160)])
+    def test_chunked_output_matches_one_shot(self, src_rate, chunk):
+        audio = noise(src_rate // 2 + 17)
+        resampler = StreamingResampler(src_rate, 16000)
+
+        pieces = [resampler.process(audio[i:i + chunk]) for i in range(0, len(audio), chunk)]
+        pieces.append(resampler.flush())
+
+        np.testing.assert_allclose(np.concatenate(pieces), resample(audio, src_rate, 16000), atol=1e-5)
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch
+from ..core.stats import LatencyHistogram, StatsStore
+
+class TestLatencyHistogram:
+    def test_quantiles_within_bucket_precision(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.mean == pytest.approx(0.5005)
+        assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+        assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.quantile(1.0) == pytest.approx(1.0)
+
+    def test_bucket_count_is_bounded(self):
+        histogram = LatencyHistogram()
+        for i in range(100_000):
+            histogram.record(i / 10_000)
+        assert len(histogram._counts) < 2048
+
+class TestStatsStore:
+    def test_ring_buffer_keeps_most_recent(self):
+        store = StatsStore("test", capacity=3, ttl_seconds=60)
+        for i in range(5):
+            store.record(f"job{i}", {"i": i})
+
+        assert list(store.recent()) == ["job4", "job3", "job2"]
+        assert store.get("job0") is None
+        assert list(store.recent(limit=1)) == ["job4"]
+
+    def test_ttl_eviction(self):
+        store = StatsStore("test", capacity=10, ttl_seconds=5)
+        with patch('app.core.stats.time.monotonic', return_value=100.0):
+            store.record("old", {})
+        with patch('app.core.stats.time.monotonic', return_value=103.0):
+            store.record("new", {})
+        with patch('app.core.stats.time.monotonic', return_value=106.0):
+            assert list(store.recent()) == ["new"]
+            assert store.summary()["recent"] == 1
+
+    def test_records_are_updated_in_place(self):
+        store = StatsStore("test", capacity=10, ttl_seconds=60)
+        record = store.record("job", {"status": "processing"})
+        record["status"] = "completed"
+        assert store.get("job")["status"] == "completed"
+
+    def test_stage_aggregates(self):
+        store = StatsStore("test", capacity=1, ttl_seconds=60)
+        store.observe("transcribe", 0.2)
+        store.observe("transcribe", 0.4, error=True)
+
+        stage = store.summary()["stages"]["transcribe"]
+        assert stage["count"] == 2
+        assert stage["errors"] == 1
+        assert stage["mean_ms"] == pytest.approx(300, rel=0.01)
+        assert stage["max_ms"] == pytest.approx(400)
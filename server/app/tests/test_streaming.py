@@ -0,0 +1,92 @@
+import pytest
+import asyncio
+import numpy as np
+from unittest.mock import AsyncMock
+from ..core.voice.streaming import StreamingTranscriber, parse_sample_rate
+
+SAMPLE_RATE = 16000
+
+def pcm(seconds: float, amplitude: float = 0.0, sample_rate: int = SAMPLE_RATE) -> bytes:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * 220 * t) * amplitude * 32767).astype("<i2").tobytes()
+
+@pytest.fixture
+def stream(monkeypatch):
+    monkeypatch.setattr('app.config.settings.STREAM_PARTIAL_INTERVAL_MS', 200)
+    monkeypatch.setattr('app.config.settings.STREAM_SILENCE_MS', 400)
+    monkeypatch.setattr('app.config.settings.STREAM_SILENCE_THRESHOLD', 0.01)
+
+    batcher = AsyncMock()
+    batcher.transcribe.side_effect = lambda audio, model_name=None, language=None, profile=None: {
+        "text": f"{len(audio)} samples",
+        "language": language,
+        "segments": [{"confidence": 0.9}]
+    }
+    events = []
+
+    async def on_event(event):
+        events.append(event)
+
+    stream = StreamingTranscriber(on_event=on_event, batcher=batcher, language="en")
+    stream.events = events
+    return stream
+
+class TestStreamingTranscriber:
+    @pytest.mark.asyncio
+    async def test_emits_partials_while_speaking(self, stream):
+        for _ in range(5):
+            await stream.push(pcm(0.1, amplitude=0.5))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        kinds = [e["type"] for e in stream.events]
+        assert kinds and set(kinds) == {"partial"}
+
+    @pytest.mark.asyncio
+    async def test_finalizes_on_trailing_silence(self, stream):
+        await stream.push(pcm(0.5, amplitude=0.5))
+        await stream.push(pcm(0.5))
+        await asyncio.sleep(0.01)
+
+        finals = [e for e in stream.events if e["type"] == "final"]
+        assert len(finals) == 1
+        # Trailing silence is trimmed before the final decode
+        assert finals[0]["text"] == f"{int(0.5 * SAMPLE_RATE)} samples"
+        assert finals[0]["start"] == 0.0
+        assert finals[0]["end"] == 0.5
+        assert stream.events[-1]["type"] == "final"
+
+    @pytest.mark.asyncio
+    async def test_silence_only_stream_emits_nothing(self, stream):
+        await stream.push(pcm(1.0))
+        await stream.finalize()
+        assert stream.events == []
+        stream.batcher.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_explicit_finalize(self, stream):
+        await stream.push(pcm(0.1, amplitude=0.5))
+        await stream.finalize()
+        assert stream.events[-1]["type"] == "final"
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_end_drains_the_resampler_tail(self, stream):
+        stream = StreamingTranscriber(on_event=stream.on_event, batcher=stream.batcher, sample_rate=48000, language="en")
+        for _ in range(3):
+            await stream.push(pcm(0.1, amplitude=0.5, sample_rate=48000))
+        await stream.end()
+
+        audio = stream.batcher.transcribe.call_args.args[0]
+        assert len(audio) == int(0.3 * SAMPLE_RATE)
+
+class TestParseSampleRate:
+    def test_accepts_supported_rates(self):
+        assert parse_sample_rate(None) == SAMPLE_RATE
+        assert parse_sample_rate(48000) == 48000
+        assert parse_sample_rate("8000") == 8000
+
+    @pytest.mark.parametrize("value", ["fast", 0, -16000, 44101, True, [16000]])
+    def test_rejects_anything_else(self, value):
+        with pytest.raises(ValueError):
+            parse_sample_rate(value)
@@ -0,0 +1,92 @@
+import pytest
+import os
+import subprocess
+import sys
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from ..core.voice.backends import get_stt_backend
+from ..core.voice.ctranslate2_backend import CTranslate2Backend
+
+def fake_segment(i: int, text: str, avg_logprob: float = -0.1):
+    return SimpleNamespace(
+        id=i, start=i * 2.0, end=i * 2.0 + 2.0, text=text, tokens=[1, 2],
+        temperature=0.0, avg_logprob=avg_logprob, compression_ratio=1.2, no_speech_prob=0.01
+    )
+
+@pytest.fixture
+def faster_whisper():
+    model = MagicMock()
+    model.transcribe.side_effect = lambda audio, **kwargs: (
+        iter([fake_segment(0, " Turn on"), fake_segment(1, " the lights.")]),
+        SimpleNamespace(language="en")
+    )
+    module = MagicMock()
+    module.WhisperModel.return_value = model
+    with patch.dict("sys.modules", {"faster_whisper": module}):
+        yield module
+
+class TestBackendRegistry:
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_stt_backend("kaldi")
+
+    def test_instances_are_shared(self):
+        assert get_stt_backend("ctranslate2") is get_stt_backend("ctranslate2")
+
+class TestCTranslate2Backend:
+    @pytest.mark.asyncio
+    async def test_transcribe_matches_whisper_contract(self, faster_whisper):
+        backend = CTranslate2Backend()
+
+        result = await backend.transcribe(np.zeros(32000, dtype=np.float32), model_name="base", language="en")
+
+        assert result["text"] == "Turn on the lights."
+        assert result["language"] == "en"
+        assert [s["id"] for s in result["segments"]] == [0, 1]
+        assert result["segments"][0]["confidence"] == pytest.approx(np.exp(-0.1))
+        assert result["segments"][0]["no_speech_prob"] == 0.01
+
+    @pytest.mark.asyncio
+    async def test_models_load_once(self, faster_whisper):
+        backend = CTranslate2Backend()
+        await backend.init(["base"])
+        await backend.transcribe(np.zeros(16000, dtype=np.float32), model_name="base")
+
+        faster_whisper.WhisperModel.assert_called_once()
+        assert faster_whisper.WhisperModel.call_args.args == ("base",)
+
+    @pytest.mark.asyncio
+    async def test_missing_runtime_is_reported(self):
+        backend = CTranslate2Backend()
+        with patch.dict("sys.modules", {"faster_whisper": None}):
+            with pytest.raises(RuntimeError, match="faster-whisper"):
+                await backend.transcribe(np.zeros(16000, dtype=np.float32))
+
+    @pytest.mark.asyncio
+    async def test_profile_sets_decoding_options(self, faster_whisper):
+        backend = CTranslate2Backend()
+        audio = np.zeros(16000, dtype=np.float32)
+
+        await backend.transcribe(audio, model_name="base", profile="command")
+        command = faster_whisper.WhisperModel.return_value.transcribe.call_args.kwargs
+        await backend.transcribe(audio, model_name="base", profile="dictation")
+        dictation = faster_whisper.WhisperModel.return_value.transcribe.call_args.kwargs
+
+        assert command["beam_size"] == 1
+        assert command["temperature"] == [0.0]
+        assert command["condition_on_previous_text"] is False
+        assert command["max_new_tokens"] is not None
+        assert dictation["beam_size"] == 5
+        assert len(dictation["temperature"]) > 1
+        assert dictation["max_new_tokens"] is None
+
+def test_ctranslate2_backend_does_not_load_whisper():
+    package = __name__.split(".")[0]
+    code = (
+        f"import sys, {package}.core.voice.ctranslate2_backend; "
+        "print(sorted(m for m in ('whisper', 'safetensors') if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,71 @@
+import os
+import pytest
+import fakeredis.aioredis
+from types import SimpleNamespace
+from ..services.tts_cache import ENTRIES_KEY, TTSAudioCache
+
+@pytest.fixture
+def audio_cache(tmp_path):
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return TTSAudioCache(directory=str(tmp_path), max_bytes=10, cache=SimpleNamespace(client=redis))
+
+async def store(cache: TTSAudioCache, key: str, audio: bytes):
+    temp_path = cache.temp_path(key)
+    with open(temp_path, "wb") as f:
+        f.write(audio)
+    await cache.commit(key, temp_path)
+
+class TestTTSAudioCache:
+    def test_key_ignores_spacing_but_not_voice_or_speed(self):
+        key = TTSAudioCache.key("Lights  turned off.", "jennifer", 1.0, "FORMAT_WAV", 24000)
+        assert key == TTSAudioCache.key(" Lights turned off. ", "jennifer", 1.0, "FORMAT_WAV", 24000)
+        assert key != TTSAudioCache.key("Lights turned off.", "adrian", 1.0, "FORMAT_WAV", 24000)
+        assert key != TTSAudioCache.key("Lights turned off.", "jennifer", 1.25, "FORMAT_WAV", 24000)
+        assert key != TTSAudioCache.key("Lights turned off.", "jennifer", 1.0, "FORMAT_MP3", 24000)
+
+    @pytest.mark.asyncio
+    async def test_committed_audio_is_a_hit(self, audio_cache):
+        assert await audio_cache.open("done") is None
+        await store(audio_cache, "done", b"RIFF")
+
+        f = await audio_cache.open("done")
+        assert b"".join(audio_cache.read(f)) == b"RIFF"
+        assert f.closed
+
+    @pytest.mark.asyncio
+    async def test_opened_audio_survives_eviction(self, audio_cache):
+        await store(audio_cache, "first", b"123456")
+        f = await audio_cache.open("first")
+        await store(audio_cache, "second", b"1234567")  # Another replica evicts "first"
+
+        assert not os.path.exists(audio_cache.path("first"))
+        assert b"".join(audio_cache.read(f)) == b"123456"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, audio_cache):
+        await store(audio_cache, "first", b"123456")
+        await store(audio_cache, "second", b"123")
+        (await audio_cache.open("first")).close()  # Now "second" is the oldest
+        await store(audio_cache, "third", b"1234")
+
+        assert await audio_cache.open("second") is None
+        assert not os.path.exists(audio_cache.path("second"))
+        for key in ("first", "third"):
+            f = await audio_cache.open(key)
+            assert f is not None
+            f.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_dropped_from_index(self, audio_cache):
+        await store(audio_cache, "done", b"RIFF")
+        os.unlink(audio_cache.path("done"))
+
+        assert await audio_cache.open("done") is None
+        assert await audio_cache.cache.client.hget(ENTRIES_KEY, "done") is None
+
+    def test_discarded_synthesis_leaves_nothing(self, audio_cache):
+        temp_path = audio_cache.temp_path("partial")
+        open(temp_path, "wb").close()
+        audio_cache.discard(temp_path)
+        audio_cache.discard(temp_path)
+        assert os.listdir(os.path.dirname(temp_path)) == []
@@ -0,0 +1,39 @@
+import os
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from ..api.v1.endpoints.tts import OpenFileResponse
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio"
+    path.write_bytes(b"RIFF" + b"\0" * 100_000)
+    return str(path)
+
+class TestOpenFileResponse:
+    def test_streams_a_file_evicted_after_opening(self, audio_file):
+        f = open(audio_file, "rb")
+        os.unlink(audio_file)  # Another replica evicts the entry
+        app = FastAPI()
+        app.get("/audio")(lambda: OpenFileResponse(f, "audio/wav"))
+
+        response = TestClient(app).get("/audio")
+
+        assert response.content == b"RIFF" + b"\0" * 100_000
+        assert response.headers["content-length"] == "100004"
+        assert f.closed
+
+    @pytest.mark.asyncio
+    async def test_uses_zero_copy_send_when_offered(self, audio_file):
+        f = open(audio_file, "rb")
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "extensions": {"http.response.zerocopysend": {}}}
+        await OpenFileResponse(f, "audio/wav")(scope, None, send)
+
+        assert sent[1]["type"] == "http.response.zerocopysend"
+        assert sent[1]["file"] is f and sent[1]["count"] == 100_004
+        assert f.closed
@@ -0,0 +1,59 @@
+import pytest
+import shutil
+import struct
+from ..services.tts_output import OutputFormat, UnsupportedOutputFormat, default_output, encode, negotiate_output
+
+async def wav_chunks(seconds: float = 1.0, sample_rate: int = 24000, size: int = 4096):
+    samples = bytes(int(seconds * sample_rate) * 2)
+    fmt = struct.pack("<HHIIHH", 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    data = (
+        b"RIFF" + struct.pack("<I", 36 + len(samples)) + b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"data" + struct.pack("<I", len(samples)) + samples
+    )
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+class TestNegotiateOutput:
+    def test_defaults_to_configured_format(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.TTS_OUTPUT_FORMAT', "FORMAT_MP3")
+        monkeypatch.setattr('app.config.settings.TTS_SAMPLE_RATE', 44100)
+        assert default_output() == OutputFormat("mp3", 44100)
+        assert negotiate_output() == OutputFormat("mp3", 44100)
+
+    def test_explicit_format_wins_over_accept(self):
+        assert negotiate_output("pcm", 16000, accept="audio/mpeg").codec == "pcm"
+
+    def test_accept_header_preference(self):
+        assert negotiate_output(accept="audio/wav;q=0.5, audio/ogg; codecs=opus").codec == "opus"
+        assert negotiate_output(accept="audio/ogg;q=0.2, audio/mpeg;q=0.8").codec == "mp3"
+        assert negotiate_output(accept="audio/mpeg;q=0, audio/wav").codec == "wav"
+
+    def test_sample_rate_falls_back_to_one_the_codec_supports(self, monkeypatch):
+        monkeypatch.setattr('app.config.settings.TTS_SAMPLE_RATE', 44100)
+        assert negotiate_output("opus") == OutputFormat("opus", 24000)
+        assert negotiate_output("wav") == OutputFormat("wav", 44100)
+
+    def test_rejects_unsupported_requests(self):
+        with pytest.raises(UnsupportedOutputFormat):
+            negotiate_output("aac")
+        with pytest.raises(UnsupportedOutputFormat):
+            negotiate_output("opus", 44100)
+
+    def test_media_types(self):
+        assert OutputFormat("opus", 24000).media_type == "audio/ogg; codecs=opus"
+        assert OutputFormat("pcm", 16000).media_type == "audio/pcm;rate=16000"
+        assert OutputFormat("mp3", 24000).media_type == "audio/mpeg"
+
+class TestEncode:
+    @pytest.mark.asyncio
+    async def test_pcm_drops_the_wav_header(self):
+        pcm = b"".join([chunk async for chunk in encode(wav_chunks(0.1), OutputFormat("pcm", 24000))])
+        assert pcm == bytes(4800)
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    async def test_opus_is_far_smaller_than_pcm(self):
+        opus = b"".join([chunk async for chunk in encode(wav_chunks(2.0), OutputFormat("opus", 24000))])
+        assert opus[:4] == b"OggS"
+        assert len(opus) < 96000 / 5
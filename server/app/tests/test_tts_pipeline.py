@@ -0,0 +1,111 @@
+import pytest
+import asyncio
+import struct
+from ..services.tts_pipeline import join_wav, split_sentences, synthesize_in_order
+
+def wav(samples: bytes) -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 1, 24000, 48000, 2, 16)
+    return (
+        b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(samples)) + b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"data" + struct.pack("<I", len(samples)) + samples
+    )
+
+async def chunks_of(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+class TestSplitSentences:
+    def test_splits_after_sentence_punctuation(self):
+        text = "The lights are off. It is 21 degrees outside! Anything else?"
+        assert split_sentences(text) == ["The lights are off.", "It is 21 degrees outside!", "Anything else?"]
+
+    def test_joins_short_fragments_to_the_next_sentence(self):
+        text = "Dr. Smith called at 3.30 today. OK. Your meeting moved to Friday."
+        assert split_sentences(text, min_chars=20) == [
+            "Dr. Smith called at 3.30 today.",
+            "OK. Your meeting moved to Friday."
+        ]
+
+    def test_short_tail_joins_the_previous_sentence(self):
+        assert split_sentences("Your meeting moved to Friday. Done.", min_chars=20) == [
+            "Your meeting moved to Friday. Done."
+        ]
+
+class TestSynthesizeInOrder:
+    @pytest.mark.asyncio
+    async def test_streams_in_order_within_the_window(self):
+        running, peak = 0, 0
+        delays = [0.05, 0.01, 0.03, 0.0, 0.02]
+
+        async def synthesize(index, sentence):
+            async def audio():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(delays[index])
+                yield sentence.encode()
+                running -= 1
+            return audio()
+
+        sentences = [f"<{i}>" for i in range(5)]
+        result = await collect(synthesize_in_order(sentences, synthesize, window=2))
+        assert result == b"<0><1><2><3><4>"
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_first_sentence_plays_while_the_rest_synthesize(self):
+        release = asyncio.Event()
+
+        async def synthesize(index, sentence):
+            async def audio():
+                if index > 0:
+                    await release.wait()
+                yield sentence.encode()
+            return audio()
+
+        stream = synthesize_in_order(["first", "second"], synthesize, window=2)
+        assert await asyncio.wait_for(stream.__anext__(), timeout=0.5) == b"first"
+        release.set()
+        assert await collect(stream) == b"second"
+
+    @pytest.mark.asyncio
+    async def test_failure_surfaces_in_turn_and_cancels_the_rest(self):
+        cancelled = []
+
+        async def synthesize(index, sentence):
+            async def audio():
+                if index == 1:
+                    raise ConnectionError("provider dropped")
+                try:
+                    await asyncio.sleep(0.01 if index == 0 else 10)
+                    yield sentence.encode()
+                except asyncio.CancelledError:
+                    cancelled.append(index)
+                    raise
+            return audio()
+
+        stream = synthesize_in_order(["a", "b", "c"], synthesize, window=3)
+        assert await stream.__anext__() == b"a"
+        with pytest.raises(ConnectionError):
+            await stream.__anext__()
+        assert cancelled == [2]
+
+class TestJoinWav:
+    @pytest.mark.asyncio
+    async def test_joined_sentences_form_one_stream(self):
+        first = await collect(join_wav(chunks_of(wav(b"\x01\x00\x02\x00")), first=True))
+        second = await collect(join_wav(chunks_of(wav(b"\x03\x00")), first=False))
+
+        assert first[:4] == b"RIFF" and first[8:12] == b"WAVE"
+        assert first[4:8] == b"\xff\xff\xff\xff"
+        assert first[-8:] == b"\xff\xff\xff\xff\x01\x00\x02\x00"
+        assert second == b"\x03\x00"
+
+    @pytest.mark.asyncio
+    async def test_other_formats_pass_through(self):
+        mp3 = b"\xff\xfb\x90\x00" + bytes(40)
+        assert await collect(join_wav(chunks_of(mp3), first=False)) == mp3
@@ -1,8 +1,16 @@
 import pytest
+import asyncio
+import threading
 from ..services.tts_service import TTSService
+from ..services.tts_cache import TTSAudioCache
+from ..services.tts_output import OutputFormat
+from pyht.client import Format
+from types import SimpleNamespace
+import fakeredis.aioredis
 from unittest.mock import patch, Mock
 import json
 import os
+import struct
 
 @pytest.fixture
 def mock_voice_file(tmp_path):
@@ -33,3 +41,72 @@ async def test_text_to_speech_success(tts_service):
     with patch('pyht.Client.tts', return_value=[b"test audio"]):
         async for chunk in tts_service.text_to_speech("test"):
             assert isinstance(chunk, bytes)
+
+@pytest.mark.asyncio
+async def test_text_to_speech_streams_before_synthesis_finishes(mock_voice_file, monkeypatch):
+    monkeypatch.setattr('app.config.settings.VOICE_CONFIG_PATH', mock_voice_file)
+    service = TTSService(test_mode=True)
+    finish = threading.Event()
+
+    def provider(text, options, **kwargs):
+        yield b"first"
+        finish.wait(1)  # The provider is still synthesizing the rest
+        yield b"second"
+
+    service.client.tts.side_effect = provider
+    stream = service.text_to_speech("test")
+    assert await asyncio.wait_for(stream.__anext__(), timeout=0.5) == b"first"
+    finish.set()
+    assert [chunk async for chunk in stream] == [b"second"]
+
+@pytest.mark.asyncio
+async def test_repeated_text_is_served_from_cache(mock_voice_file, monkeypatch, tmp_path):
+    monkeypatch.setattr('app.config.settings.VOICE_CONFIG_PATH', mock_voice_file)
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    audio_cache = TTSAudioCache(directory=str(tmp_path), cache=SimpleNamespace(client=redis))
+    service = TTSService(test_mode=True, audio_cache=audio_cache)
+    service.client.tts.side_effect = lambda text, options, **kwargs: iter([b"RIFF", b"data"])
+
+    first = await service.synthesize("Lights turned off.")
+    assert first.file is None
+    assert b"".join([chunk async for chunk in first.chunks]) == b"RIFFdata"
+
+    second = await service.synthesize("Lights  turned off.")
+    assert second.file is not None
+    assert b"".join([chunk async for chunk in second.chunks]) == b"RIFFdata"
+    assert service.client.tts.call_count == 1
+
+@pytest.mark.asyncio
+async def test_long_response_is_synthesized_per_sentence(mock_voice_file, monkeypatch):
+    monkeypatch.setattr('app.config.settings.VOICE_CONFIG_PATH', mock_voice_file)
+    monkeypatch.setattr('app.config.settings.TTS_CACHE_ENABLED', False)
+    monkeypatch.setattr('app.config.settings.TTS_OUTPUT_FORMAT', "FORMAT_MP3")
+    service = TTSService(test_mode=True)
+    service.client.tts.side_effect = lambda text, options, **kwargs: iter([text.encode()])
+
+    text = "The lights in the kitchen are off. The front door is locked for the night."
+    chunks = [chunk async for chunk in service.text_to_speech(text)]
+
+    assert chunks == [b"The lights in the kitchen are off.", b"The front door is locked for the night."]
+    assert service.client.tts.call_count == 2
+
+@pytest.mark.asyncio
+async def test_pcm_output_is_synthesized_as_wav_and_stripped(mock_voice_file, monkeypatch):
+    monkeypatch.setattr('app.config.settings.VOICE_CONFIG_PATH', mock_voice_file)
+    monkeypatch.setattr('app.config.settings.TTS_CACHE_ENABLED', False)
+    service = TTSService(test_mode=True)
+    requested = []
+
+    def provider(text, options, **kwargs):
+        requested.append((options.format, options.sample_rate))
+        fmt = struct.pack("<HHIIHH", 1, 1, options.sample_rate, options.sample_rate * 2, 2, 16)
+        header = b"RIFF" + struct.pack("<I", 36 + len(text)) + b"WAVEfmt " + struct.pack("<I", 16) + fmt
+        return iter([header, b"data" + struct.pack("<I", len(text)), text.encode()])
+
+    service.client.tts.side_effect = provider
+    text = "The lights in the kitchen are off. The front door is locked for the night."
+    audio = await service.speak(text, output=OutputFormat("pcm", 16000))
+
+    assert audio.media_type == "audio/pcm;rate=16000"
+    assert b"".join([chunk async for chunk in audio.chunks]) == b"The lights in the kitchen are off.The front door is locked for the night."
+    assert requested == [(Format.FORMAT_WAV, 16000)] * 2
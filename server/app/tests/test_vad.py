@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+from ..core.voice.vad import VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+
+def tone(seconds: float, amplitude: float = 0.8) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 200 * t) * amplitude).astype(np.float32)
+
+def silence(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.001).astype(np.float32)
+
+def speech(seconds: float, level: float = 0.2, dip: float = 0.0) -> np.ndarray:
+    """Harmonics under a syllable-rate envelope that falls to ``dip`` between syllables"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = dip + (1 - dip) * np.abs(np.sin(3 * np.pi * t))
+    voice = sum(np.sin(2 * np.pi * f * t) / k for k, f in enumerate((150, 300, 450, 900), 1))
+    voice /= np.sqrt(np.mean(np.square(voice)))
+    return (voice * envelope * level).astype(np.float32)
+
+def hiss(seconds: float, rms: float, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * rms).astype(np.float32)
+
+@pytest.fixture
+def vad():
+    return VoiceActivityDetector(SAMPLE_RATE, max_pause_ms=300, padding_ms=0)
+
+class TestVoiceActivityDetector:
+    def test_trims_leading_and_trailing_silence(self, vad):
+        audio = np.concatenate([silence(1.0), tone(1.0), silence(1.0)])
+        compacted, metadata = vad.compact(audio)
+
+        assert abs(len(compacted) / SAMPLE_RATE - 1.0) < 0.1
+        assert metadata["original_duration"] == pytest.approx(3.0)
+        assert metadata["speech_ratio"] == pytest.approx(1 / 3, abs=0.05)
+
+    def test_collapses_long_internal_pauses(self, vad):
+        audio = np.concatenate([tone(0.5), silence(2.0), tone(0.5)])
+        compacted, metadata = vad.compact(audio)
+
+        assert metadata["compacted_duration"] == pytest.approx(1.3, abs=0.1)
+
+    def test_keeps_short_pauses(self, vad):
+        audio = np.concatenate([tone(0.5), silence(0.2), tone(0.5)])
+        compacted, _ = vad.compact(audio)
+        assert len(compacted) == pytest.approx(len(audio), abs=vad.frame_length * 2)
+
+    def test_silence_only_is_left_untouched(self, vad):
+        audio = silence(1.0)
+        compacted, metadata = vad.compact(audio)
+        assert compacted is audio
+        assert metadata["speech_ratio"] == 0.0
+
+    def test_trims_mic_hiss_around_speech(self, vad):
+        voice = speech(2.0)
+        noise = np.sqrt(np.mean(np.square(voice))) * 10 ** (-34 / 20)  # 34 dB SNR
+        audio = np.concatenate([hiss(1.0, noise), voice + hiss(2.0, noise, seed=2), hiss(1.0, noise, seed=3)])
+        compacted, metadata = vad.compact(audio)
+
+        assert metadata["compacted_duration"] == pytest.approx(2.0, abs=0.1)
+        assert metadata["speech_ratio"] == pytest.approx(0.5, abs=0.05)
+
+    def test_keeps_soft_speech_in_a_tightly_cropped_clip(self):
+        vad = VoiceActivityDetector(SAMPLE_RATE, max_pause_ms=300, padding_ms=150)
+        audio = np.concatenate([hiss(0.1, 0.0005), speech(5.0, level=0.05, dip=0.1), hiss(0.1, 0.0005, seed=2)])
+        compacted, metadata = vad.compact(audio)
+
+        assert len(compacted) == len(audio)
+        assert metadata["speech_ratio"] > 0.9
+
+    def test_steady_tone_is_all_speech(self, vad):
+        compacted, metadata = vad.compact(tone(1.0, amplitude=0.5))
+        assert metadata["speech_ratio"] == 1.0
@@ -2,6 +2,8 @@ import pytest
 from fastapi import UploadFile
 import io
 import asyncio
+import threading
+import time
 from unittest.mock import AsyncMock, Mock, patch
 from ..services.voice_processor import VoiceProcessor
 
@@ -59,3 +61,77 @@ async def test_interrupt_processing(voice_processor):
     success = await voice_processor.interrupt_processing(task_id)
     assert success
     assert task.cancelled()
+
+@pytest.mark.asyncio
+async def test_new_utterance_barges_in_on_previous(voice_processor):
+    started = asyncio.Event()
+    seen_tokens = []
+
+    async def slow_stt(audio_data, user_id=None):
+        from ..core.cancellation import current_token
+        seen_tokens.append(current_token())
+        started.set()
+        await asyncio.sleep(10)
+
+    with patch.object(voice_processor.stt_service, "speech_to_text", side_effect=slow_stt):
+        first = asyncio.create_task(voice_processor.process_audio(
+            UploadFile(filename="a.wav", file=io.BytesIO(b"first")), user_id=1
+        ))
+        await started.wait()
+
+        with patch.object(voice_processor.stt_service, "speech_to_text", AsyncMock(return_value={
+            "text": "lights off", "confidence": 0.9, "language": "en", "segments": []
+        })), patch.object(voice_processor.ai_service, "analyze_text", AsyncMock(return_value={})):
+            result = await voice_processor.process_audio(
+                UploadFile(filename="b.wav", file=io.BytesIO(b"second")), user_id=1
+            )
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert seen_tokens[0].cancelled
+    assert result["stats"]["status"] == "completed"
+    assert voice_processor.active_by_user == {}
+
+@pytest.mark.asyncio
+async def test_barge_in_stops_analysis(voice_processor):
+    from ..core.cancellation import check_cancelled
+    from ..services.azure_ai import ModelType
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def slow_completion(**kwargs):
+        started.set()
+        deadline = time.monotonic() + 5
+        try:
+            while time.monotonic() < deadline:
+                check_cancelled()
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+
+    voice_processor.ai_service.clients[ModelType.GPT4O_MINI.value] = Mock(complete=slow_completion)
+    with patch.object(voice_processor.stt_service, "speech_to_text", AsyncMock(return_value={
+        "text": "lights on", "confidence": 0.9, "language": "en", "segments": []
+    })):
+        first = asyncio.create_task(voice_processor.process_audio(
+            UploadFile(filename="a.wav", file=io.BytesIO(b"first")), user_id=1
+        ))
+        assert await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        with patch.object(voice_processor.ai_service, "analyze_text", AsyncMock(return_value={})):
+            result = await voice_processor.process_audio(
+                UploadFile(filename="b.wav", file=io.BytesIO(b"second")), user_id=1
+            )
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert stopped.is_set()
+    assert result["stats"]["status"] == "completed"
+
+@pytest.mark.asyncio
+async def test_cancelled_analysis_is_not_reported_as_empty(voice_processor):
+    from ..core.cancellation import CancellationToken, OperationCancelled
+    token = CancellationToken()
+    token.cancel("interrupted")
+    with pytest.raises(OperationCancelled):
+        await voice_processor.ai_service.analyze_text("lights on", token=token)
@@ -3,6 +3,7 @@ from ..core.voice_registry import VoiceRegistry, Voice
 import json
 import tempfile
 import os
+from unittest.mock import patch
 
 @pytest.fixture
 def mock_voice_data():
@@ -34,3 +35,63 @@ class TestVoiceRegistry:
         voice = voice_registry.get_default_voice()
         assert voice is not None
         assert voice.language_code == "en-US"
+
+    def test_nothing_is_read_until_first_use(self, voice_registry):
+        assert voice_registry._voices is None
+        assert not os.path.exists(voice_registry.snapshot_path)
+        voice_registry.get_voice("test_voice")
+        assert os.path.exists(voice_registry.snapshot_path)
+
+    def test_default_voice_is_memoized(self, voice_registry):
+        with patch.object(voice_registry, 'list_voices', wraps=voice_registry.list_voices) as list_voices:
+            assert voice_registry.get_default_voice() is voice_registry.get_default_voice()
+        list_voices.assert_called_once()
+
+@pytest.fixture
+def catalogue(tmp_path, mock_voice_data):
+    voices = [
+        mock_voice_data,
+        {**mock_voice_data, "id": "uk_male", "language_code": "en-GB", "gender": "male"},
+        {**mock_voice_data, "id": "us_male", "gender": "male", "style": "videos"},
+        {**mock_voice_data, "id": "us_male_v1", "gender": "male", "voice_engine": "PlayHT1.0"}
+    ]
+    file_path = tmp_path / "voices.json"
+    file_path.write_text(json.dumps(voices))
+    return str(file_path)
+
+class TestVoiceIndexes:
+    def test_filters_combine_in_catalogue_order(self, catalogue):
+        registry = VoiceRegistry(catalogue)
+        ids = lambda voices: [voice.id for voice in voices]
+
+        assert ids(registry.list_voices()) == ["test_voice", "uk_male", "us_male", "us_male_v1"]
+        assert ids(registry.list_voices(gender="male")) == ["uk_male", "us_male", "us_male_v1"]
+        assert ids(registry.list_voices(language="en-US", gender="male")) == ["us_male", "us_male_v1"]
+        assert ids(registry.list_voices(gender="male", engine="PlayHT2.0", style="narrative")) == ["uk_male"]
+        assert registry.list_voices(language="fr-FR") == []
+
+class TestVoiceSnapshot:
+    def test_snapshot_skips_parsing(self, catalogue):
+        compiled = VoiceRegistry(catalogue)
+        compiled.ensure_loaded()
+
+        with patch('app.core.voice_registry.json.loads') as loads:
+            registry = VoiceRegistry(catalogue).ensure_loaded()
+        loads.assert_not_called()
+        assert registry.etag == compiled.etag
+        assert registry.voices == compiled.voices
+        assert [voice.id for voice in registry.list_voices(gender="male", language="en-GB")] == ["uk_male"]
+
+    def test_edited_catalogue_invalidates_snapshot(self, catalogue, mock_voice_data):
+        registry = VoiceRegistry(catalogue).ensure_loaded()
+        with open(catalogue, 'w') as f:
+            json.dump([{**mock_voice_data, "id": "only_voice"}], f)
+
+        reloaded = VoiceRegistry(catalogue).ensure_loaded()
+        assert list(reloaded.voices) == ["only_voice"]
+        assert reloaded.etag != registry.etag
+
+    def test_unreadable_snapshot_falls_back_to_catalogue(self, catalogue):
+        with open(f"{catalogue}.snapshot", 'wb') as f:
+            f.write(b"not a snapshot")
+        assert len(VoiceRegistry(catalogue).voices) == 4
@@ -120,8 +120,10 @@ class TestSTTService:
             "segments": [{"confidence": 0.95}]
         }
         
-        with patch.object(voice_services["stt"].model, 'transcribe', 
-                         return_value=mock_result):
+        with patch('app.services.stt_service.decode_audio',
+                   return_value=np.zeros(16000, dtype=np.float32)), \
+             patch.object(voice_services["stt"].batcher, 'transcribe',
+                          new_callable=AsyncMock, return_value=mock_result):
             result = await voice_services["stt"].speech_to_text(b"test_audio")
             assert result["text"] == "test transcription"
             assert result["confidence"] > 0.9
@@ -0,0 +1,60 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from ..api.v1.endpoints import websocket
+from ..core.command.processor import CommandProcessor
+from ..core.deadline import remaining_budget
+from ..core.security import get_current_user_ws
+from ..dependencies import get_command_processor
+
+class BudgetRecordingAI:
+    def __init__(self):
+        self.budgets = []
+
+    async def process_request(self, request_data, request_type):
+        self.budgets.append(remaining_budget())
+        return {"processed_text": request_data["text"], "confidence": 0.5, "response": "ok"}
+
+@pytest.fixture
+def ai():
+    return BudgetRecordingAI()
+
+@pytest.fixture
+def client(ai):
+    processor = CommandProcessor(ai_client=ai)
+    processor._get_user_context = AsyncMock(return_value={})
+    app = FastAPI()
+    app.include_router(websocket.router)
+    app.dependency_overrides[get_current_user_ws] = lambda: {"sub": "7"}
+    app.dependency_overrides[get_command_processor] = lambda: processor
+    return TestClient(app)
+
+def test_command_runs_within_its_budget(client, ai):
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"text": "lights off", "budget_ms": 5000})
+        response = ws.receive_json()
+    assert response["processed_text"] == "lights off"
+    assert 0 < ai.budgets[0] <= 5.0
+
+def test_command_without_budget_has_no_deadline(client, ai):
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"text": "lights off"})
+        ws.receive_json()
+    assert ai.budgets == [None]
+
+def test_budget_too_short_for_the_ai_is_rejected(client, ai):
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"text": "lights off", "budget_ms": 100})
+        response = ws.receive_json()
+    assert response["status"] == "deadline_exceeded"
+    assert ai.budgets == []
+
+def test_bad_stream_sample_rate_is_reported_not_fatal(client, ai):
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"type": "stream_start", "sample_rate": "fast"})
+        error = ws.receive_json()
+        ws.send_json({"text": "lights off"})
+        response = ws.receive_json()
+    assert error["status"] == "error" and "sample rate" in error["error"]
+    assert response["processed_text"] == "lights off"
@@ -0,0 +1,50 @@
+import os
+import torch
+from unittest.mock import patch
+from whisper.model import ModelDimensions, Whisper
+from ..core.voice import weights
+
+# Toy dimensions, saved under a name with no alignment heads in Whisper
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=4, n_audio_state=8, n_audio_head=2, n_audio_layer=1,
+    n_vocab=16, n_text_ctx=4, n_text_state=8, n_text_head=2, n_text_layer=2
+)
+
+class TestWeightCache:
+    def test_converts_once_then_maps(self, tmp_path):
+        original = Whisper(DIMS)
+        with patch('app.core.voice.weights.whisper.load_model', return_value=original) as mock_load:
+            first = weights.load_mapped_model("toy", str(tmp_path))
+            mapped = weights.load_mapped_model("toy", str(tmp_path))
+
+        assert mock_load.call_count == 1
+        assert os.path.exists(weights.cache_path("toy", str(tmp_path)))
+
+        tokens = torch.zeros(1, 2, dtype=torch.long)
+        mel = torch.randn(1, 80, 8)
+        expected = original.state_dict()
+        for model in (first, mapped):  # The first load is mapped too, not the converted copy
+            assert model is not original
+            assert model.dims == DIMS
+            for key, tensor in model.state_dict().items():
+                assert torch.equal(tensor, expected[key])
+            assert torch.equal(model.decoder.mask, original.decoder.mask)
+            assert torch.equal(model.alignment_heads.to_dense(), original.alignment_heads.to_dense())
+            assert torch.allclose(model(mel, tokens), original(mel, tokens))
+
+    def test_unwritable_cache_falls_back_to_the_loaded_model(self, tmp_path):
+        original = Whisper(DIMS)
+        with patch('app.core.voice.weights.whisper.load_model', return_value=original), \
+             patch('app.core.voice.weights.save_file', side_effect=OSError("read-only")):
+            assert weights.load_mapped_model("toy", str(tmp_path)) is original
+
+    def test_unreadable_cache_is_rebuilt(self, tmp_path):
+        path = weights.cache_path("toy", str(tmp_path))
+        with open(path, "wb") as f:
+            f.write(b"not safetensors")
+
+        with patch('app.core.voice.weights.whisper.load_model', return_value=Whisper(DIMS)) as mock_load:
+            weights.load_mapped_model("toy", str(tmp_path))
+            weights.load_mapped_model("toy", str(tmp_path))
+
+        assert mock_load.call_count == 1
@@ -0,0 +1,25 @@
+"""Gunicorn settings for the multi-worker (pre-fork) deployment.
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+With ``PREFORK_PRELOAD`` the master imports the app and loads Whisper and
+the voice catalogue once; each Uvicorn worker inherits them copy-on-write
+instead of loading its own copy, and gets an equal share of the cores.
+"""
+from app.config import settings
+
+bind = "0.0.0.0:8000"
+workers = settings.WEB_CONCURRENCY
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = settings.PREFORK_PRELOAD
+timeout = 120
+graceful_timeout = 30
+
+def on_starting(server):
+    if preload_app:
+        from app.core.prefork import preload
+        preload()
+
+def post_fork(server, worker):
+    from app.core.prefork import configure_worker
+    configure_worker(workers)
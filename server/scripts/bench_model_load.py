@@ -0,0 +1,72 @@
+"""Compare Whisper startup time: unpickled checkpoint vs memory-mapped cache.
+
+Each load runs in a fresh interpreter, as a new pod or worker would. The
+``mapped`` time is what ``WHISPER_MMAP_WEIGHTS`` startup costs; ``first
+decode`` shows how much of the mapping cost is merely deferred to the first
+request, when the weight pages are faulted in. The page cache is warm after
+the first run, which is the case for a restarted or co-located process.
+
+    python -m scripts.bench_model_load --models tiny base small --repeat 3
+"""
+import argparse
+import multiprocessing
+import resource
+import statistics
+import time
+
+from app.config import settings
+
+LOADERS = ["checkpoint", "mapped"]
+
+def measure(loader: str, name: str, results):
+    import torch
+    import whisper
+    from app.core.voice.weights import load_mapped_model
+
+    start = time.perf_counter()
+    if loader == "mapped":
+        model = load_mapped_model(name, settings.WHISPER_MODEL_DIR)
+    else:
+        model = whisper.load_model(name, device="cpu", download_root=settings.WHISPER_MODEL_DIR)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with torch.no_grad():
+        whisper.decode(model, whisper.log_mel_spectrogram(torch.zeros(whisper.audio.N_SAMPLES)), whisper.DecodingOptions(fp16=False))
+    decode_seconds = time.perf_counter() - start
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((load_seconds, decode_seconds, max_rss_mb))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", nargs="+", default=[settings.WHISPER_MODEL])
+    parser.add_argument("--loaders", nargs="+", default=LOADERS, choices=LOADERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    for name in args.models:
+        # Download the checkpoint and write the cache outside the timed runs
+        results = ctx.Queue()
+        warm = ctx.Process(target=measure, args=("mapped", name, results))
+        warm.start()
+        results.get()
+        warm.join()
+
+        for loader in args.loaders:
+            runs = []
+            for _ in range(args.repeat):
+                results = ctx.Queue()
+                proc = ctx.Process(target=measure, args=(loader, name, results))
+                proc.start()
+                runs.append(results.get())
+                proc.join()
+
+            load, decode, rss = zip(*runs)
+            print(f"{name:>10} {loader:>10}: load={statistics.median(load) * 1000:8.1f}ms  "
+                  f"first decode={statistics.median(decode) * 1000:8.1f}ms  "
+                  f"max RSS={statistics.median(rss):7.1f}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Compare memory and throughput of pre-forked vs independently loaded workers.
+
+``independent`` forks N workers that each load Whisper themselves (what N
+separate Uvicorn processes do); ``prefork`` loads it once in the parent and
+forks N workers that inherit it, as ``gunicorn.conf.py`` does. Every worker
+transcribes the whole corpus at the same time with its share of the cores.
+
+Memory is PSS (shared pages split between the processes mapping them) and
+USS (pages private to one process) from /proc, so Linux only.
+
+    python -m scripts.bench_prefork path/to/corpus --workers 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.config import settings
+from app.core.media import SAMPLE_RATE
+from app.core.prefork import configure_worker, preload
+from app.core.voice.backends import get_stt_backend
+from app.core.voice.model_pool import model_pool
+from scripts.bench_stt_backends import load_corpus
+
+MODES = ["independent", "prefork"]
+
+def memory_mb(pid: int) -> Dict[str, float]:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "pss": fields.get("Pss", 0.0),
+        "uss": fields.get("Private_Clean", 0.0) + fields.get("Private_Dirty", 0.0)
+    }
+
+async def transcribe_all(clips: List[np.ndarray], model: str, language: str):
+    backend = get_stt_backend("whisper")
+    for clip in clips:
+        await backend.transcribe(clip, model_name=model, language=language)
+
+def worker(mode, workers, clips, model, language, ready, done, results):
+    if mode == "independent":
+        model_pool.preload([model])
+    configure_worker(workers)
+    asyncio.run(transcribe_all(clips[:1], model, language))  # Warm-up
+
+    ready.wait()
+    start = time.perf_counter()
+    asyncio.run(transcribe_all(clips, model, language))
+    results.put(time.perf_counter() - start)
+    done.wait()  # Stay alive until the parent has read our memory
+
+def bench(mode: str, workers: int, clips: List[np.ndarray], model: str, language: str):
+    ctx = multiprocessing.get_context("fork")
+    ready, done = ctx.Barrier(workers + 1), ctx.Barrier(workers + 1)
+    results = ctx.Queue()
+
+    load_start = time.perf_counter()
+    if mode == "prefork":
+        preload([model])
+    procs = [
+        ctx.Process(target=worker, args=(mode, workers, clips, model, language, ready, done, results))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    ready.wait()
+    load_seconds = time.perf_counter() - load_start
+
+    elapsed = [results.get() for _ in procs]
+    pids = [os.getpid()] + [proc.pid for proc in procs]
+    usage = [memory_mb(pid) for pid in pids]
+    done.wait()
+    for proc in procs:
+        proc.join()
+
+    audio_seconds = workers * sum(len(c) for c in clips) / SAMPLE_RATE
+    print(f"{mode:>12}: startup={load_seconds:6.2f}s  "
+          f"PSS total={sum(u['pss'] for u in usage):8.1f}MB  "
+          f"USS/worker={np.mean([u['uss'] for u in usage[1:]]):7.1f}MB  "
+          f"throughput={audio_seconds / max(elapsed):6.2f} audio s/s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", help="Directory of WAV files")
+    parser.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY)
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--model", default=settings.WHISPER_MODEL)
+    parser.add_argument("--language", default=settings.WHISPER_LANGUAGE)
+    args = parser.parse_args()
+
+    clips = load_corpus(args.corpus)
+    if not clips:
+        parser.error(f"No WAV files found in {args.corpus}")
+    total = sum(len(c) for c in clips) / SAMPLE_RATE
+    print(f"{len(clips)} clips, {total:.1f}s of audio, model={args.model}, {args.workers} workers")
+
+    # Each mode in a fresh process so the parent's loaded models do not leak into the next
+    ctx = multiprocessing.get_context("fork")
+    for mode in args.modes:
+        proc = ctx.Process(target=bench, args=(mode, args.workers, clips, args.model, args.language))
+        proc.start()
+        proc.join()
+
+if __name__ == "__main__":
+    main()
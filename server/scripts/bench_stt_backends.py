@@ -0,0 +1,79 @@
+"""Compare real-time factor across STT backends on a WAV corpus.
+
+RTF is processing time divided by audio duration (lower is better). Each
+backend is measured clip-by-clip and again with ``--concurrency`` clips in
+flight, which is how the API server drives it.
+
+    python -m scripts.bench_stt_backends path/to/corpus --backends whisper ctranslate2
+"""
+import argparse
+import asyncio
+import glob
+import os
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from app.config import settings
+from app.core.media import SAMPLE_RATE, decode_audio
+from app.core.voice.backends import BACKENDS, get_stt_backend
+
+def load_corpus(corpus_dir: str) -> List[np.ndarray]:
+    clips = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.wav"))):
+        with open(path, "rb") as f:
+            clips.append(decode_audio(f.read()))
+    return clips
+
+async def bench(name: str, clips: List[np.ndarray], model: str, language: str, concurrency: int):
+    backend = get_stt_backend(name)
+
+    load_start = time.perf_counter()
+    await backend.init([model])
+    load_seconds = time.perf_counter() - load_start
+    await backend.transcribe(clips[0], model_name=model, language=language)  # Warm-up
+
+    audio_seconds = sum(len(c) for c in clips) / SAMPLE_RATE
+    per_clip = []
+    for clip in clips:
+        start = time.perf_counter()
+        await backend.transcribe(clip, model_name=model, language=language)
+        per_clip.append((time.perf_counter() - start) / (len(clip) / SAMPLE_RATE))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(clip: np.ndarray):
+        async with semaphore:
+            await backend.transcribe(clip, model_name=model, language=language)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(clip) for clip in clips))
+    concurrent_rtf = (time.perf_counter() - start) / audio_seconds
+
+    await backend.close()
+    print(f"{name:>12}: load={load_seconds:6.2f}s  "
+          f"RTF p50={statistics.median(per_clip):.3f}  max={max(per_clip):.3f}  "
+          f"x{concurrency} RTF={concurrent_rtf:.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", help="Directory of WAV files")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--model", default=settings.WHISPER_MODEL)
+    parser.add_argument("--language", default=settings.WHISPER_LANGUAGE)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    clips = load_corpus(args.corpus)
+    if not clips:
+        parser.error(f"No WAV files found in {args.corpus}")
+    total = sum(len(c) for c in clips) / SAMPLE_RATE
+    print(f"{len(clips)} clips, {total:.1f}s of audio, model={args.model}")
+
+    for name in args.backends:
+        asyncio.run(bench(name, clips, args.model, args.language, args.concurrency))
+
+if __name__ == "__main__":
+    main()
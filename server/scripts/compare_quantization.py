@@ -0,0 +1,115 @@
+"""Compare fp32 and int8 dynamic-quantized Whisper on a fixed WAV corpus.
+
+Every ``*.wav`` in the corpus directory is transcribed by both variants.
+When a sibling ``*.txt`` holds the reference transcript, word error rate is
+reported against it; otherwise the fp32 output is used as the reference.
+
+    python -m scripts.compare_quantization path/to/corpus --model base
+"""
+import argparse
+import glob
+import os
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import torch
+import whisper
+
+from app.config import settings
+from app.core.media import decode_audio
+from app.core.voice.quantization import load_quantized_model
+
+def normalize(text: str) -> List[str]:
+    return "".join(c if c.isalnum() or c.isspace() else " " for c in text.lower()).split()
+
+def word_errors(reference: List[str], hypothesis: List[str]) -> int:
+    """Levenshtein distance over words"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1]
+
+def load_corpus(corpus_dir: str) -> List[Dict]:
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.wav"))):
+        reference: Optional[str] = None
+        txt_path = os.path.splitext(path)[0] + ".txt"
+        if os.path.exists(txt_path):
+            with open(txt_path) as f:
+                reference = f.read().strip()
+        with open(path, "rb") as f:
+            corpus.append({"name": os.path.basename(path), "audio": decode_audio(f.read()), "reference": reference})
+    return corpus
+
+def transcribe_all(model, corpus: List[Dict], language: str) -> Dict[str, Dict]:
+    # Warm-up so one-off allocation does not skew the first clip
+    model.transcribe(corpus[0]["audio"], language=language, fp16=False)
+
+    results = {}
+    for clip in corpus:
+        start = time.perf_counter()
+        text = model.transcribe(clip["audio"], language=language, fp16=False)["text"]
+        results[clip["name"]] = {"text": text, "seconds": time.perf_counter() - start}
+    return results
+
+def state_size_mb(model) -> float:
+    total = 0
+    for tensor in model.state_dict().values():
+        if isinstance(tensor, torch.Tensor):
+            total += tensor.numel() * tensor.element_size()
+        elif isinstance(tensor, tuple):
+            # Packed linear params unpack to (weight, bias)
+            total += sum(t.numel() * t.element_size() for t in tensor if isinstance(t, torch.Tensor))
+    return total / 2 ** 20
+
+def report(name: str, results: Dict[str, Dict], corpus: List[Dict], baseline: Dict[str, Dict], size_mb: float):
+    errors = words = 0
+    for clip in corpus:
+        reference = normalize(clip["reference"] or baseline[clip["name"]]["text"])
+        errors += word_errors(reference, normalize(results[clip["name"]]["text"]))
+        words += len(reference)
+
+    latencies = sorted(r["seconds"] for r in results.values())
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    audio_seconds = sum(len(c["audio"]) for c in corpus) / 16000
+    print(f"{name:>5}: WER={errors / max(words, 1):6.2%}  "
+          f"p50={statistics.median(latencies) * 1000:7.1f}ms  p95={p95 * 1000:7.1f}ms  "
+          f"RTF={sum(latencies) / audio_seconds:5.3f}  weights={size_mb:7.1f}MB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", help="Directory of WAV files with optional .txt references")
+    parser.add_argument("--model", default=settings.WHISPER_MODEL)
+    parser.add_argument("--language", default=settings.WHISPER_LANGUAGE)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        parser.error(f"No WAV files found in {args.corpus}")
+    print(f"{len(corpus)} clips, model={args.model}, threads={torch.get_num_threads()}")
+
+    fp32 = whisper.load_model(args.model, device="cpu", download_root=settings.WHISPER_MODEL_DIR).eval()
+    fp32_results = transcribe_all(fp32, corpus, args.language)
+    report("fp32", fp32_results, corpus, fp32_results, state_size_mb(fp32))
+    del fp32
+
+    load_start = time.perf_counter()
+    int8 = load_quantized_model(args.model, "int8", settings.WHISPER_MODEL_DIR)
+    print(f"int8 load: {time.perf_counter() - load_start:.2f}s (re-run to measure a cached load)")
+    int8_results = transcribe_all(int8, corpus, args.language)
+    report("int8", int8_results, corpus, fp32_results, state_size_mb(int8))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Compile the voice catalogue into the snapshot the server loads at startup.
+
+The server compiles it on first use anyway; running this at image build
+time means no replica pays for parsing and validating the JSON.
+
+    python -m scripts.compile_voices
+"""
+import time
+
+from app.config import settings
+from app.core.voice_registry import VoiceRegistry
+
+def main():
+    registry = VoiceRegistry(settings.VOICE_CONFIG_PATH, settings.VOICE_SNAPSHOT_PATH)
+    start = time.perf_counter()
+    registry.load_voices(registry.file_path)
+    print(f"Compiled {len(registry.voices)} voices into {registry.snapshot_path} "
+          f"in {(time.perf_counter() - start) * 1000:.1f}ms (etag {registry.etag})")
+
+if __name__ == "__main__":
+    main()